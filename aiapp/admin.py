@@ -1,3 +1,58 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.utils import timezone
 
-# No models to register
\ No newline at end of file
+from aiapp import llm_cache
+from aiapp.models import GenerationJob, LLMCacheEntry, Report, Skill
+
+
+@admin.register(LLMCacheEntry)
+class LLMCacheEntryAdmin(admin.ModelAdmin):
+    list_display = ("company", "role1", "role2", "model", "hits", "created", "expires_at")
+    list_filter = ("model",)
+    search_fields = ("company", "role1", "role2")
+    readonly_fields = ("key", "created")
+    actions = ["invalidate_entries"]
+
+    @admin.action(description="Invalidate selected cache entries")
+    def invalidate_entries(self, request, queryset):
+        deleted = llm_cache.invalidate(queryset.values_list("key", flat=True))
+        self.message_user(request, f"{deleted} cache entries invalidated", messages.SUCCESS)
+
+    def changelist_view(self, request, extra_context=None):
+        stats = ", ".join(f"{k}={v}" for k, v in llm_cache.stats.items())
+        self.message_user(request, f"This worker: {stats}", messages.INFO)
+        return super().changelist_view(request, extra_context)
+
+
+@admin.register(GenerationJob)
+class GenerationJobAdmin(admin.ModelAdmin):
+    list_display = ("company", "role1", "role2", "status", "attempts", "created", "updated")
+    list_filter = ("status",)
+    search_fields = ("company", "role1", "role2")
+    readonly_fields = ("id", "created", "updated", "locked_by")
+    actions = ["requeue_jobs"]
+
+    @admin.action(description="Requeue selected jobs")
+    def requeue_jobs(self, request, queryset):
+        count = queryset.exclude(status=GenerationJob.DONE).update(
+            status=GenerationJob.QUEUED,
+            attempts=0,
+            available_at=timezone.now(),
+            error="",
+        )
+        self.message_user(request, f"{count} jobs requeued", messages.SUCCESS)
+
+
+@admin.register(Report)
+class ReportAdmin(admin.ModelAdmin):
+    list_display = ("company", "role1", "role2", "kind", "created")
+    list_filter = ("kind",)
+    search_fields = ("company", "role1", "role2")
+    readonly_fields = ("content_hash", "created")
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ("name", "category", "updated")
+    list_filter = ("category",)
+    search_fields = ("name", "aliases")
@@ -0,0 +1,216 @@
+import asyncio
+import atexit
+import csv
+import io
+import json
+import multiprocessing
+import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from aiapp.roadmap import build_roadmap_report
+
+# Batch roadmap generation for a school roster. Rows are grouped into
+# chunks and spread over spawned worker processes; results are yielded as
+# chunks finish, with a bounded number in flight so memory stays flat no
+# matter how long the roster is. Like aiapp/pdf.py, nothing here may import
+# Django at module level.
+
+FIELDS = ("student", "class", "company", "role")
+
+HEADER_ALIASES = {
+    "student": "student",
+    "name": "student",
+    "student name": "student",
+    "class": "class",
+    "studentclass": "class",
+    "grade": "class",
+    "company": "company",
+    "target company": "company",
+    "role": "role",
+    "jobrole": "role",
+    "target role": "role",
+}
+
+CSV_COLUMNS = ("row", "student", "class", "company", "role", "estimatedTime", "roadmap", "academicGaps", "error")
+
+
+# -------------------- INPUT --------------------
+def read_rows(lines):
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+
+    columns = [HEADER_ALIASES.get(h.strip().lower()) for h in header]
+    missing = [f for f in FIELDS if f not in columns]
+    if missing:
+        raise ValueError(f"CSV is missing columns: {', '.join(missing)}")
+
+    for number, values in enumerate(reader, start=1):
+        if not any(v.strip() for v in values):
+            continue
+        row = {c: v.strip() for c, v in zip(columns, values) if c}
+        yield {"row": number, **{f: row.get(f, "") for f in FIELDS}}
+
+
+# -------------------- WORK --------------------
+def build_student(row, with_pdf=False):
+    result = dict(row)
+    data = None
+    try:
+        report = build_roadmap_report(row["company"], row["role"], row["class"])
+        result["report"] = report
+        if with_pdf:
+            from aiapp import pdf  # ReportLab only for rosters that want PDFs
+
+            data = pdf.render("roadmap", report)
+    except Exception as e:
+        result["error"] = str(e)
+    return result, data
+
+
+def build_chunk(rows, with_pdf=False):
+    return [build_student(row, with_pdf) for row in rows]
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _pool(workers):
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+# Uploads in a web process share one pool, created by the first upload and
+# shut down at exit, instead of spawning interpreters per request
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_pool(workers):
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = _pool(workers)
+            atexit.register(_shared.shutdown, wait=False, cancel_futures=True)
+        return _shared
+
+
+def _discard(pool):
+    # A crashed worker breaks the whole pool: the next upload starts a new one
+    global _shared
+    with _shared_lock:
+        if _shared is pool:
+            _shared = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run(rows, workers=2, chunk_size=100, with_pdf=False):
+    # Yields (result, pdf_bytes) in completion order
+    chunks = _chunks(rows, chunk_size)
+
+    if workers <= 0:
+        for chunk in chunks:
+            yield from build_chunk(chunk, with_pdf)
+        return
+
+    pool = _pool(workers)
+    try:
+        pending = set()
+        for chunk in chunks:
+            pending.add(pool.submit(build_chunk, chunk, with_pdf))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        for future in pending:
+            yield from future.result()
+    finally:
+        # Also reached when the caller stops early: queued chunks are dropped
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def arun(rows, workers=2, chunk_size=100, with_pdf=False):
+    loop = asyncio.get_running_loop()
+    chunks = _chunks(rows, chunk_size)
+
+    if workers <= 0:
+        for chunk in chunks:
+            for item in await loop.run_in_executor(None, build_chunk, chunk, with_pdf):
+                yield item
+        return
+
+    # Submitting may spawn a worker process, which blocks: keep it (and
+    # creating the pool) off the event loop
+    pool = await asyncio.to_thread(shared_pool, workers)
+    pending = set()
+    try:
+        for chunk in chunks:
+            submitted = await asyncio.to_thread(pool.submit, build_chunk, chunk, with_pdf)
+            pending.add(asyncio.wrap_future(submitted))
+            if len(pending) >= workers * 2:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    for item in future.result():
+                        yield item
+        for future in asyncio.as_completed(pending):
+            for item in await future:
+                yield item
+    except BrokenProcessPool:
+        await asyncio.to_thread(_discard, pool)
+        raise
+    finally:
+        # Client went away: chunks that have not started are dropped
+        for future in pending:
+            future.cancel()
+
+
+# -------------------- OUTPUT --------------------
+def to_ndjson(result):
+    return json.dumps(result, separators=(",", ":")) + "\n"
+
+
+def csv_header():
+    return _csv_line(CSV_COLUMNS)
+
+
+def to_csv(result):
+    report = result.get("report") or {}
+    roadmap = " | ".join(
+        f"{year['class']}: {'; '.join(year['skills'])}" for year in report.get("roadmap", [])
+    )
+    gaps = "; ".join(g["name"] for g in report.get("academicGaps", []))
+    return _csv_line([
+        result.get("row", ""),
+        result.get("student", ""),
+        result.get("class", ""),
+        result.get("company", ""),
+        result.get("role", ""),
+        report.get("estimatedTime", ""),
+        roadmap,
+        gaps,
+        result.get("error", ""),
+    ])
+
+
+def _csv_line(values):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def pdf_name(result):
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", result.get("student") or "").strip("-")
+    return f"{result.get('row', 0):05d}-{slug or 'student'}.pdf"
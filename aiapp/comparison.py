@@ -0,0 +1,420 @@
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections
+
+from aiapp import llm, llm_cache, resilience, singleflight, skills
+from aiapp.jsonstream import SectionParser, load_json_object
+from aiapp.roadmap import generate_academic_gaps, generate_dynamic_roadmap
+from aiapp.timing import stage
+
+
+# -------------------- HELPERS --------------------
+def normalize_list(items):
+    normalized = []
+    for it in items:
+        if isinstance(it, dict):
+            normalized.append({
+                "name": it.get("name", ""),
+                "description": it.get("description", ""),
+                "level": it.get("level", "")
+            })
+        else:
+            normalized.append({
+                "name": str(it),
+                "description": "",
+                "level": ""
+            })
+    return normalized
+
+
+# -------------------- AI PROMPTS --------------------
+# One prompt per role plus one for the transition between them. The calls
+# run concurrently and each answer is cached on its own, so comparing A
+# against B, C and D asks about A once. commonSkills / role1Only /
+# role2Only are set arithmetic and are computed here, not by the model.
+PROMPT_CONTEXT = """
+Return ONLY valid JSON. No markdown. No extra text.
+
+Context:
+This system bridges secondary school education and industry expectations.
+Focus on practical, curriculum-aware skills (Indian education context).
+"""
+
+ROLE_PROMPT_TEMPLATE = PROMPT_CONTEXT + """
+Use short, standard skill names (example: "Python", "SQL", "Git").
+
+JSON FORMAT:
+{{
+  "skills": [
+    {{"name": "skill", "description": "short explanation", "level": "Beginner|Intermediate|Advanced"}}
+  ],
+  "schoolGaps": [
+    {{"name": "gap", "description": "why school education misses this"}}
+  ]
+}}
+
+Company: {company}
+Role: {role}
+"""
+
+TRANSITION_PROMPT_TEMPLATE = PROMPT_CONTEXT + """
+JSON FORMAT:
+{{
+  "bridgeModules": [
+    {{"name": "module", "description": "how this bridges the primary role to the comparison role"}}
+  ],
+  "estimatedTime": "example: 5–6 months",
+  "transitionAdvice": "short guidance paragraph"
+}}
+
+Company: {company}
+Primary Role: {role1}
+Comparison Role: {role2}
+"""
+
+# Changes to a template must invalidate its cached answers
+ROLE_PROMPT_VERSION = hashlib.sha256(ROLE_PROMPT_TEMPLATE.encode()).hexdigest()[:16]
+TRANSITION_PROMPT_VERSION = hashlib.sha256(TRANSITION_PROMPT_TEMPLATE.encode()).hexdigest()[:16]
+
+ROLE_KEYS = ("skills", "schoolGaps")
+TRANSITION_KEYS = ("bridgeModules", "estimatedTime", "transitionAdvice")
+
+# Report keys that come from the model or the merge (the rest comes from the form)
+SECTION_KEYS = (
+    "role1Skills", "role2Skills", "commonSkills", "role1Only", "role2Only",
+    "schoolGaps", "bridgeModules", "estimatedTime", "transitionAdvice",
+)
+
+
+def build_role_prompt(company, role):
+    return ROLE_PROMPT_TEMPLATE.format(company=company, role=role)
+
+
+def build_transition_prompt(company, role1, role2):
+    return TRANSITION_PROMPT_TEMPLATE.format(company=company, role1=role1, role2=role2)
+
+
+LIST_SECTIONS = (
+    "skills", "role1Skills", "role2Skills", "commonSkills", "role1Only", "role2Only",
+    "schoolGaps", "bridgeModules",
+)
+
+SECTION_DEFAULTS = {
+    "estimatedTime": "Not specified",
+    "transitionAdvice": "",
+}
+
+
+def normalize_section(key, value):
+    if key in LIST_SECTIONS:
+        return normalize_list(value or [])
+    return value
+
+
+def parse_sections(ai_raw, keys):
+    # Single pass: skips fences and prose, tolerates braces after the object
+    with stage("json"):
+        parsed = load_json_object(ai_raw)
+    return build_sections(parsed, keys)
+
+
+def build_sections(parsed, keys):
+    # A dict without any of the asked-for keys (e.g. one skill object) is
+    # not an answer and must not be cached as an empty one
+    if not isinstance(parsed, dict) or not any(key in parsed for key in keys):
+        raise ValueError("Invalid AI response format")
+
+    with stage("normalize"):
+        return {
+            key: normalize_section(key, parsed.get(key, SECTION_DEFAULTS.get(key, [])))
+            for key in keys
+        }
+
+
+def merge_sections(part1, part2, transition):
+    with stage("merge"):
+        common, only1, only2 = skills.compare(part1["skills"], part2["skills"])
+        return {
+            "role1Skills": part1["skills"],
+            "role2Skills": part2["skills"],
+            "commonSkills": common,
+            "role1Only": only1,
+            "role2Only": only2,
+            "schoolGaps": skills.union(part1["schoolGaps"], part2["schoolGaps"]),
+            **transition,
+        }
+
+
+def build_output(sections, company, role1, role2):
+    return {
+        "company": company,
+        "role1": role1,
+        "role2": role2,
+        **sections,
+    }
+
+
+# -------------------- FALLBACK --------------------
+# Used when the LLM is unavailable (circuit open, deadline spent). Built from
+# the same rule-based tracks as the roadmap report, so it is instant and the
+# same roles always give the same answer. Never written to the LLM cache.
+FALLBACK_CLASS = 8
+FALLBACK_LEVELS = ("Beginner", "Beginner", "Intermediate", "Intermediate", "Advanced")
+
+FALLBACK_ADVICE = (
+    "AI guidance is temporarily unavailable, so this comparison comes from our "
+    "standard learning tracks. Try again in a few minutes for a tailored report."
+)
+
+
+def _track_skills(role):
+    found = {}
+    for year, level in zip(generate_dynamic_roadmap(FALLBACK_CLASS, role), FALLBACK_LEVELS):
+        for name in year["skills"]:
+            found.setdefault(name, level)
+    return found
+
+
+def fallback_role(role):
+    return {
+        "skills": [
+            {"name": name, "description": f"Step on the {role} track", "level": level}
+            for name, level in _track_skills(role).items()
+        ],
+        "schoolGaps": normalize_list(generate_academic_gaps(role)),
+    }
+
+
+def fallback_transition(role1, role2):
+    known = _track_skills(role1)
+    new = [(n, level) for n, level in _track_skills(role2).items() if n not in known]
+    return {
+        "bridgeModules": [
+            {"name": n, "description": f"Bridges {role1} to {role2}", "level": level}
+            for n, level in new[:3]
+        ],
+        "estimatedTime": "3-6 months" if new else "1-2 months",
+        "transitionAdvice": FALLBACK_ADVICE,
+    }
+
+
+# -------------------- PARTS --------------------
+# Each part is (cache key, prompt, keys, cache meta, fallback)
+def role_key(company, role):
+    return llm_cache.make_key("role", company, role, llm.GROQ_MODEL, ROLE_PROMPT_VERSION)
+
+
+def transition_key(company, role1, role2):
+    return llm_cache.make_key("transition", company, role1, role2, llm.GROQ_MODEL, TRANSITION_PROMPT_VERSION)
+
+
+def build_parts(company, role1, role2):
+    return (
+        (
+            role_key(company, role1),
+            build_role_prompt(company, role1),
+            ROLE_KEYS,
+            {"company": company, "role1": role1},
+            lambda: fallback_role(role1),
+        ),
+        (
+            role_key(company, role2),
+            build_role_prompt(company, role2),
+            ROLE_KEYS,
+            {"company": company, "role1": role2},
+            lambda: fallback_role(role2),
+        ),
+        (
+            transition_key(company, role1, role2),
+            build_transition_prompt(company, role1, role2),
+            TRANSITION_KEYS,
+            {"company": company, "role1": role1, "role2": role2},
+            lambda: fallback_transition(role1, role2),
+        ),
+    )
+
+
+def fetch_part(key, prompt, keys, meta):
+    with stage("llm"):
+        ai_raw = resilience.call(prompt)
+    sections = parse_sections(ai_raw, keys)
+    if "skills" in sections:
+        with stage("canonicalize"):
+            sections["skills"] = skills.canonicalize(sections["skills"])
+    llm_cache.set(key, sections, model=llm.GROQ_MODEL, **meta)
+    return sections
+
+
+async def afetch_part(key, prompt, keys, meta):
+    with stage("llm"):
+        ai_raw = await resilience.acall(prompt)
+    return await _asave_part(key, parse_sections(ai_raw, keys), meta)
+
+
+async def astream_part(key, prompt, keys, meta, emit):
+    # afetch_part over a token stream: emit(name, value) is awaited as soon
+    # as the model has finished a section, or one more item of a list
+    parser = SectionParser()
+    with stage("llm"):
+        async for delta in resilience.astream(prompt):
+            for name, value in parser.feed(delta):
+                if name in keys:
+                    await emit(name, await _aprepare(name, value))
+    return await _asave_part(key, build_sections(parser.close(), keys), meta)
+
+
+async def _aprepare(name, value):
+    value = normalize_section(name, value)
+    if name == "skills":
+        value = await skills.acanonicalize(value)
+    return value
+
+
+async def _asave_part(key, sections, meta):
+    if "skills" in sections:
+        with stage("canonicalize"):
+            sections["skills"] = await skills.acanonicalize(sections["skills"])
+    await llm_cache.aset(key, sections, model=llm.GROQ_MODEL, **meta)
+    return sections
+
+
+# Returns (sections, used_fallback)
+def get_part(key, prompt, keys, meta, fallback):
+    sections = llm_cache.get(key)
+    if sections is not None:
+        return sections, False
+    try:
+        # A class submitting the same role shares one upstream call
+        return singleflight.do(
+            key,
+            lambda: fetch_part(key, prompt, keys, meta),
+            lambda: llm_cache.peek(key),
+        ), False
+    except resilience.LLMUnavailable:
+        return fallback(), True
+
+
+async def aget_part(key, prompt, keys, meta, fallback, emit=None):
+    # With emit the answer is streamed (astream_part); callers that join an
+    # identical call already in flight only get the finished sections
+    sections = await llm_cache.aget(key)
+    if sections is not None:
+        return sections, False
+    try:
+        return await singleflight.ado(
+            key,
+            lambda: (
+                afetch_part(key, prompt, keys, meta) if emit is None
+                else astream_part(key, prompt, keys, meta, emit)
+            ),
+            lambda: llm_cache.apeek(key),
+        ), False
+    except resilience.LLMUnavailable:
+        return fallback(), True
+
+
+def _combine(results, company, role1, role2):
+    (part1, fb1), (part2, fb2), (transition, fb3) = results
+    output = build_output(merge_sections(part1, part2, transition), company, role1, role2)
+    if fb1 or fb2 or fb3:
+        output["fallback"] = True
+    return output
+
+
+# -------------------- GENERATION --------------------
+async def acached_comparison(company, role1, role2):
+    found = []
+    for key, *_ in build_parts(company, role1, role2):
+        sections = await llm_cache.aget(key)
+        if sections is None:
+            return None
+        found.append((sections, False))
+    return _combine(found, company, role1, role2)
+
+
+# Sync callers (job workers) fan out on threads
+_fanout = ThreadPoolExecutor(max_workers=llm.LLM_POOL_SIZE, thread_name_prefix="llm-fanout")
+
+
+def _get_part_in_thread(*part):
+    try:
+        return get_part(*part)
+    finally:
+        close_old_connections()
+
+
+def generate_comparison(company, role1, role2):
+    parts = build_parts(company, role1, role2)
+    futures = [_fanout.submit(_get_part_in_thread, *part) for part in parts]
+    return _combine([f.result() for f in futures], company, role1, role2)
+
+
+async def agenerate_comparison(company, role1, role2):
+    parts = build_parts(company, role1, role2)
+    results = await asyncio.gather(*(aget_part(*part) for part in parts))
+    return _combine(results, company, role1, role2)
+
+
+async def astream_comparison(company, role1, role2):
+    # Yields ("section", {...}) while the model writes each part (a list
+    # section again each time it grows by an item), the finished sections of
+    # each part as it completes, cached parts first, and finally
+    # ("done", output)
+    parts = build_parts(company, role1, role2)
+    queue = asyncio.Queue()
+
+    async def run(index, part):
+        async def emit(name, value):
+            queue.put_nowait((index, name, value))
+
+        try:
+            queue.put_nowait((index, None, await aget_part(*part, emit=emit)))
+        except Exception as e:
+            queue.put_nowait((index, None, e))
+
+    tasks = [asyncio.ensure_future(run(i, part)) for i, part in enumerate(parts)]
+    results = [None] * len(parts)
+    try:
+        while any(result is None for result in results):
+            index, name, value = await queue.get()
+            if isinstance(value, Exception):
+                raise value
+
+            if name is not None:
+                # Role school gaps are only shown merged, once both are in
+                page_name = STREAM_NAMES.get((index, name), name if index == 2 else None)
+                if page_name:
+                    yield "section", {"name": page_name, "value": value}
+                continue
+
+            results[index] = value
+            sections = {}
+
+            if index == 0:
+                sections["role1Skills"] = value[0]["skills"]
+            elif index == 1:
+                sections["role2Skills"] = value[0]["skills"]
+            else:
+                sections.update(value[0])
+
+            if index < 2 and results[0] and results[1]:
+                merged = merge_sections(results[0][0], results[1][0], {})
+                sections.update({k: merged[k] for k in ("commonSkills", "role1Only", "role2Only", "schoolGaps")})
+
+            for page_name, section in sections.items():
+                yield "section", {"name": page_name, "value": section}
+    finally:
+        # Client went away: stop waiting on the remaining calls
+        for task in tasks:
+            task.cancel()
+
+    yield "done", _combine(results, company, role1, role2)
+
+
+# (part index, part key) -> report section, for sections sent mid-stream
+STREAM_NAMES = {
+    (0, "skills"): "role1Skills",
+    (1, "skills"): "role2Skills",
+}
@@ -0,0 +1,14 @@
+from django.conf import settings
+
+# Stored reports never change, so index.html caches its report sections
+# ({% cache %}) under the report's content hash. Pages showing a report that
+# was not stored get a TTL of 0, which caches nothing.
+
+
+def report_cache(request):
+    report = getattr(request, "_report", None)
+    key = getattr(report, "content_hash", None)
+    return {
+        "report_key": key,
+        "fragment_ttl": getattr(settings, "FRAGMENT_CACHE_TTL", 86400) if key else 0,
+    }
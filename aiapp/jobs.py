@@ -0,0 +1,177 @@
+import logging
+import os
+import random
+import socket
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.db.models import F, Q
+from django.utils import timezone
+
+from aiapp import ratelimit
+from aiapp.comparison import generate_comparison
+from aiapp.models import GenerationJob
+
+logger = logging.getLogger(__name__)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def worker_name(index=0):
+    return f"{socket.gethostname()}:{os.getpid()}:{index}"
+
+
+# -------------------- PRODUCER --------------------
+def enqueue(company, role1, role2, session_key=""):
+    return GenerationJob.objects.create(
+        company=company or "",
+        role1=role1 or "",
+        role2=role2 or "",
+        session_key=session_key or "",
+        max_attempts=_setting("JOB_MAX_ATTEMPTS", 3),
+    )
+
+
+async def aenqueue(company, role1, role2, session_key=""):
+    return await GenerationJob.objects.acreate(
+        company=company or "",
+        role1=role1 or "",
+        role2=role2 or "",
+        session_key=session_key or "",
+        max_attempts=_setting("JOB_MAX_ATTEMPTS", 3),
+    )
+
+
+# -------------------- CONSUMER --------------------
+def claim(worker, visibility_timeout=None):
+    # Queued jobs that are due, plus running jobs whose worker went silent
+    # past the visibility timeout. The conditional UPDATE is the lock: only
+    # one worker can move available_at into the future.
+    now = timezone.now()
+    timeout = visibility_timeout or _setting("JOB_VISIBILITY_TIMEOUT", 60)
+    dead_letter_expired(now)
+    due = (
+        Q(status=GenerationJob.QUEUED) | Q(status=GenerationJob.RUNNING)
+    ) & Q(attempts__lt=F("max_attempts"))
+
+    candidates = (
+        GenerationJob.objects.filter(due, available_at__lte=now)
+        .order_by("available_at")
+        .values_list("pk", flat=True)[:10]
+    )
+    for pk in candidates:
+        claimed = GenerationJob.objects.filter(due, pk=pk, available_at__lte=now).update(
+            status=GenerationJob.RUNNING,
+            locked_by=worker,
+            available_at=now + timedelta(seconds=timeout),
+            attempts=F("attempts") + 1,
+            updated=now,
+        )
+        if claimed:
+            return GenerationJob.objects.get(pk=pk)
+    return None
+
+
+def dead_letter_expired(now):
+    # A worker that dies on its last attempt never calls fail(): once the
+    # visibility timeout passes, such a job is dead rather than retried
+    return GenerationJob.objects.filter(
+        status=GenerationJob.RUNNING,
+        available_at__lte=now,
+        attempts__gte=F("max_attempts"),
+    ).update(
+        status=GenerationJob.DEAD,
+        error="Worker timed out on the last attempt",
+        updated=now,
+    )
+
+
+def complete(job, output):
+    GenerationJob.objects.filter(pk=job.pk, locked_by=job.locked_by).update(
+        status=GenerationJob.DONE,
+        result=output,
+        error="",
+        updated=timezone.now(),
+    )
+
+
+def fail(job, error):
+    now = timezone.now()
+    if job.attempts >= job.max_attempts:
+        status, available_at = GenerationJob.DEAD, now
+    else:
+        # Exponential backoff with jitter so retries do not arrive in waves
+        delay = _setting("JOB_RETRY_DELAY", 5) * 2 ** (job.attempts - 1)
+        status, available_at = GenerationJob.QUEUED, now + timedelta(seconds=delay * random.uniform(1, 1.5))
+
+    GenerationJob.objects.filter(pk=job.pk, locked_by=job.locked_by).update(
+        status=status,
+        available_at=available_at,
+        error=str(error),
+        updated=now,
+    )
+
+
+def defer(job, delay):
+    # Back to the queue without spending the attempt claim() counted
+    now = timezone.now()
+    GenerationJob.objects.filter(pk=job.pk, locked_by=job.locked_by).update(
+        status=GenerationJob.QUEUED,
+        available_at=now + timedelta(seconds=delay),
+        attempts=F("attempts") - 1,
+        updated=now,
+    )
+
+
+def run(job):
+    # Jobs share the generation slots with the web workers, so the queue
+    # cannot push more generations upstream than LLM_MAX_INFLIGHT
+    try:
+        with ratelimit.Slot():
+            output = generate_comparison(job.company, job.role1, job.role2)
+    except ratelimit.Throttled as e:
+        defer(job, e.retry_after)
+    except Exception as e:
+        logger.warning("Job %s attempt %s failed: %s", job.pk, job.attempts, e)
+        fail(job, e)
+    else:
+        if output.get("fallback"):
+            # Standard tracks are for a visitor who is waiting on the page;
+            # a queued job can wait for the LLM instead
+            fail(job, "AI guidance is unavailable")
+        else:
+            complete(job, output)
+
+
+def work(worker, stop, poll_interval=1.0, visibility_timeout=None, once=False):
+    try:
+        while not stop.is_set():
+            close_old_connections()
+            job = claim(worker, visibility_timeout)
+            if job is None:
+                if once:
+                    return
+                stop.wait(poll_interval)
+                continue
+            run(job)
+    finally:
+        connection.close()
+
+
+def start_threads(count, stop, **options):
+    threads = []
+    for index in range(count):
+        thread = threading.Thread(
+            target=work,
+            args=(worker_name(index), stop),
+            kwargs=options,
+            name=f"job-worker-{index}",
+            daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+    return threads
@@ -0,0 +1,281 @@
+import json
+import re
+
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_STRING_REST = re.compile(r'["\\]')
+
+# Whole string literals (so braces inside them are skipped) or a bracket
+_TOKENS = re.compile(_STRING + r'|[{}\[\]"]')
+
+
+# -------------------- ONE-SHOT --------------------
+# Finds the JSON object in model output that may wrap it in prose or
+# markdown fences. The C decoder does the string/escape tracking:
+# raw_decode parses from a "{" and stops at its matching "}", ignoring
+# whatever prose follows. Only a candidate that fails to parse is walked by
+# the tokenizer, to skip past it to the next top-level "{". One that never
+# balances (e.g. a stray quote in prose) is skipped up to where it stopped
+# being JSON, so an object after it is still found but none inside it; if
+# no "{" follows that point the output was cut off and nothing is returned.
+
+_decoder = json.JSONDecoder()
+
+
+def _skip_object(text, start):
+    depth = 0
+    for match in _TOKENS.finditer(text, start):
+        ch = match.group()
+        if ch[0] == '"':
+            if len(ch) == 1:
+                return -1
+        elif ch in "{[":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return -1
+
+
+def _find_object(text):
+    start = text.find("{") if text else -1
+    while start != -1:
+        try:
+            value, end = _decoder.raw_decode(text, start)
+            return value, text[start:end]
+        except json.JSONDecodeError as e:
+            # Truncated output (e.g. the model hit its token limit): the
+            # objects nested in it are not the answer
+            if text.find("{", e.pos) == -1:
+                break
+            end = _skip_object(text, start)
+            if end == -1:
+                end = e.pos
+            start = text.find("{", end)
+    return None, None
+
+
+def load_json_object(text):
+    return _find_object(text)[0]
+
+
+def extract_json(text):
+    return _find_object(text)[1]
+
+
+# -------------------- INCREMENTAL --------------------
+# For output that arrives in chunks (llm.astream_completion). Each chunk is
+# scanned once: outside an object we jump to the next "{", inside one the
+# string regex skips whole literals at C speed, so braces or commas inside
+# strings never reach the depth count. A string cut off at a chunk boundary
+# is finished character-class by character-class.
+class _Scanner:
+    tokens = _TOKENS
+
+    def __init__(self):
+        self.chunks = []
+        self.offset = 0        # absolute position of chunks[0]
+        self.position = 0      # absolute position of the next unread char
+        self.depth = 0
+        self.in_string = False
+        self.skip_next = False
+        self.finished = False
+
+    def feed(self, chunk):
+        if self.finished or not chunk:
+            return
+        base = self.position
+        self.chunks.append(chunk)
+        self.position += len(chunk)
+
+        pos = 0
+        end = len(chunk)
+        if self.skip_next:
+            self.skip_next = False
+            pos = 1
+
+        while pos < end and not self.finished:
+            if self.in_string:
+                match = _STRING_REST.search(chunk, pos)
+                if match is None:
+                    break
+                idx = match.start()
+                if match.group() == "\\":
+                    if idx + 1 >= end:
+                        self.skip_next = True
+                    pos = idx + 2
+                else:
+                    self.in_string = False
+                    pos = idx + 1
+                continue
+
+            if self.depth == 0:
+                # Prose before the object: quotes and brackets mean nothing
+                idx = chunk.find("{", pos)
+                if idx == -1:
+                    break
+                pos = idx + 1
+                self.depth = 1
+                self.on_open(base + idx)
+                continue
+
+            match = self.tokens.search(chunk, pos)
+            if match is None:
+                break
+            idx = match.start()
+            pos = match.end()
+            ch = match.group()
+
+            if ch[0] == '"':
+                # A lone quote is a string that continues in the next chunk
+                if len(ch) == 1:
+                    self.in_string = True
+            elif ch in "{[":
+                self.depth += 1
+                self.on_nest(ch, base + idx)
+            elif ch in "}]":
+                self.depth -= 1
+                if self.depth == 0:
+                    self.on_close(base + idx)
+                else:
+                    self.on_unnest(base + idx)
+            else:
+                self.on_comma(base + idx)
+
+        if self.depth == 0 and not self.finished:
+            self.trim(self.position)
+
+    def text(self, start, stop):
+        joined = "".join(self.chunks)
+        self.chunks = [joined]
+        return joined[start - self.offset:stop - self.offset]
+
+    def trim(self, keep_from):
+        # Drop buffered text before keep_from; it will never be needed again
+        joined = "".join(self.chunks)[keep_from - self.offset:]
+        self.chunks = [joined] if joined else []
+        self.offset = keep_from
+
+    def on_open(self, index):
+        pass
+
+    def on_close(self, index):
+        pass
+
+    def on_nest(self, bracket, index):
+        pass
+
+    def on_unnest(self, index):
+        pass
+
+    def on_comma(self, index):
+        pass
+
+
+class ObjectExtractor(_Scanner):
+    # feed() returns the first balanced top-level object that is valid JSON
+    # as soon as its closing brace arrives, else None. Candidates that fail
+    # to parse (e.g. "{name}" in prose) are skipped. close() ends the input:
+    # a candidate still open is handed to the one-shot scan, which tells a
+    # stray quote or brace in prose from output that was cut off.
+
+    def __init__(self):
+        super().__init__()
+        self.start = None
+        self.result = None
+        self.raw = None
+
+    def feed(self, chunk):
+        super().feed(chunk)
+        return self.result
+
+    def close(self):
+        if self.result is None and self.depth:
+            self.result, self.raw = _find_object(self.text(self.offset, self.position))
+        self.finished = True
+        return self.result
+
+    def on_open(self, index):
+        self.start = index
+
+    def on_close(self, index):
+        raw = self.text(self.start, index + 1)
+        try:
+            self.result = json.loads(raw)
+        except ValueError:
+            self.start = None
+            return
+        self.raw = raw
+        self.finished = True
+
+
+class SectionParser(ObjectExtractor):
+    # Also reports the top-level members of that object while it is being
+    # written: feed() returns (key, value) for each member whose value is
+    # complete, and for a list member the items so far each time one more
+    # item is complete, e.g. "skills" grows while the model is still
+    # writing "schoolGaps". close() returns the whole object.
+    tokens = re.compile(_STRING + r'|[{}\[\]",]')
+
+    def __init__(self):
+        super().__init__()
+        self.member_start = None
+        self.key = None
+        self.items = None
+        self.item_start = None
+        self.sections = []
+
+    def feed(self, chunk):
+        super().feed(chunk)
+        sections, self.sections = self.sections, []
+        return sections
+
+    def on_open(self, index):
+        super().on_open(index)
+        self.member_start = index + 1
+        self.items = None
+
+    def on_close(self, index):
+        self.emit_member(index)
+        super().on_close(index)
+
+    def on_nest(self, bracket, index):
+        if self.depth != 2 or bracket != "[":
+            return
+        # A list value: its key is all that precedes the bracket
+        head = self.text(self.member_start, index).strip()
+        try:
+            self.key = json.loads(head[:-1]) if head.endswith(":") else None
+        except ValueError:
+            self.key = None
+        if isinstance(self.key, str):
+            self.items = []
+            self.item_start = index + 1
+
+    def on_unnest(self, index):
+        # The list's last item arrives with the whole member
+        if self.depth == 1:
+            self.items = None
+
+    def on_comma(self, index):
+        if self.depth == 1:
+            self.emit_member(index)
+            self.member_start = index + 1
+        elif self.depth == 2 and self.items is not None:
+            try:
+                self.items.append(json.loads(self.text(self.item_start, index)))
+            except ValueError:
+                self.items = None
+                return
+            self.item_start = index + 1
+            self.sections.append((self.key, list(self.items)))
+
+    def emit_member(self, index):
+        raw = self.text(self.member_start, index).strip()
+        if not raw:
+            return
+        try:
+            member = json.loads("{" + raw + "}")
+        except ValueError:
+            return
+        self.sections.extend(member.items())
@@ -0,0 +1,139 @@
+import asyncio
+import json
+import os
+import threading
+import weakref
+
+# -------------------- CONFIG --------------------
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+# Point at `manage.py runllmstub` for load tests without spending quota
+GROQ_API_URL = os.getenv("GROQ_API_URL", "https://api.groq.com/openai/v1/chat/completions")
+GROQ_MODEL = "llama-3.1-8b-instant"
+
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "15"))
+LLM_POOL_SIZE = int(os.getenv("LLM_POOL_SIZE", "200"))
+LLM_KEEPALIVE = int(os.getenv("LLM_KEEPALIVE", "50"))
+
+
+def build_headers():
+    return {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {GROQ_API_KEY}",
+    }
+
+
+def build_payload(prompt, stream=False):
+    payload = {
+        "model": GROQ_MODEL,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0,
+    }
+    if stream:
+        payload["stream"] = True
+    return payload
+
+
+def parse_content(data):
+    return data["choices"][0]["message"]["content"]
+
+
+# -------------------- SYNC CLIENT --------------------
+# One pooled requests.Session per process, shared by every request thread,
+# so keep-alive connections to Groq survive between calls. The HTTP clients
+# are imported by the first call that needs them, which keeps them out of
+# worker start-up.
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=LLM_POOL_SIZE,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update(build_headers())
+                _session = session
+    return _session
+
+
+def chat_completion(prompt, timeout=None):
+    response = get_session().post(
+        GROQ_API_URL,
+        json=build_payload(prompt),
+        timeout=timeout or LLM_TIMEOUT,
+    )
+    response.raise_for_status()
+    return parse_content(response.json())
+
+
+# -------------------- ASYNC CLIENT --------------------
+# httpx clients are bound to the event loop that opened their connections.
+# Under ASGI there is one loop per worker, so this holds a single long-lived
+# HTTP/2 client; under WSGI each async_to_sync call gets its own.
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_client():
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        import httpx
+
+        client = httpx.AsyncClient(
+            http2=True,
+            headers=build_headers(),
+            timeout=httpx.Timeout(LLM_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=LLM_POOL_SIZE,
+                max_keepalive_connections=LLM_KEEPALIVE,
+            ),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def achat_completion(prompt, timeout=None):
+    response = await get_async_client().post(
+        GROQ_API_URL,
+        json=build_payload(prompt),
+        timeout=timeout or LLM_TIMEOUT,
+    )
+    response.raise_for_status()
+    return parse_content(response.json())
+
+
+async def astream_completion(prompt, timeout=None):
+    # Yields content deltas from an OpenAI-style server-sent-events stream;
+    # the timeout applies to each read, not the whole stream
+    async with get_async_client().stream(
+        "POST",
+        GROQ_API_URL,
+        json=build_payload(prompt, stream=True),
+        timeout=timeout or LLM_TIMEOUT,
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            delta = json.loads(data)["choices"][0].get("delta", {})
+            if delta.get("content"):
+                yield delta["content"]
+
+
+async def aclose_clients():
+    for client in list(_async_clients.values()):
+        await client.aclose()
+    _async_clients.clear()
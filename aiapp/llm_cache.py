@@ -0,0 +1,195 @@
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from aiapp.models import LLMCacheEntry
+
+# Two tiers: a per-process LRU in front of the LLMCacheEntry table.
+# LLM calls use temperature 0, so an answer for the same normalized inputs,
+# model and prompt template can be replayed instead of paying for a new one.
+
+_memory = OrderedDict()
+_lock = threading.Lock()
+
+stats = {
+    "memory_hits": 0,
+    "db_hits": 0,
+    "misses": 0,
+    "stores": 0,
+    "evictions": 0,
+}
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _count(name, n=1):
+    with _lock:
+        stats[name] += n
+
+
+# -------------------- KEYS --------------------
+def normalize(value):
+    return " ".join(str(value or "").split()).lower()
+
+
+def make_key(*parts):
+    raw = json.dumps([normalize(p) for p in parts], separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+# -------------------- MEMORY TIER --------------------
+# Entries are copied in and out: callers edit the sections they get back
+# (canonicalizing, merging), and that must not change the cached answer.
+def _memory_get(key):
+    with _lock:
+        item = _memory.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires <= time.monotonic():
+            del _memory[key]
+            return None
+        _memory.move_to_end(key)
+    return copy.deepcopy(value)
+
+
+def _memory_set(key, value, ttl):
+    # Other workers cannot see an admin invalidation, so memory entries
+    # are additionally capped by LLM_CACHE_MEMORY_TTL.
+    ttl = min(ttl, _setting("LLM_CACHE_MEMORY_TTL", 300))
+    limit = _setting("LLM_CACHE_MEMORY_ENTRIES", 512)
+    value = copy.deepcopy(value)
+    with _lock:
+        _memory[key] = (time.monotonic() + ttl, value)
+        _memory.move_to_end(key)
+        while len(_memory) > limit:
+            _memory.popitem(last=False)
+            stats["evictions"] += 1
+
+
+def clear_memory():
+    with _lock:
+        _memory.clear()
+
+
+# -------------------- DB TIER --------------------
+def _db_get(key):
+    rows = LLMCacheEntry.objects.filter(key=key, expires_at__gt=timezone.now())
+    payload = rows.values_list("payload", flat=True).first()
+    if payload is not None:
+        rows.update(hits=F("hits") + 1)
+    return payload
+
+
+def _db_set(key, value, ttl, meta):
+    now = timezone.now()
+    LLMCacheEntry.objects.update_or_create(
+        key=key,
+        defaults={
+            "payload": value,
+            "expires_at": now + timedelta(seconds=ttl),
+            "model": meta.get("model", ""),
+            "company": (meta.get("company") or "")[:200],
+            "role1": (meta.get("role1") or "")[:200],
+            "role2": (meta.get("role2") or "")[:200],
+        },
+    )
+    _maybe_prune(now)
+
+
+# Pruning deletes expired rows and scans for the oldest ones past the cap;
+# once per LLM_CACHE_PRUNE_INTERVAL per process is plenty
+_pruned_at = None
+
+
+def _maybe_prune(now):
+    global _pruned_at
+    with _lock:
+        due = _pruned_at is None or time.monotonic() - _pruned_at >= _setting("LLM_CACHE_PRUNE_INTERVAL", 300)
+        if due:
+            _pruned_at = time.monotonic()
+    if due:
+        _db_prune(now)
+
+
+def _db_prune(now):
+    LLMCacheEntry.objects.filter(expires_at__lte=now).delete()
+
+    limit = _setting("LLM_CACHE_DB_ENTRIES", 10000)
+    stale = LLMCacheEntry.objects.order_by("-created").values_list("pk", flat=True)[limit:]
+    stale = list(stale)
+    if stale:
+        LLMCacheEntry.objects.filter(pk__in=stale).delete()
+        _count("evictions", len(stale))
+
+
+# -------------------- PUBLIC API --------------------
+def get(key):
+    value = _memory_get(key)
+    if value is not None:
+        _count("memory_hits")
+        return value
+
+    value = _db_get(key)
+    if value is not None:
+        _count("db_hits")
+        _memory_set(key, value, _setting("LLM_CACHE_TTL", 604800))
+        return value
+
+    _count("misses")
+    return None
+
+
+def peek(key):
+    # Same lookup as get() without touching the hit/miss counters
+    value = _memory_get(key)
+    if value is None:
+        value = _db_get(key)
+        if value is not None:
+            _memory_set(key, value, _setting("LLM_CACHE_TTL", 604800))
+    return value
+
+
+def set(key, value, **meta):
+    ttl = _setting("LLM_CACHE_TTL", 604800)
+    _memory_set(key, value, ttl)
+    _db_set(key, value, ttl, meta)
+    _count("stores")
+
+
+def invalidate(keys):
+    keys = list(keys)
+    with _lock:
+        for key in keys:
+            _memory.pop(key, None)
+    return LLMCacheEntry.objects.filter(key__in=keys).delete()[0]
+
+
+async def aget(key):
+    value = _memory_get(key)
+    if value is not None:
+        _count("memory_hits")
+        return value
+    return await sync_to_async(get)(key)
+
+
+async def apeek(key):
+    value = _memory_get(key)
+    if value is not None:
+        return value
+    return await sync_to_async(peek)(key)
+
+
+async def aset(key, value, **meta):
+    await sync_to_async(set)(key, value, **meta)
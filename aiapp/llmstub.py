@@ -0,0 +1,153 @@
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# A local stand-in for the Groq chat-completions API, for load tests and
+# offline development. It answers any POST ending in /chat/completions with
+# a well-formed comparison report, after a configurable delay. Like
+# aiapp/pdf.py, nothing here imports Django.
+#
+#   python manage.py runllmstub --latency 800 --jitter 200 --error-rate 0.02
+#   GROQ_API_URL=http://127.0.0.1:8765/openai/v1/chat/completions ...
+
+FIELD = re.compile(r"^(Company|Role|Primary Role|Comparison Role):\s*(.*)$", re.MULTILINE)
+
+SKILLS = [
+    "Python", "SQL", "Statistics", "Git", "Communication", "Linux", "HTML & CSS",
+    "JavaScript", "Data Structures", "Cloud Basics", "Testing", "APIs",
+]
+
+
+# -------------------- CONTENT --------------------
+def _skill(name, description, level=None):
+    skill = {"name": name, "description": description}
+    if level:
+        skill["level"] = level
+    return skill
+
+
+def _rng(*parts):
+    # Same input -> same answer, like the real API at temperature 0
+    return random.Random(hashlib.sha256("\n".join(parts).encode()).digest())
+
+
+def build_role(role):
+    rng = _rng("role", role.lower())
+    levels = ["Beginner", "Intermediate", "Advanced"]
+    return {
+        "skills": [_skill(s, f"Used daily as a {role}", rng.choice(levels)) for s in rng.sample(SKILLS, 6)],
+        "schoolGaps": [_skill("Project work", "School rarely asks for end-to-end projects")],
+    }
+
+
+def build_transition(role1, role2):
+    rng = _rng("transition", role1.lower(), role2.lower())
+    return {
+        "bridgeModules": [_skill(f"{rng.choice(SKILLS)} bootcamp", "Four weeks of guided practice")],
+        "estimatedTime": f"{rng.randint(3, 8)} months",
+        "transitionAdvice": f"Build on your {role1} foundations and add one {role2} project per month.",
+    }
+
+
+def build_report(prompt):
+    # Answers the per-role prompt ("Role:") or the transition prompt
+    fields = dict(FIELD.findall(prompt or ""))
+    if "Role" in fields:
+        return build_role(fields["Role"] or "Role")
+    return build_transition(fields.get("Primary Role") or "Role 1", fields.get("Comparison Role") or "Role 2")
+
+
+# -------------------- SERVER --------------------
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "llmstub"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            return self._json(404, {"error": {"message": "Not found"}})
+
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return self._json(400, {"error": {"message": "Invalid JSON"}})
+
+        config = self.server
+        delay = max(0.0, config.latency + random.uniform(-config.jitter, config.jitter))
+
+        if random.random() < config.error_rate:
+            time.sleep(delay / 2)
+            status = random.choice([429, 500, 503])
+            return self._json(status, {"error": {"message": f"Injected error {status}"}})
+
+        messages = payload.get("messages") or [{}]
+        content = json.dumps(build_report(messages[-1].get("content", "")))
+
+        if payload.get("stream"):
+            return self._stream(content, delay)
+
+        time.sleep(delay)
+        self._json(200, {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "model": payload.get("model", "stub"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        })
+
+    def _json(self, status, data):
+        out = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _stream(self, content, delay):
+        # Time to first token is a fraction of the total, like a real model
+        size = self.server.chunk_size
+        pieces = [content[i:i + size] for i in range(0, len(content), size)]
+        time.sleep(delay * 0.2)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        gap = delay * 0.8 / max(1, len(pieces))
+        for piece in pieces:
+            event = {"choices": [{"index": 0, "delta": {"content": piece}}]}
+            self._chunk(f"data: {json.dumps(event)}\n\n".encode())
+            time.sleep(gap)
+        self._chunk(b"data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.5, jitter=0.1, error_rate=0.0, chunk_size=24, verbose=False):
+        super().__init__(address, StubHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.chunk_size = chunk_size
+        self.verbose = verbose
+
+
+def start(host="127.0.0.1", port=8765, **options):
+    # Runs in a background thread; returns the server (call .shutdown())
+    server = StubServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
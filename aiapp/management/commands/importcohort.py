@@ -0,0 +1,67 @@
+import sys
+import time
+import zipfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from aiapp import cohort
+
+
+class Command(BaseCommand):
+    help = "Generates roadmaps for a CSV roster of (student, class, company, role)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("roster", help="CSV file, or - for stdin")
+        parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+        parser.add_argument("--output", default="-", help="Output file, or - for stdout")
+        parser.add_argument("--pdf-zip", help="Also render one PDF per student into this zip")
+        parser.add_argument("--workers", type=int, default=getattr(settings, "COHORT_WORKERS", 2))
+        parser.add_argument("--chunk-size", type=int, default=100)
+
+    def handle(self, *args, **kwargs):
+
+        source = sys.stdin if kwargs["roster"] == "-" else open(kwargs["roster"], newline="", encoding="utf-8-sig")
+        out = sys.stdout if kwargs["output"] == "-" else open(kwargs["output"], "w", newline="", encoding="utf-8")
+        archive = zipfile.ZipFile(kwargs["pdf_zip"], "w", zipfile.ZIP_DEFLATED) if kwargs["pdf_zip"] else None
+
+        as_csv = kwargs["format"] == "csv"
+        if as_csv:
+            out.write(cohort.csv_header())
+
+        done = errors = 0
+        started = time.monotonic()
+
+        try:
+            results = cohort.run(
+                cohort.read_rows(source),
+                workers=kwargs["workers"],
+                chunk_size=kwargs["chunk_size"],
+                with_pdf=archive is not None,
+            )
+            for result, data in results:
+                out.write(cohort.to_csv(result) if as_csv else cohort.to_ndjson(result))
+
+                if data is not None:
+                    archive.writestr(cohort.pdf_name(result), data)
+
+                done += 1
+                errors += "error" in result
+                if done % 500 == 0:
+                    self.stderr.write(f"{done} students ({done / (time.monotonic() - started):.0f}/s)")
+
+        except ValueError as e:
+            raise CommandError(e)
+
+        finally:
+            if archive is not None:
+                archive.close()
+            if out is not sys.stdout:
+                out.close()
+            if source is not sys.stdin:
+                source.close()
+
+        elapsed = time.monotonic() - started
+        self.stderr.write(self.style.SUCCESS(
+            f"{done} students in {elapsed:.1f}s, {errors} errors"
+        ))
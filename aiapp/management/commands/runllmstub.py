@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from aiapp.llmstub import StubServer
+
+
+class Command(BaseCommand):
+    help = "Runs a local stand-in for the Groq chat-completions API (for load tests)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--latency", type=float, default=500,
+                            help="Mean response time in milliseconds")
+        parser.add_argument("--jitter", type=float, default=100,
+                            help="Uniform +/- jitter in milliseconds")
+        parser.add_argument("--error-rate", type=float, default=0.0,
+                            help="Fraction of requests answered with 429/500/503")
+        parser.add_argument("--chunk-size", type=int, default=24,
+                            help="Characters per streamed delta")
+        parser.add_argument("--verbose", action="store_true", help="Log every request")
+
+    def handle(self, *args, **kwargs):
+        server = StubServer(
+            (kwargs["host"], kwargs["port"]),
+            latency=kwargs["latency"] / 1000,
+            jitter=kwargs["jitter"] / 1000,
+            error_rate=kwargs["error_rate"],
+            chunk_size=kwargs["chunk_size"],
+            verbose=kwargs["verbose"],
+        )
+
+        url = f"http://{kwargs['host']}:{kwargs['port']}/openai/v1/chat/completions"
+        self.stdout.write(self.style.SUCCESS(f"LLM stub listening; set GROQ_API_URL={url}"))
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
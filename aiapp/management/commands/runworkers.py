@@ -0,0 +1,104 @@
+import multiprocessing
+import signal
+import threading
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+
+def _keep_connections():
+    # Worker threads live as long as the process, so unlike the web app
+    # (see DATABASES in settings) they keep their connection between jobs
+    for alias in connections:
+        connections.settings[alias]["CONN_MAX_AGE"] = getattr(settings, "DB_WORKER_CONN_MAX_AGE", 600)
+
+
+def _process_main(threads, options):
+    # Spawned children start from a clean interpreter: set Django up before
+    # anything that touches models is imported
+    django.setup()
+    _keep_connections()
+    from aiapp import jobs
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *args: stop.set())
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for thread in jobs.start_threads(threads, stop, **options):
+        thread.join()
+
+
+class Command(BaseCommand):
+    help = "Runs background report generation workers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=getattr(settings, "JOB_WORKERS", 2),
+                            help="Worker threads (per process)")
+        parser.add_argument("--processes", type=int, default=0,
+                            help="Run this many worker processes instead of threads in this one")
+        parser.add_argument("--poll-interval", type=float, default=1.0)
+        parser.add_argument("--visibility-timeout", type=int,
+                            default=getattr(settings, "JOB_VISIBILITY_TIMEOUT", 60))
+        parser.add_argument("--once", action="store_true",
+                            help="Exit when the queue is empty")
+
+    def handle(self, *args, **kwargs):
+
+        options = {
+            "poll_interval": kwargs["poll_interval"],
+            "visibility_timeout": kwargs["visibility_timeout"],
+            "once": kwargs["once"],
+        }
+
+        if kwargs["processes"]:
+            self.run_processes(kwargs["processes"], kwargs["workers"], options)
+        else:
+            self.run_threads(kwargs["workers"], options)
+
+    def run_threads(self, count, options):
+        from aiapp import jobs
+
+        _keep_connections()
+
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *args: stop.set())
+
+        threads = jobs.start_threads(count, stop, **options)
+        self.stdout.write(self.style.SUCCESS(f"{count} job workers started"))
+
+        try:
+            while any(t.is_alive() for t in threads):
+                for t in threads:
+                    t.join(timeout=0.5)
+        except KeyboardInterrupt:
+            stop.set()
+            for t in threads:
+                t.join()
+
+        self.stdout.write("Job workers stopped")
+
+    def run_processes(self, count, threads, options):
+        # Never hand an open DB connection to a child process
+        connections.close_all()
+
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=_process_main, args=(threads, options), daemon=True)
+            for _ in range(count)
+        ]
+        for p in processes:
+            p.start()
+        signal.signal(signal.SIGTERM, lambda *args: [p.terminate() for p in processes])
+        self.stdout.write(self.style.SUCCESS(f"{count} worker processes x {threads} threads started"))
+
+        try:
+            for p in processes:
+                p.join()
+        except KeyboardInterrupt:
+            for p in processes:
+                p.terminate()
+            for p in processes:
+                p.join()
+
+        self.stdout.write("Job workers stopped")
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-17 11:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aiapp', '0004_delete_studentprofile'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('model', models.CharField(max_length=100)),
+                ('company', models.CharField(blank=True, max_length=200)),
+                ('role1', models.CharField(blank=True, max_length=200)),
+                ('role2', models.CharField(blank=True, max_length=200)),
+                ('payload', models.JSONField()),
+                ('hits', models.PositiveIntegerField(default=0)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'verbose_name': 'LLM cache entry',
+                'verbose_name_plural': 'LLM cache entries',
+                'ordering': ['-created'],
+            },
+        ),
+    ]
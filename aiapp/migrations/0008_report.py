@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-17 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aiapp', '0007_generationjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Report',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('kind', models.CharField(choices=[('roadmap', 'Roadmap'), ('comparison', 'Comparison')], max_length=20)),
+                ('company', models.CharField(blank=True, max_length=200)),
+                ('role1', models.CharField(blank=True, max_length=200)),
+                ('role2', models.CharField(blank=True, max_length=200)),
+                ('data', models.JSONField()),
+                ('created', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created'],
+                'indexes': [models.Index(fields=['company', 'role1', 'created'], name='aiapp_repor_company_2dd607_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,160 @@
+# Generated by Django 6.0.2 on 2026-10-17 16:05
+
+from django.db import migrations, models
+
+# The taxonomy as first shipped. The Skill table is the taxonomy from here
+# on: later changes are new migrations (e.g. 0011) or admin edits.
+# (name, category, aliases)
+SKILLS = [
+    ('Python', 'language', ['python programming', 'python 3', 'python3', 'core python', 'py']),
+    ('Java', 'language', ['core java', 'java programming', 'java se']),
+    ('JavaScript', 'language', ['js', 'javascript es6', 'es6', 'ecmascript', 'vanilla javascript']),
+    ('TypeScript', 'language', ['ts']),
+    ('C', 'language', ['c programming', 'c language']),
+    ('C++', 'language', ['cpp', 'c plus plus', 'modern c++']),
+    ('C#', 'language', ['c sharp', 'csharp']),
+    ('Go', 'language', ['golang']),
+    ('Rust', 'language', ['rust lang']),
+    ('Kotlin', 'language', []),
+    ('Swift', 'language', ['swift programming']),
+    ('Dart', 'language', []),
+    ('R', 'language', ['r programming', 'r language']),
+    ('SQL', 'language', ['structured query language', 'sql queries', 'writing sql']),
+    ('Bash', 'language', ['shell scripting', 'bash scripting', 'shell']),
+    ('PHP', 'language', []),
+    ('Ruby', 'language', []),
+    ('Scala', 'language', []),
+    ('MATLAB', 'language', []),
+    ('HTML', 'web', ['html5', 'html basics']),
+    ('CSS', 'web', ['css3', 'cascading style sheets']),
+    ('HTML & CSS', 'web', ['html and css', 'html/css', 'html, css']),
+    ('React', 'web', ['react.js', 'reactjs', 'react js']),
+    ('Angular', 'web', ['angularjs', 'angular.js']),
+    ('Vue', 'web', ['vue.js', 'vuejs']),
+    ('Next.js', 'web', ['nextjs']),
+    ('Node.js', 'web', ['nodejs', 'node', 'node js']),
+    ('Express', 'web', ['express.js', 'expressjs']),
+    ('Django', 'web', ['django framework']),
+    ('Flask', 'web', []),
+    ('Spring Boot', 'web', ['spring', 'spring framework']),
+    ('REST APIs', 'web', ['rest api', 'restful apis', 'apis', 'api design', 'web apis']),
+    ('GraphQL', 'web', []),
+    ('Responsive Design', 'web', ['responsive web design', 'mobile first design']),
+    ('Tailwind CSS', 'web', ['tailwind']),
+    ('Bootstrap', 'web', []),
+    ('Web Accessibility', 'web', ['accessibility', 'a11y']),
+    ('Web Performance', 'web', ['frontend performance', 'page speed']),
+    ('Statistics', 'data', ['stats', 'statistical analysis', 'probability and statistics']),
+    ('Probability', 'data', []),
+    ('Linear Algebra', 'data', []),
+    ('Calculus', 'data', []),
+    ('Mathematics', 'data', ['maths', 'math']),
+    ('Data Analysis', 'data', ['data analytics', 'analysing data', 'analyzing data']),
+    ('Data Visualization', 'data', ['data visualisation', 'dataviz', 'charts and dashboards']),
+    ('Data Cleaning', 'data', ['data wrangling', 'data preprocessing']),
+    ('Excel', 'data', ['microsoft excel', 'ms excel', 'spreadsheets']),
+    ('Power BI', 'data', ['powerbi']),
+    ('Tableau', 'data', []),
+    ('Pandas', 'data', []),
+    ('NumPy', 'data', ['numpy arrays']),
+    ('Matplotlib', 'data', []),
+    ('Jupyter', 'data', ['jupyter notebooks', 'notebooks']),
+    ('ETL', 'data', ['data pipelines', 'etl pipelines']),
+    ('Big Data', 'data', ['hadoop', 'spark', 'apache spark']),
+    ('Data Warehousing', 'data', ['data warehouse']),
+    ('Machine Learning', 'ai', ['ml', 'machine learning basics', 'ml algorithms']),
+    ('Deep Learning', 'ai', ['dl', 'neural networks']),
+    ('Natural Language Processing', 'ai', ['nlp', 'text processing']),
+    ('Computer Vision', 'ai', ['cv', 'image processing']),
+    ('Scikit-learn', 'ai', ['sklearn', 'scikit learn']),
+    ('TensorFlow', 'ai', ['tensorflow 2', 'keras']),
+    ('PyTorch', 'ai', ['torch']),
+    ('Large Language Models', 'ai', ['llms', 'llm', 'generative ai', 'genai']),
+    ('Prompt Engineering', 'ai', ['prompting']),
+    ('Model Deployment', 'ai', ['mlops', 'deploying models', 'model serving']),
+    ('Feature Engineering', 'ai', []),
+    ('Reinforcement Learning', 'ai', ['rl']),
+    ('Data Structures', 'engineering', ['data structure']),
+    ('Algorithms', 'engineering', ['algorithm design']),
+    ('Data Structures & Algorithms', 'engineering', ['dsa', 'data structures and algorithms', 'ds and algo']),
+    ('Object-Oriented Programming', 'engineering', ['oop', 'oops', 'object oriented design']),
+    ('Problem Solving', 'engineering', ['analytical thinking', 'logical thinking']),
+    ('Git', 'engineering', ['version control', 'git and github', 'github']),
+    ('Testing', 'engineering', ['software testing', 'unit testing', 'automated testing']),
+    ('Debugging', 'engineering', []),
+    ('System Design', 'engineering', ['systems design', 'software architecture']),
+    ('Design Patterns', 'engineering', []),
+    ('Databases', 'engineering', ['database', 'dbms', 'database management', 'rdbms']),
+    ('PostgreSQL', 'engineering', ['postgres']),
+    ('MySQL', 'engineering', []),
+    ('MongoDB', 'engineering', ['mongo', 'nosql']),
+    ('Operating Systems', 'engineering', ['os concepts']),
+    ('Computer Networks', 'engineering', ['networking', 'computer networking']),
+    ('Agile', 'engineering', ['scrum', 'agile methodology']),
+    ('Competitive Programming', 'engineering', ['coding contests']),
+    ('Cloud Computing', 'cloud', ['cloud basics', 'cloud fundamentals', 'cloud']),
+    ('AWS', 'cloud', ['amazon web services']),
+    ('Azure', 'cloud', ['microsoft azure']),
+    ('Google Cloud', 'cloud', ['gcp', 'google cloud platform']),
+    ('Docker', 'cloud', ['containers', 'containerization']),
+    ('Kubernetes', 'cloud', ['k8s']),
+    ('CI/CD', 'cloud', ['continuous integration', 'ci cd', 'devops pipelines']),
+    ('Linux', 'cloud', ['linux basics', 'unix', 'linux command line', 'command line']),
+    ('DevOps', 'cloud', []),
+    ('Terraform', 'cloud', ['infrastructure as code']),
+    ('Cybersecurity', 'security', ['cyber security', 'information security', 'infosec']),
+    ('Network Security', 'security', []),
+    ('Ethical Hacking', 'security', ['penetration testing', 'pentesting']),
+    ('Cryptography', 'security', []),
+    ('Web Security', 'security', ['owasp', 'owasp top 10']),
+    ('Android Development', 'mobile', ['android', 'android apps']),
+    ('iOS Development', 'mobile', ['ios', 'ios apps']),
+    ('Flutter', 'mobile', []),
+    ('React Native', 'mobile', []),
+    ('Mobile UI Design', 'mobile', ['mobile ui']),
+    ('UI/UX Design', 'design', ['ui ux', 'ux design', 'ui design', 'user experience']),
+    ('Figma', 'design', []),
+    ('Wireframing', 'design', ['prototyping']),
+    ('Communication', 'professional', ['communication skills', 'verbal communication', 'written communication']),
+    ('Teamwork', 'professional', ['collaboration', 'team work']),
+    ('Presentation Skills', 'professional', ['public speaking', 'presenting']),
+    ('Time Management', 'professional', []),
+    ('Project Management', 'professional', []),
+    ('Critical Thinking', 'professional', []),
+    ('Technical Writing', 'professional', ['documentation']),
+    ('English Proficiency', 'professional', ['english']),
+    ('Leadership', 'professional', []),
+    ('Project Work', 'professional', ['projects', 'portfolio projects', 'hands-on projects']),
+]
+
+
+def load_taxonomy(apps, schema_editor):
+    Skill = apps.get_model("aiapp", "Skill")
+    Skill.objects.bulk_create(
+        [Skill(name=name, aliases=aliases, category=category) for name, category, aliases in SKILLS],
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aiapp', '0008_report'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('aliases', models.JSONField(blank=True, default=list)),
+                ('category', models.CharField(blank=True, max_length=50)),
+                ('updated', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.RunPython(load_taxonomy, migrations.RunPython.noop),
+    ]
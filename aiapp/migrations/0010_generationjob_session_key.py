@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-17 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aiapp', '0009_skill'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='generationjob',
+            name='session_key',
+            field=models.CharField(blank=True, max_length=40),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.2 on 2026-10-17 19:30
+
+from django.db import migrations
+
+# Aliases that merged distinct skills into one canonical name
+PRUNED = {
+    "Big Data": ["hadoop", "spark", "apache spark"],
+    "Git": ["github"],
+    "MongoDB": ["nosql"],
+    "Linux": ["unix"],
+}
+
+
+def prune_aliases(apps, schema_editor):
+    Skill = apps.get_model("aiapp", "Skill")
+    for skill in Skill.objects.filter(name__in=PRUNED):
+        aliases = [a for a in skill.aliases if a not in PRUNED[skill.name]]
+        if aliases != skill.aliases:
+            skill.aliases = aliases
+            skill.save(update_fields=["aliases", "updated"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aiapp', '0010_generationjob_session_key'),
+    ]
+
+    operations = [
+        migrations.RunPython(prune_aliases, migrations.RunPython.noop),
+    ]
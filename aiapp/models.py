@@ -1,3 +1,125 @@
-# models.py
+import uuid
 
-# No models defined
\ No newline at end of file
+from django.db import models
+from django.utils import timezone
+
+
+class LLMCacheEntry(models.Model):
+    key = models.CharField(max_length=64, unique=True)
+    model = models.CharField(max_length=100)
+
+    company = models.CharField(max_length=200, blank=True)
+    role1 = models.CharField(max_length=200, blank=True)
+    role2 = models.CharField(max_length=200, blank=True)
+
+    payload = models.JSONField()
+    hits = models.PositiveIntegerField(default=0)
+
+    created = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        ordering = ["-created"]
+        verbose_name = "LLM cache entry"
+        verbose_name_plural = "LLM cache entries"
+
+    def __str__(self):
+        return f"{self.company} / {self.role1} / {self.role2}"
+
+
+class GenerationLock(models.Model):
+    # One row per in-flight upstream call, shared by every worker process
+    key = models.CharField(max_length=64, unique=True)
+    owner = models.CharField(max_length=100)
+    expires_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.key} ({self.owner})"
+
+
+class GenerationJob(models.Model):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    DEAD = "dead"
+
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (DEAD, "Dead letter"),
+    ]
+
+    # Random ids, so job URLs cannot be enumerated; job_status also checks
+    # session_key and returns only the status and error
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    company = models.CharField(max_length=200, blank=True)
+    role1 = models.CharField(max_length=200, blank=True)
+    role2 = models.CharField(max_length=200, blank=True)
+
+    # Only the session that enqueued the job may poll it and get the report
+    session_key = models.CharField(max_length=40, blank=True)
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+
+    # Queued: earliest start (retry backoff). Running: visibility timeout.
+    available_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-created"]
+        indexes = [models.Index(fields=["status", "available_at"])]
+
+    def __str__(self):
+        return f"{self.company} / {self.role1} ({self.status})"
+
+
+class Report(models.Model):
+    ROADMAP = "roadmap"
+    COMPARISON = "comparison"
+
+    KIND_CHOICES = [
+        (ROADMAP, "Roadmap"),
+        (COMPARISON, "Comparison"),
+    ]
+
+    # Identical reports share one row; sessions only keep the id
+    content_hash = models.CharField(max_length=64, unique=True)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+
+    company = models.CharField(max_length=200, blank=True)
+    role1 = models.CharField(max_length=200, blank=True)
+    role2 = models.CharField(max_length=200, blank=True)
+
+    data = models.JSONField()
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created"]
+        indexes = [models.Index(fields=["company", "role1", "created"])]
+
+    def __str__(self):
+        return f"{self.company} / {self.role1} / {self.role2} ({self.kind})"
+
+
+class Skill(models.Model):
+    # Canonical skill names; LLM output is mapped onto these (aiapp/skills.py)
+    name = models.CharField(max_length=100, unique=True)
+    aliases = models.JSONField(default=list, blank=True)
+    category = models.CharField(max_length=50, blank=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,209 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import ListFlowable, ListItem, Paragraph, SimpleDocTemplate, Spacer
+
+# PDF rendering with platypus: text wraps to the frame and flows onto new
+# pages on its own. This module must not import Django at module level,
+# because pool workers are spawned as plain interpreters that only render.
+
+
+# -------------------- STYLES (once per process) --------------------
+@lru_cache(maxsize=None)
+def styles():
+    base = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle("ReportTitle", parent=base["Title"], fontSize=18, spaceAfter=14),
+        "heading": ParagraphStyle("ReportHeading", parent=base["Heading2"], fontSize=13,
+                                  spaceBefore=12, spaceAfter=6, textColor=colors.HexColor("#0071e3")),
+        "meta": ParagraphStyle("ReportMeta", parent=base["Normal"], fontSize=11, leading=15),
+        "body": ParagraphStyle("ReportBody", parent=base["Normal"], fontSize=10.5, leading=14),
+        "muted": ParagraphStyle("ReportMuted", parent=base["Normal"], fontSize=9.5, leading=12,
+                                textColor=colors.HexColor("#6e6e73")),
+    }
+
+
+def _text(value):
+    return escape(str(value or ""))
+
+
+def _meta(label, value):
+    return Paragraph(f"<b>{_text(label)}:</b> {_text(value)}", styles()["meta"])
+
+
+def _items(rows):
+    # rows: iterable of (bold, rest) pairs
+    body = styles()["body"]
+    items = []
+    for bold, rest in rows:
+        text = f"<b>{_text(bold)}</b>"
+        if rest:
+            text += f" {_text(rest)}"
+        items.append(ListItem(Paragraph(text, body), leftIndent=12))
+    if not items:
+        return [Paragraph("None listed.", styles()["muted"])]
+    return [ListFlowable(items, bulletType="bullet", start="•", leftIndent=12)]
+
+
+def _skill_rows(skills, with_level=False):
+    for s in skills or []:
+        name = s.get("name", "")
+        if with_level and s.get("level"):
+            name = f"{name} ({s['level']})"
+        yield name, (f"– {s['description']}" if s.get("description") else "")
+
+
+def _build(story, title):
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        title=title,
+        leftMargin=0.8 * inch,
+        rightMargin=0.8 * inch,
+        topMargin=0.8 * inch,
+        bottomMargin=0.8 * inch,
+    )
+    doc.build(story)
+    return buffer.getvalue()
+
+
+# -------------------- REPORTS --------------------
+def render_comparison(output):
+    st = styles()
+    role1 = output.get("role1", "")
+    role2 = output.get("role2", "")
+
+    story = [
+        Paragraph("AI Skill Mapper – Role Comparison Report", st["title"]),
+        _meta("Company", output.get("company")),
+        _meta("Primary Role", role1),
+        _meta("Comparison Role", role2),
+        _meta("Estimated Preparation Time", output.get("estimatedTime")),
+        Spacer(1, 6),
+    ]
+
+    sections = [
+        ("Common Skills (Both Roles)", _skill_rows(output.get("commonSkills"))),
+        (f"{role1} – Core Skills", _skill_rows(output.get("role1Only"), with_level=True)),
+        (f"{role2} – Additional Skills Needed", _skill_rows(output.get("role2Only"), with_level=True)),
+        ("School Gaps", _skill_rows(output.get("schoolGaps"))),
+        ("Bridge Training Modules", _skill_rows(output.get("bridgeModules"))),
+    ]
+    for heading, rows in sections:
+        story.append(Paragraph(_text(heading), st["heading"]))
+        story.extend(_items(rows))
+
+    story.append(Paragraph("Transition Advice", st["heading"]))
+    story.append(Paragraph(_text(output.get("transitionAdvice")), st["body"]))
+
+    return _build(story, "Role Comparison Report")
+
+
+def render_roadmap(output):
+    st = styles()
+
+    story = [
+        Paragraph("EduBridge AI – Career Plan", st["title"]),
+        _meta("Company", output.get("company")),
+        _meta("Role", output.get("role1")),
+        _meta("Class", output.get("studentClass")),
+        _meta("Estimated Time", output.get("estimatedTime")),
+    ]
+    if output.get("readinessScore"):
+        story.append(_meta("Readiness Score", f"{output['readinessScore']}%"))
+
+    story.append(Paragraph("Your Learning Journey", st["heading"]))
+    for year in output.get("roadmap") or []:
+        story.append(Paragraph(f"<b>Class {_text(year.get('class'))}</b>", st["body"]))
+        story.extend(_items((skill, "") for skill in year.get("skills", [])))
+
+    story.append(Paragraph("Academic Gaps", st["heading"]))
+    story.extend(_items(_skill_rows(output.get("academicGaps"))))
+
+    story.append(Paragraph("Recommended YouTube Channels", st["heading"]))
+    story.extend(_items((yt.get("title"), yt.get("url")) for yt in output.get("youtubePlaylists") or []))
+
+    story.append(Paragraph("Project Ideas", st["heading"]))
+    story.extend(_items(
+        (p.get("title"), f"– {p.get('description', '')} {p.get('url', '')}")
+        for p in output.get("githubProjects") or []
+    ))
+
+    story.append(Paragraph("Internships", st["heading"]))
+    story.extend(_items(
+        (i.get("company"), f"– {i.get('role', '')} {i.get('url', '')}")
+        for i in output.get("internships") or []
+    ))
+
+    return _build(story, "Career Plan")
+
+
+RENDERERS = {
+    "comparison": render_comparison,
+    "roadmap": render_roadmap,
+}
+
+
+def render(kind, output):
+    return RENDERERS[kind](output)
+
+
+# -------------------- PROCESS POOL --------------------
+# ReportLab layout is pure-Python CPU work; running it in a small pool of
+# spawned processes keeps it off the web worker's GIL.
+_executor = None
+_slots = None
+_executor_lock = threading.Lock()
+
+
+def _warm():
+    styles()
+
+
+def get_executor(workers, queue_size):
+    global _executor, _slots
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm,
+            )
+            # Bound queued work so a burst cannot pile up unbounded renders
+            _slots = threading.BoundedSemaphore(workers + queue_size)
+    return _executor, _slots
+
+
+def shutdown():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def render_in_pool(kind, output, workers=2, queue_size=8, timeout=30):
+    if workers <= 0:
+        return render(kind, output)
+
+    executor, slots = get_executor(workers, queue_size)
+    if not slots.acquire(timeout=timeout):
+        raise TimeoutError("PDF renderer is busy")
+    try:
+        return executor.submit(render, kind, output).result(timeout=timeout)
+    except BrokenProcessPool:
+        # A child died (OOM, kill); start a fresh pool for the next caller
+        shutdown()
+        raise
+    finally:
+        slots.release()
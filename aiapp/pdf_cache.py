@@ -0,0 +1,159 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+
+from aiapp.timing import stage
+
+# Rendered PDFs are content-addressed: the file name is the hash of the
+# canonical report JSON, so an unchanged report is one stat() away.
+
+
+def _cache_dir():
+    return Path(getattr(settings, "PDF_CACHE_DIR", Path(tempfile.gettempdir()) / "pdf_cache"))
+
+
+def report_hash(output, namespace):
+    canonical = json.dumps(output, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(f"{namespace}\n{canonical}".encode()).hexdigest()
+
+
+def cache_path(digest):
+    return _cache_dir() / digest[:2] / f"{digest}.pdf"
+
+
+def get_or_render(digest, render):
+    # Returns an open binary file. Another worker may evict the file between
+    # any two calls here, so a vanished file is treated as a miss.
+    path = cache_path(digest)
+
+    try:
+        # mtime doubles as last-access time for LRU eviction
+        os.utime(path)
+        return open(path, "rb")
+    except FileNotFoundError:
+        pass
+
+    data = render()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write then rename so concurrent readers never see a partial file
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+    _written(len(data))
+    return io.BytesIO(data)
+
+
+# The cache size is tracked per process from its own writes; the directory
+# is only walked when that estimate passes the limit or every
+# PDF_CACHE_EVICT_INTERVAL seconds, to pick up other workers' files.
+_lock = threading.Lock()
+_size = None
+_scanned_at = 0.0
+
+
+def _written(nbytes):
+    global _size
+    limit = getattr(settings, "PDF_CACHE_MAX_BYTES", 200 * 1024 * 1024)
+    interval = getattr(settings, "PDF_CACHE_EVICT_INTERVAL", 300)
+    with _lock:
+        if _size is not None:
+            _size += nbytes
+        due = _size is None or _size > limit or time.monotonic() - _scanned_at >= interval
+    if due:
+        evict()
+
+
+def evict():
+    global _size, _scanned_at
+    limit = getattr(settings, "PDF_CACHE_MAX_BYTES", 200 * 1024 * 1024)
+
+    files = []
+    total = 0
+    for path in _cache_dir().glob("*/*.pdf"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+        total += stat.st_size
+
+    if total > limit:
+        # Oldest first, down to 90% so we do not evict on every write
+        for _, size, path in sorted(files):
+            if total <= limit * 0.9:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    with _lock:
+        _size = total
+        _scanned_at = time.monotonic()
+
+
+# Bump when a layout in aiapp/pdf.py changes so old files are not served
+LAYOUT_VERSION = 2
+
+
+def render(kind, output):
+    # ReportLab is loaded by the first PDF, not at worker start
+    from aiapp import pdf
+
+    with stage("pdf"):
+        return pdf.render_in_pool(
+            kind,
+            output,
+            workers=getattr(settings, "PDF_RENDER_WORKERS", 2),
+            queue_size=getattr(settings, "PDF_RENDER_QUEUE", 8),
+            timeout=getattr(settings, "PDF_RENDER_TIMEOUT", 30),
+        )
+
+
+# Seconds a client is told to wait when the render queue is full
+BUSY_RETRY_AFTER = 5
+
+
+def busy():
+    response = HttpResponse(
+        "PDF renderer is busy; please try again shortly\n",
+        status=503,
+        content_type="text/plain; charset=utf-8",
+    )
+    response["Retry-After"] = str(BUSY_RETRY_AFTER)
+    return response
+
+
+def serve(request, output, kind, filename):
+    digest = report_hash(output, f"{kind}-v{LAYOUT_VERSION}")
+    etag = f'"{digest}"'
+
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    else:
+        try:
+            pdf = get_or_render(digest, lambda: render(kind, output))
+        except TimeoutError:
+            # No queue slot, or the render did not finish in
+            # PDF_RENDER_TIMEOUT: the bounded queue shedding load
+            return busy()
+        response = FileResponse(
+            pdf,
+            as_attachment=True,
+            filename=filename,
+            content_type="application/pdf",
+        )
+
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    return response
@@ -0,0 +1,215 @@
+import functools
+import math
+import random
+import threading
+import time
+import uuid
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+# Admission control in front of LLM generation. Answers that are already
+# cached are served to anyone; a new generation costs the client a token
+# from two buckets, one per session and one per IP, and holds one of a
+# fixed number of generation slots (a generation is one report: several
+# LLM calls plus hedges). Over either limit the request is shed at once
+# with a 429 and Retry-After instead of queueing behind the upstream calls
+# of everyone else. Queued jobs (aiapp/jobs.py) hold a slot too.
+#
+# State is kept in the default cache. Set REDIS_URL in production: only
+# then do the limits hold across web workers, job workers and hosts; with
+# the in-memory cache each process counts on its own. Reads and writes
+# are not atomic: a client racing itself across workers can slip a request
+# or two past its bucket, which is fine for shedding load.
+
+PREFIX = "ratelimit"
+
+stats = {
+    "admitted": 0,
+    "session_limited": 0,
+    "ip_limited": 0,
+    "busy": 0,
+}
+
+_lock = threading.Lock()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _count(name):
+    with _lock:
+        stats[name] += 1
+
+
+class Throttled(Exception):
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+# -------------------- CLIENTS --------------------
+def client_ip(request):
+    # Each proxy in front of us appends the address it saw; the entry added
+    # by the outermost trusted one is the client. Anything left of it was
+    # sent by the client and could be made up. With no trusted proxy the
+    # header is ignored.
+    proxies = _setting("RATE_LIMIT_PROXY_COUNT", 0)
+    forwarded = [a.strip() for a in request.headers.get("X-Forwarded-For", "").split(",") if a.strip()]
+    if proxies and len(forwarded) >= proxies:
+        return forwarded[-proxies]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def _buckets(request, session_key):
+    # (stat, cache key, per minute, burst); a rate of 0 turns a bucket off
+    buckets = []
+    if session_key:
+        buckets.append((
+            "session_limited",
+            f"{PREFIX}:session:{session_key}",
+            _setting("RATE_LIMIT_SESSION_PER_MINUTE", 6),
+            _setting("RATE_LIMIT_SESSION_BURST", 3),
+        ))
+    buckets.append((
+        "ip_limited",
+        f"{PREFIX}:ip:{client_ip(request)}",
+        _setting("RATE_LIMIT_IP_PER_MINUTE", 30),
+        _setting("RATE_LIMIT_IP_BURST", 15),
+    ))
+    return [b for b in buckets if b[2] > 0]
+
+
+# -------------------- TOKEN BUCKETS --------------------
+# GCRA form of a token bucket: each key stores the time at which the
+# bucket will be full again, so one value per client and no refill job.
+def _spend(buckets, stored, now):
+    updates = {}
+    for stat, key, per_minute, burst in buckets:
+        interval = 60.0 / per_minute
+        full_at = max(stored.get(key) or now, now) + interval
+        wait = full_at - now - burst * interval
+        if wait > 0:
+            _count(stat)
+            raise Throttled("Too many reports requested; please wait a moment", wait)
+        updates[key] = full_at
+    timeout = math.ceil(max(updates.values(), default=now) - now) + 1
+    return updates, timeout
+
+
+def take(request):
+    buckets = _buckets(request, request.session.session_key)
+    if not buckets:
+        return
+    now = time.time()
+    updates, timeout = _spend(buckets, cache.get_many([b[1] for b in buckets]), now)
+    cache.set_many(updates, timeout)
+
+
+async def atake(request):
+    buckets = _buckets(request, request.session.session_key)
+    if not buckets:
+        return
+    now = time.time()
+    updates, timeout = _spend(buckets, await cache.aget_many([b[1] for b in buckets]), now)
+    await cache.aset_many(updates, timeout)
+
+
+# -------------------- GENERATION SLOTS --------------------
+# LLM_MAX_INFLIGHT cache keys, each held by at most one generation. A slot
+# expires after LLM_SLOT_TTL seconds, so a worker that dies mid-call cannot
+# leak it for longer than that.
+def _slot_keys():
+    return [f"{PREFIX}:slot:{i}" for i in range(_setting("LLM_MAX_INFLIGHT", 16))]
+
+
+def _busy():
+    _count("busy")
+    # Spread retries out rather than sending every shed client back at once
+    return Throttled("Report generation is busy; please try again shortly", random.uniform(1, 3))
+
+
+class Slot:
+    def __init__(self):
+        self.key = None
+        self.token = uuid.uuid4().hex
+
+    def acquire(self):
+        keys = _slot_keys()
+        taken = cache.get_many(keys)
+        free = [k for k in keys if k not in taken]
+        random.shuffle(free)
+        ttl = _setting("LLM_SLOT_TTL", 60)
+        for key in free:
+            if cache.add(key, self.token, ttl):
+                self.key = key
+                _count("admitted")
+                return self
+        raise _busy()
+
+    async def aacquire(self):
+        keys = _slot_keys()
+        taken = await cache.aget_many(keys)
+        free = [k for k in keys if k not in taken]
+        random.shuffle(free)
+        ttl = _setting("LLM_SLOT_TTL", 60)
+        for key in free:
+            if await cache.aadd(key, self.token, ttl):
+                self.key = key
+                _count("admitted")
+                return self
+        raise _busy()
+
+    def release(self):
+        # Only free the slot if it is still ours (it may have expired and
+        # been handed to someone else)
+        if self.key is not None and cache.get(self.key) == self.token:
+            cache.delete(self.key)
+        self.key = None
+
+    async def arelease(self):
+        if self.key is not None and await cache.aget(self.key) == self.token:
+            await cache.adelete(self.key)
+        self.key = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+    async def __aenter__(self):
+        return await self.aacquire()
+
+    async def __aexit__(self, *exc):
+        await self.arelease()
+
+
+# -------------------- RESPONSES --------------------
+def too_many_requests(error, response=None):
+    if response is None:
+        response = HttpResponse(f"{error}\n", status=429, content_type="text/plain; charset=utf-8")
+    response["Retry-After"] = str(error.retry_after)
+    return response
+
+
+def throttled(view):
+    # Turns Throttled raised by the view into a 429
+    if iscoroutinefunction(view):
+        @functools.wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            try:
+                return await view(request, *args, **kwargs)
+            except Throttled as e:
+                return too_many_requests(e)
+    else:
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            try:
+                return view(request, *args, **kwargs)
+            except Throttled as e:
+                return too_many_requests(e)
+    return wrapper
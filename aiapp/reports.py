@@ -0,0 +1,143 @@
+import hashlib
+import json
+
+from django.db import IntegrityError
+
+from aiapp import scoring
+from aiapp.models import Report
+from aiapp.timing import stage
+
+# Generated reports are stored once, keyed by a hash of their content. The
+# session only carries the report id (and the student's readiness score,
+# which is per-visitor), so saving a session no longer rewrites the whole
+# report on every POST.
+
+SESSION_KEY = "report_id"
+SCORE_KEY = "readiness_score"
+
+# Fields read when showing a report; the rest stay in the table
+LOAD_FIELDS = ("id", "kind", "content_hash", "data")
+
+
+def content_hash(kind, data):
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(f"{kind}\n{canonical}".encode()).hexdigest()
+
+
+def _fields(kind, data):
+    return {
+        "kind": kind,
+        "company": (data.get("company") or "")[:200],
+        "role1": (data.get("role1") or "")[:200],
+        "role2": (data.get("role2") or "")[:200],
+        "data": data,
+    }
+
+
+# -------------------- STORE --------------------
+def store(kind, data):
+    digest = content_hash(kind, data)
+    with stage("store"):
+        try:
+            report, _ = Report.objects.get_or_create(content_hash=digest, defaults=_fields(kind, data))
+        except IntegrityError:
+            # Another request stored the same report between our get and create
+            report = Report.objects.get(content_hash=digest)
+    return report
+
+
+async def astore(kind, data):
+    digest = content_hash(kind, data)
+    with stage("store"):
+        try:
+            report, _ = await Report.objects.aget_or_create(content_hash=digest, defaults=_fields(kind, data))
+        except IntegrityError:
+            report = await Report.objects.aget(content_hash=digest)
+    return report
+
+
+# -------------------- SESSION --------------------
+def remember(request, report):
+    request.session[SESSION_KEY] = report.pk
+    request.session.pop(SCORE_KEY, None)
+    request._report = report
+
+
+async def aremember(request, report):
+    await request.session.aset(SESSION_KEY, report.pk)
+    await request.session.apop(SCORE_KEY, None)
+    request._report = report
+
+
+def forget(request):
+    request.session.pop(SESSION_KEY, None)
+    request.session.pop(SCORE_KEY, None)
+    request._report = None
+
+
+async def aforget(request):
+    await request.session.apop(SESSION_KEY, None)
+    await request.session.apop(SCORE_KEY, None)
+    request._report = None
+
+
+def set_score(request, score):
+    request.session[SCORE_KEY] = score
+
+
+def form_ratings(skills, data):
+    # The readiness form posts each skill's radio value as a string; a
+    # missing one is unrated, anything else must be a valid rating
+    ratings = {}
+    for skill in skills:
+        value = data.get(skill["name"])
+        if value is None:
+            continue
+        rating = int(value) if value.isascii() and value.isdigit() else value
+        if not scoring.valid_rating(rating):
+            raise ValueError(f"Rating for {skill['name']!r} must be 0-{scoring.MAX_RATING}")
+        ratings[skill["name"]] = rating
+    return ratings
+
+
+# ratings: skill name -> 0..3 (scoring.valid_rating), from form_ratings or the API
+def readiness_score(skills, ratings):
+    total, count = 0, 0
+    for skill in skills:
+        val = ratings.get(skill["name"])
+        if val is not None:
+            total += val
+            count += 1
+    return int((total / (count * scoring.MAX_RATING)) * 100) if count else 0
+
+
+# -------------------- LOAD (once per request) --------------------
+def _output(report, score):
+    if report is None:
+        return None
+    output = dict(report.data)
+    if score is not None:
+        output["readinessScore"] = score
+    return output
+
+
+def load(request):
+    if not hasattr(request, "_report"):
+        pk = request.session.get(SESSION_KEY)
+        request._report = Report.objects.only(*LOAD_FIELDS).filter(pk=pk).first() if pk else None
+    return request._report
+
+
+async def aload(request):
+    if not hasattr(request, "_report"):
+        pk = await request.session.aget(SESSION_KEY)
+        request._report = await Report.objects.only(*LOAD_FIELDS).filter(pk=pk).afirst() if pk else None
+    return request._report
+
+
+def load_output(request):
+    return _output(load(request), request.session.get(SCORE_KEY))
+
+
+async def aload_output(request):
+    return _output(await aload(request), await request.session.aget(SCORE_KEY))
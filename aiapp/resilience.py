@@ -0,0 +1,353 @@
+import asyncio
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import aclosing
+
+from django.conf import settings
+
+from aiapp import llm
+
+# Call layer in front of aiapp.llm:
+#   - per-attempt timeout adapts to observed latency (p99 x 2, clamped)
+#   - a hedged second request goes out if the first is slower than p95
+#   - retryable failures are retried with full-jitter backoff
+#   - everything fits inside one overall deadline
+#   - a circuit breaker stops calling a provider that keeps failing
+# Callers get LLMUnavailable when no answer can be had in time and are
+# expected to fall back to local generators. Other errors (a bad request,
+# a rejected API key) are the caller's bug: they are raised as they are and
+# do not count against the provider.
+
+
+class LLMUnavailable(Exception):
+    pass
+
+
+stats = {
+    "calls": 0,
+    "successes": 0,
+    "failures": 0,
+    "retries": 0,
+    "hedges": 0,
+    "hedge_wins": 0,
+    "short_circuits": 0,
+}
+
+_lock = threading.Lock()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def count(name, n=1):
+    with _lock:
+        stats[name] += n
+
+
+# -------------------- LATENCY --------------------
+class LatencyWindow:
+    def __init__(self, size=200):
+        self.samples = deque(maxlen=size)
+        self.lock = threading.Lock()
+
+    def record(self, seconds):
+        with self.lock:
+            self.samples.append(seconds)
+
+    def percentile(self, q, minimum=20):
+        with self.lock:
+            if len(self.samples) < minimum:
+                return None
+            ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+latency = LatencyWindow()
+
+
+def attempt_timeout():
+    ceiling = _setting("LLM_TIMEOUT", llm.LLM_TIMEOUT)
+    p99 = latency.percentile(0.99)
+    if p99 is None:
+        return ceiling
+    return min(ceiling, max(_setting("LLM_TIMEOUT_MIN", 3.0), p99 * 2))
+
+
+def hedge_delay():
+    if not _setting("LLM_HEDGE", True):
+        return None
+    p95 = latency.percentile(0.95)
+    if p95 is None:
+        return None
+    return max(_setting("LLM_HEDGE_MIN", 0.5), p95)
+
+
+# -------------------- CIRCUIT BREAKER --------------------
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_at = 0.0
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < _setting("LLM_BREAKER_COOLDOWN", 30):
+                    return False
+                self.state = self.HALF_OPEN
+                self.probe_at = 0.0
+            # Half-open: one probe at a time decides whether to close. A probe
+            # that never reported back (cancelled request) expires.
+            now = time.monotonic()
+            if now - self.probe_at < _setting("LLM_BREAKER_COOLDOWN", 30):
+                return False
+            self.probe_at = now
+            return True
+
+    def success(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.probe_at = 0.0
+
+    def release(self):
+        # The provider answered, just not usefully: neither healthy nor down
+        with self.lock:
+            self.probe_at = 0.0
+
+    def failure(self):
+        with self.lock:
+            self.failures += 1
+            self.probe_at = 0.0
+            if self.state == self.HALF_OPEN or self.failures >= _setting("LLM_BREAKER_FAILURES", 5):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+breaker = CircuitBreaker()
+
+
+# -------------------- ERRORS --------------------
+def _transport_errors():
+    # aiapp.llm imports its HTTP clients lazily; one that was never loaded
+    # cannot have raised
+    errors = [TimeoutError]
+    requests = sys.modules.get("requests")
+    if requests is not None:
+        errors += [requests.Timeout, requests.ConnectionError]
+    httpx = sys.modules.get("httpx")
+    if httpx is not None:
+        errors += [httpx.TimeoutException, httpx.TransportError]
+    return tuple(errors)
+
+
+def retryable(error):
+    if isinstance(error, _transport_errors()):
+        return True
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    return status == 429 or (status is not None and status >= 500)
+
+
+def _backoff(attempt, remaining):
+    # Full jitter: uniform between 0 and the exponential cap
+    cap = _setting("LLM_RETRY_BACKOFF", 0.25) * 2 ** attempt
+    return min(remaining, random.uniform(0, cap))
+
+
+# -------------------- SYNC --------------------
+_executor = ThreadPoolExecutor(max_workers=llm.LLM_POOL_SIZE, thread_name_prefix="llm-hedge")
+
+
+def _hedged(prompt, timeout, deadline):
+    first = _executor.submit(llm.chat_completion, prompt, timeout)
+    pending = {first}
+
+    delay = hedge_delay()
+    if delay is not None:
+        done, _ = wait(pending, timeout=min(delay, deadline - time.monotonic()))
+        if not done and time.monotonic() < deadline:
+            count("hedges")
+            pending.add(_executor.submit(llm.chat_completion, prompt, timeout))
+
+    error = None
+    while pending:
+        done, pending = wait(pending, timeout=max(0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+        if not done:
+            raise TimeoutError("LLM deadline exceeded")
+        for future in done:
+            if future.exception() is None:
+                if future is not first:
+                    count("hedge_wins")
+                return future.result()
+            error = future.exception()
+    raise error
+
+
+def call(prompt):
+    count("calls")
+    deadline = time.monotonic() + _setting("LLM_DEADLINE", llm.LLM_TIMEOUT)
+    error = None
+
+    for attempt in range(_setting("LLM_RETRIES", 2) + 1):
+        if not breaker.allow():
+            count("short_circuits")
+            raise LLMUnavailable("LLM circuit open") from error
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        start = time.monotonic()
+        try:
+            content = _hedged(prompt, min(attempt_timeout(), remaining), deadline)
+        except Exception as e:
+            count("failures")
+            if not retryable(e):
+                breaker.release()
+                raise
+            breaker.failure()
+            error = e
+            count("retries")
+            time.sleep(_backoff(attempt, max(0, deadline - time.monotonic())))
+            continue
+
+        latency.record(time.monotonic() - start)
+        breaker.success()
+        count("successes")
+        return content
+
+    raise LLMUnavailable(str(error) if error else "LLM deadline exceeded") from error
+
+
+# -------------------- ASYNC --------------------
+async def _ahedged(prompt, timeout, deadline):
+    first = asyncio.ensure_future(llm.achat_completion(prompt, timeout))
+    pending = {first}
+
+    try:
+        delay = hedge_delay()
+        if delay is not None:
+            done, _ = await asyncio.wait(pending, timeout=min(delay, deadline - time.monotonic()))
+            if not done and time.monotonic() < deadline:
+                count("hedges")
+                pending.add(asyncio.ensure_future(llm.achat_completion(prompt, timeout)))
+
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=max(0, deadline - time.monotonic()),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                raise TimeoutError("LLM deadline exceeded")
+            for task in done:
+                if task.exception() is None:
+                    if task is not first:
+                        count("hedge_wins")
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        # The slower request is no longer needed
+        for task in pending:
+            task.cancel()
+
+
+async def acall(prompt):
+    count("calls")
+    deadline = time.monotonic() + _setting("LLM_DEADLINE", llm.LLM_TIMEOUT)
+    error = None
+
+    for attempt in range(_setting("LLM_RETRIES", 2) + 1):
+        if not breaker.allow():
+            count("short_circuits")
+            raise LLMUnavailable("LLM circuit open") from error
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        start = time.monotonic()
+        try:
+            content = await _ahedged(prompt, min(attempt_timeout(), remaining), deadline)
+        except Exception as e:
+            count("failures")
+            if not retryable(e):
+                breaker.release()
+                raise
+            breaker.failure()
+            error = e
+            count("retries")
+            await asyncio.sleep(_backoff(attempt, max(0, deadline - time.monotonic())))
+            continue
+
+        latency.record(time.monotonic() - start)
+        breaker.success()
+        count("successes")
+        return content
+
+    raise LLMUnavailable(str(error) if error else "LLM deadline exceeded") from error
+
+
+# -------------------- STREAMING --------------------
+# Deltas for the SSE page, behind the same breaker and deadline as acall. A
+# failure before the first delta is retried; after it the call cannot start
+# over, because the caller has already shown the text. No hedge: a second
+# stream would pay for every token twice.
+async def astream(prompt):
+    count("calls")
+    deadline = time.monotonic() + _setting("LLM_DEADLINE", llm.LLM_TIMEOUT)
+    error = None
+
+    for attempt in range(_setting("LLM_RETRIES", 2) + 1):
+        if not breaker.allow():
+            count("short_circuits")
+            raise LLMUnavailable("LLM circuit open") from error
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        start = time.monotonic()
+        started = False
+        try:
+            async with aclosing(llm.astream_completion(prompt, min(attempt_timeout(), remaining))) as deltas:
+                async for delta in deltas:
+                    if time.monotonic() > deadline:
+                        raise TimeoutError("LLM deadline exceeded")
+                    started = True
+                    yield delta
+        except Exception as e:
+            count("failures")
+            if not retryable(e):
+                breaker.release()
+                raise
+            breaker.failure()
+            if started:
+                raise LLMUnavailable(str(e)) from e
+            error = e
+            count("retries")
+            await asyncio.sleep(_backoff(attempt, max(0, deadline - time.monotonic())))
+            continue
+
+        latency.record(time.monotonic() - start)
+        breaker.success()
+        count("successes")
+        return
+
+    raise LLMUnavailable(str(error) if error else "LLM deadline exceeded") from error
@@ -0,0 +1,136 @@
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+
+
+# -------------------- HELPERS --------------------
+def normalize_list(items):
+    normalized = []
+    for it in items:
+        if isinstance(it, dict):
+            normalized.append({"name": it.get("name", "")})
+        elif isinstance(it, str):
+            normalized.append({"name": it})
+        else:
+            normalized.append({"name": str(it)})
+    return normalized
+
+
+# -------------------- CATALOG --------------------
+# Tracks live in data/roadmap_catalog.json. The file is read once per
+# process and every keyword phrase goes into one dict keyed by its word
+# tuple, so classifying a role costs the same however many tracks exist.
+CATALOG_PATH = Path(__file__).resolve().parent / "data" / "roadmap_catalog.json"
+
+WORD = re.compile(r"[a-z0-9+#]+")
+
+
+def _words(text):
+    return tuple(WORD.findall((text or "").lower()))
+
+
+@lru_cache(maxsize=None)
+def catalog():
+    with open(CATALOG_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+
+    phrases = {}
+    for index, track in enumerate(data["tracks"]):
+        for keyword in track.get("keywords", []):
+            # First track listing a phrase owns it
+            phrases.setdefault(_words(keyword), index)
+
+    return {
+        "tracks": data["tracks"],
+        "by_name": {t["name"]: t for t in data["tracks"]},
+        "default": data["default"],
+        "phrases": phrases,
+        "longest": max((len(p) for p in phrases), default=0),
+    }
+
+
+@lru_cache(maxsize=4096)
+def classify(role):
+    # Earlier tracks in the file take priority, e.g. "AI web developer" is ai
+    cat = catalog()
+    phrases = cat["phrases"]
+    words = _words(role)
+
+    best = None
+    for i in range(len(words)):
+        for n in range(1, min(cat["longest"], len(words) - i) + 1):
+            index = phrases.get(words[i:i + n])
+            if index is not None and (best is None or index < best):
+                best = index
+    return cat["tracks"][best]["name"] if best is not None else cat["default"]
+
+
+# -------------------- ACADEMIC GAPS --------------------
+def generate_academic_gaps(role):
+    return catalog()["by_name"][classify(role)]["gaps"]
+
+
+# -------------------- DYNAMIC ROADMAP --------------------
+# Memoized per (class, track): the returned list is shared between callers
+# and must not be mutated.
+@lru_cache(maxsize=1024)
+def _roadmap(base, track):
+    steps = catalog()["by_name"][track]["steps"]
+
+    roadmap = []
+    for i in range(5):
+        roadmap.append({
+            "class": str(base + i),
+            "skills": steps[min(i, len(steps) - 1)]
+        })
+    return roadmap
+
+
+def generate_dynamic_roadmap(student_class, role):
+    return _roadmap(int(student_class), classify(role))
+
+
+# -------------------- REPORT --------------------
+DEFAULT_SKILLS = [
+    "Programming",
+    "Problem Solving",
+    "Data Structures",
+    "Projects",
+    "Technology Basics"
+]
+
+YOUTUBE = [
+    {"title": "freeCodeCamp", "url": "https://www.youtube.com/@freecodecamp"},
+    {"title": "Traversy Media", "url": "https://www.youtube.com/@TraversyMedia"},
+    {"title": "Programming with Mosh", "url": "https://www.youtube.com/@programmingwithmosh"}
+]
+
+GITHUB = [
+    {"title": "To-Do App", "description": "CRUD project", "url": "https://github.com/topics/todo-app"},
+    {"title": "Portfolio Website", "description": "Showcase your work", "url": "https://github.com/topics/portfolio"},
+    {"title": "Chatbot", "description": "AI chatbot", "url": "https://github.com/topics/chatbot"}
+]
+
+INTERNSHIPS = [
+    {"company": "Internshala", "role": "Python Intern", "url": "https://internshala.com"}
+]
+
+
+def build_roadmap_report(company, role1, student_class):
+    roadmap = generate_dynamic_roadmap(student_class, role1)
+    gaps = generate_academic_gaps(role1)
+
+    return {
+        "company": company,
+        "role1": role1,
+        "studentClass": student_class,
+        "roadmap": roadmap,
+        "role1Skills": normalize_list(DEFAULT_SKILLS),
+        "academicGaps": gaps,
+        "youtubePlaylists": YOUTUBE,
+        "githubProjects": GITHUB,
+        "internships": INTERNSHIPS,
+        "estimatedTime": "4-6 years",
+        "readinessScore": 0
+    }
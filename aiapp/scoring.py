@@ -0,0 +1,119 @@
+import importlib.util
+import math
+from bisect import bisect_right
+
+# optional: pip install numpy. Imported by the first vectorized pass, not
+# at worker start (capstone001.api imports this module via the URLconf).
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+
+# Readiness scores for a whole class in one pass. Input is a matrix with
+# one row per student and one column per skill of the report's role1Skills,
+# each cell a rating 0-3 or None (not rated). A student's score follows
+# reports.readiness_score: unrated skills are left out. With NumPy the
+# pass is vectorized; without it the same numbers come from plain loops.
+
+MAX_RATING = 3
+VALID_RATINGS = tuple(range(MAX_RATING + 1))
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def _invalid(row, column):
+    return ValueError(f"Row {row}, column {column}: ratings must be 0-{MAX_RATING} or null")
+
+
+# -------------------- VALIDATION --------------------
+# The one rule for a rating, shared by this batch, the single-student API
+# and the readiness form: an int 0-3, or None for not rated. bool and float
+# are refused even though True == 1 and 2.0 == 2. Checked in Python for
+# both passes, so it does not depend on what is installed: NumPy would
+# accept "2" and read NaN as "not rated".
+def valid_rating(value):
+    return value is None or (type(value) is int and 0 <= value <= MAX_RATING)
+
+
+_RATING_TYPES = {int, type(None)}
+
+
+def _check(matrix, width):
+    allowed = {None, *VALID_RATINGS}
+    for i, row in enumerate(matrix):
+        if not isinstance(row, (list, tuple)) or len(row) != width:
+            raise ValueError(f"Every row needs {width} ratings (numbers or null)")
+        # Whole-row set checks run in C; the cell is only looked for on error
+        try:
+            ok = _RATING_TYPES.issuperset(map(type, row)) and allowed.issuperset(row)
+        except TypeError:
+            ok = False
+        if not ok:
+            raise _invalid(i, next(j for j, value in enumerate(row) if not valid_rating(value)))
+
+
+# -------------------- NUMPY --------------------
+def _pass_numpy(matrix, width):
+    import numpy as np
+
+    # None becomes NaN, which marks the unrated cells
+    a = np.array(matrix, dtype=float).reshape(len(matrix), width)
+    rated = ~np.isnan(a)
+
+    filled = np.where(rated, a, 0.0)
+    count = rated.sum(axis=1)
+    total = filled.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(count > 0, np.floor(total / (count * 3) * 100), 0).astype(int)
+
+    ordered = np.sort(scores)
+    ranks = np.searchsorted(ordered, scores, side="right")
+    return scores.tolist(), ranks.tolist(), filled.sum(axis=0).tolist(), rated.sum(axis=0).tolist(), ordered.tolist()
+
+
+# -------------------- PURE PYTHON --------------------
+def _pass_python(matrix, width):
+    scores = []
+    for row in matrix:
+        rated = [value for value in row if value is not None]
+        scores.append(int((sum(rated) / (len(rated) * 3)) * 100) if rated else 0)
+
+    skill_total, skill_count = [0] * width, [0] * width
+    for j, column in enumerate(zip(*matrix)):
+        rated = [value for value in column if value is not None]
+        skill_total[j], skill_count[j] = sum(rated), len(rated)
+
+    ordered = sorted(scores)
+    ranks = [bisect_right(ordered, score) for score in scores]
+    return scores, ranks, skill_total, skill_count, ordered
+
+
+# -------------------- API --------------------
+def score_class(skills, matrix, vectorized=None):
+    width = len(skills)
+    use_numpy = HAVE_NUMPY if vectorized is None else vectorized
+    if use_numpy and not HAVE_NUMPY:
+        raise RuntimeError("vectorized=True needs NumPy (pip install numpy)")
+
+    _check(matrix, width)
+    scores, ranks, skill_total, skill_count, ordered = (
+        _pass_numpy if use_numpy and matrix else _pass_python
+    )(matrix, width)
+
+    n = len(scores)
+    return {
+        "students": n,
+        "scores": scores,
+        # Share of the class scoring the same or lower
+        "percentiles": [round(100 * r / n, 1) for r in ranks],
+        "mean": round(sum(scores) / n, 1) if n else None,
+        "distribution": {
+            # Nearest-rank percentiles of the class's scores
+            f"p{p}": ordered[max(0, math.ceil(p / 100 * n) - 1)] if n else None
+            for p in PERCENTILES
+        },
+        "skills": [
+            {
+                "name": skill["name"],
+                "average": round(total / count, 2) if count else None,
+                "rated": int(count),
+            }
+            for skill, total, count in zip(skills, skill_total, skill_count)
+        ],
+    }
@@ -0,0 +1,204 @@
+import asyncio
+import os
+import socket
+import threading
+import time
+import weakref
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from aiapp.models import GenerationLock
+
+# Coalesces identical upstream calls.
+# Inside a process, callers with the same key wait on the first caller.
+# Across processes, a GenerationLock row elects one leader and the others
+# poll the shared result store (the LLM cache) until the answer lands.
+
+OWNER = f"{socket.gethostname()}:{os.getpid()}"
+
+_flights = {}
+_lock = threading.Lock()
+_async_flights = weakref.WeakKeyDictionary()
+
+stats = {
+    "leader_calls": 0,
+    "local_waits": 0,
+    "remote_waits": 0,
+    "upstream_saved": 0,
+}
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _count(*names):
+    with _lock:
+        for name in names:
+            stats[name] += 1
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+# -------------------- DB LOCK --------------------
+def _acquire(key):
+    now = timezone.now()
+    GenerationLock.objects.filter(key=key, expires_at__lte=now).delete()
+    try:
+        with transaction.atomic():
+            GenerationLock.objects.create(
+                key=key,
+                owner=OWNER,
+                expires_at=now + timedelta(seconds=_setting("SINGLEFLIGHT_LOCK_TTL", 30)),
+            )
+        return True
+    except IntegrityError:
+        return False
+
+
+def _release(key):
+    GenerationLock.objects.filter(key=key, owner=OWNER).delete()
+
+
+def _is_locked(key):
+    return GenerationLock.objects.filter(key=key, expires_at__gt=timezone.now()).exists()
+
+
+# -------------------- SYNC --------------------
+def _wait_remote(key, lookup, deadline):
+    interval = _setting("SINGLEFLIGHT_POLL_INTERVAL", 0.1)
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        value = lookup()
+        if value is not None:
+            return value
+        if not _is_locked(key):
+            # Leader gave up without storing a result
+            return lookup()
+    return None
+
+
+def _lead(key, fn, lookup):
+    deadline = time.monotonic() + _setting("SINGLEFLIGHT_LOCK_TTL", 30)
+
+    while True:
+        if _acquire(key):
+            try:
+                value = lookup()
+                if value is not None:
+                    return value
+                _count("leader_calls")
+                return fn()
+            finally:
+                _release(key)
+
+        value = _wait_remote(key, lookup, deadline)
+        if value is not None:
+            _count("remote_waits", "upstream_saved")
+            return value
+
+        if time.monotonic() >= deadline:
+            _count("leader_calls")
+            return fn()
+
+
+# fn() produces and stores the result, lookup() reads a stored one
+def do(key, fn, lookup):
+    with _lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+
+    if not leader:
+        flight.done.wait(_setting("SINGLEFLIGHT_LOCK_TTL", 30))
+        if flight.error is not None:
+            raise flight.error
+        if not flight.done.is_set():
+            return fn()
+        _count("local_waits", "upstream_saved")
+        return flight.result
+
+    try:
+        flight.result = _lead(key, fn, lookup)
+        return flight.result
+    except Exception as e:
+        flight.error = e
+        raise
+    finally:
+        with _lock:
+            _flights.pop(key, None)
+        flight.done.set()
+
+
+# -------------------- ASYNC --------------------
+async def _alead(key, afn, alookup):
+    deadline = time.monotonic() + _setting("SINGLEFLIGHT_LOCK_TTL", 30)
+    interval = _setting("SINGLEFLIGHT_POLL_INTERVAL", 0.1)
+
+    while True:
+        if await sync_to_async(_acquire)(key):
+            try:
+                value = await alookup()
+                if value is not None:
+                    return value
+                _count("leader_calls")
+                return await afn()
+            finally:
+                await sync_to_async(_release)(key)
+
+        while time.monotonic() < deadline:
+            await asyncio.sleep(interval)
+            value = await alookup()
+            if value is not None:
+                _count("remote_waits", "upstream_saved")
+                return value
+            if not await sync_to_async(_is_locked)(key):
+                break
+
+        if time.monotonic() >= deadline:
+            _count("leader_calls")
+            return await afn()
+
+
+async def ado(key, afn, alookup):
+    loop = asyncio.get_running_loop()
+    flights = _async_flights.setdefault(loop, {})
+
+    while (future := flights.get(key)) is not None:
+        try:
+            result = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # Only our own cancellation propagates. A cancelled leader
+            # (client went away) hands the call over to the first waiter
+            # that wakes up; the others loop and wait on that one.
+            if not future.cancelled():
+                raise
+        else:
+            _count("local_waits", "upstream_saved")
+            return result
+
+    future = flights[key] = loop.create_future()
+    try:
+        result = await _alead(key, afn, alookup)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        # Mark retrieved so a flight with no waiters does not log a warning
+        future.exception()
+        raise
+    finally:
+        if not future.done():
+            future.cancel()
+        if flights.get(key) is future:
+            flights.pop(key)
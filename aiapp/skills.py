@@ -0,0 +1,247 @@
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from itertools import chain
+
+from django.conf import settings
+from django.db.models import Count, Max
+
+from aiapp.models import Skill
+
+# Skill names from the model vary in spelling ("JS" / "JavaScript basics",
+# "Data Structures & Algorithms" / "DSA"). Names are first mapped onto the
+# Skill taxonomy (canonical name + aliases, held in memory per process);
+# set operations between two roles then compare normalized keys, with a
+# fuzzy match for anything the taxonomy does not know.
+
+WORD = re.compile(r"[a-z0-9+#]+")
+
+SYNONYMS = {
+    "js": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "dl": "deep learning",
+    "nlp": "natural language processing",
+    "dsa": "data structures algorithms",
+    "oop": "object oriented programming",
+    "oops": "object oriented programming",
+    "k8s": "kubernetes",
+    "db": "database",
+    "dbms": "database",
+    "databases": "database",
+    "html5": "html",
+    "css3": "css",
+    "nodejs": "node",
+    "reactjs": "react",
+    "apis": "api",
+    "stats": "statistics",
+    "maths": "mathematics",
+    "math": "mathematics",
+}
+
+# Filler that does not change which skill is meant
+FILLER = {
+    "and", "the", "of", "for", "in", "with", "to", "a", "an",
+    "basic", "basics", "fundamentals", "foundations", "intro", "introduction",
+    "skills", "skill", "knowledge", "concepts", "understanding", "programming", "language",
+}
+
+# Matching two roles' skill lists against each other
+FUZZY_RATIO = 0.85
+# Renaming a skill to a taxonomy entry is stricter: "Vuex" is not "Vue"
+INDEX_FUZZY_RATIO = 0.9
+
+# Taxonomy candidates sharing fewer trigrams than this are not compared
+MIN_GRAM_SCORE = 0.3
+MAX_CANDIDATES = 8
+PROBE_GRAMS = 6
+
+
+def _words(name):
+    words = []
+    for word in WORD.findall((name or "").lower()):
+        words.extend(SYNONYMS.get(word, word).split())
+    return words
+
+
+def skill_key(name):
+    # Version numbers ("Python 3") and filler are dropped unless nothing is left
+    words = _words(name)
+    kept = [w for w in words if w not in FILLER and not w.isdigit()] or words
+    return " ".join(sorted(set(kept)))
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _close(key, keys):
+    best, best_ratio = None, FUZZY_RATIO
+    for other in keys:
+        # Cheap length bound before the quadratic ratio
+        if 2 * min(len(key), len(other)) / (len(key) + len(other) or 1) < best_ratio:
+            continue
+        ratio = SequenceMatcher(None, key, other).ratio()
+        if ratio >= best_ratio:
+            best, best_ratio = other, ratio
+    return best
+
+
+# -------------------- TAXONOMY INDEX --------------------
+class SkillIndex:
+    # Exact lookups go through a dict of normalized keys. Anything else is
+    # matched on a trigram inverted index: the few terms sharing the most
+    # trigrams with the input are scored with difflib, best one wins.
+    def __init__(self, rows):
+        self.exact = {}
+        self.terms = []
+        self.postings = defaultdict(list)
+
+        for name, aliases in rows:
+            for alias in (name, *aliases):
+                key = skill_key(alias)
+                if not key or key in self.exact:
+                    continue
+                self.exact[key] = name
+                grams = frozenset(trigrams(key))
+                for gram in grams:
+                    self.postings[gram].append(len(self.terms))
+                self.terms.append((key, grams, name))
+
+    def __len__(self):
+        return len(self.terms)
+
+    def lookup(self, name):
+        key = skill_key(name)
+        if not key or key in self.exact:
+            return self.exact.get(key)
+
+        grams = trigrams(key)
+        # Candidates come from the rarer half of the input's trigrams, which a
+        # typo or two cannot all break; common ones ("  d", "ing") would pull
+        # in a large share of the index for nothing
+        probe = sorted(grams, key=lambda gram: len(self.postings.get(gram, ())))
+        probe = probe[:max(PROBE_GRAMS, len(probe) // 2)]
+        shared = Counter(chain.from_iterable(self.postings.get(gram, ()) for gram in probe))
+
+        candidates = []
+        for term, _ in shared.most_common(4 * MAX_CANDIDATES):
+            other = self.terms[term][1]
+            score = 2 * len(grams & other) / (len(grams) + len(other))
+            if score >= MIN_GRAM_SCORE:
+                candidates.append((score, term))
+        candidates.sort(reverse=True)
+
+        best, best_ratio = None, INDEX_FUZZY_RATIO
+        for _, term in candidates[:MAX_CANDIDATES]:
+            other, _, canonical = self.terms[term]
+            ratio = SequenceMatcher(None, key, other).ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = canonical, ratio
+        return best
+
+    def canonicalize(self, skills):
+        # Renames known skills to their canonical name and drops duplicates
+        # that only differed in spelling; unknown names are kept as given
+        result, seen = [], set()
+        for skill in skills:
+            name = self.lookup(skill["name"]) or skill["name"]
+            key = skill_key(name)
+            if key in seen:
+                continue
+            seen.add(key)
+            result.append({**skill, "name": name})
+        return result
+
+
+# One index per process, rebuilt when the Skill table changes. The table is
+# checked at most every SKILL_INDEX_TTL seconds.
+_index = None
+_version = None
+_checked = 0.0
+_index_lock = threading.Lock()
+
+
+def _stale():
+    return _index is None or time.monotonic() - _checked > getattr(settings, "SKILL_INDEX_TTL", 60)
+
+
+def _install(version, rows):
+    global _index, _version, _checked
+    if rows is not None:
+        _index = SkillIndex(rows)
+        _version = version
+    _checked = time.monotonic()
+    return _index
+
+
+def _table_version():
+    return Skill.objects.aggregate(count=Count("id"), updated=Max("updated"))
+
+
+def get_index():
+    if not _stale():
+        return _index
+    with _index_lock:
+        if not _stale():
+            return _index
+        version = _table_version()
+        rows = None
+        if version != _version or _index is None:
+            rows = list(Skill.objects.values_list("name", "aliases"))
+        return _install(version, rows)
+
+
+async def aget_index():
+    if not _stale():
+        return _index
+    version = await Skill.objects.aaggregate(count=Count("id"), updated=Max("updated"))
+    rows = None
+    if version != _version or _index is None:
+        rows = [row async for row in Skill.objects.values_list("name", "aliases")]
+    return _install(version, rows)
+
+
+def canonicalize(skills):
+    return get_index().canonicalize(skills)
+
+
+async def acanonicalize(skills):
+    return (await aget_index()).canonicalize(skills)
+
+
+# -------------------- SET OPERATIONS --------------------
+def compare(skills1, skills2):
+    # Returns (common, only1, only2); common keeps the first role's wording
+    index2 = {}
+    for skill in skills2:
+        index2.setdefault(skill_key(skill["name"]), skill)
+
+    common, only1, matched = [], [], set()
+    for skill in skills1:
+        key = skill_key(skill["name"])
+        if key not in index2:
+            key = _close(key, [k for k in index2 if k not in matched])
+        if key is not None and key not in matched:
+            matched.add(key)
+            common.append(skill)
+        else:
+            only1.append(skill)
+
+    only2 = [s for k, s in index2.items() if k not in matched]
+    return common, only1, only2
+
+
+def union(*lists):
+    merged = {}
+    for skills in lists:
+        for skill in skills:
+            key = skill_key(skill["name"])
+            if key not in merged and _close(key, merged) is None:
+                merged[key] = skill
+    return list(merged.values())
@@ -0,0 +1,59 @@
+import json
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from aiapp import llm_cache, reports, resilience
+from aiapp.models import Report
+from aiapp.roadmap import build_roadmap_report
+from capstone001 import api
+
+
+@override_settings(API_TOKEN="", RATE_LIMIT_GENERATIONS_PER_MINUTE=0, RATE_LIMIT_REQUESTS_PER_MINUTE=0)
+class CreateReportTests(TestCase):
+    def setUp(self):
+        llm_cache.clear_memory()
+
+    async def post(self, body):
+        return await self.async_client.post("/api/v1/reports/", json.dumps(body), content_type="application/json")
+
+    async def test_unusable_upstream_answer_is_a_json_502(self):
+        with mock.patch.object(resilience, "acall", return_value="Sorry, I cannot help with that."):
+            response = await self.post({
+                "kind": "comparison", "company": "Acme", "role": "Data Analyst", "compareRole": "Data Engineer",
+            })
+
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(response["Content-Type"], api.CONTENT_TYPE)
+        self.assertIn("Invalid AI response format", json.loads(response.content)["error"])
+
+    async def test_not_modified_keeps_vary(self):
+        response = await self.post({"company": "Acme", "role": "Data Analyst", "studentClass": 9})
+        self.assertEqual(response.status_code, 201)
+
+        url = response["Location"]
+        first = await self.async_client.get(url)
+        again = await self.async_client.get(url, headers={"If-None-Match": first["ETag"]})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again["Vary"], "Accept-Encoding")
+
+
+@override_settings(API_TOKEN="", RATE_LIMIT_REQUESTS_PER_MINUTE=0)
+class ReadinessTests(TestCase):
+    def setUp(self):
+        report = reports.store(Report.ROADMAP, build_roadmap_report("Acme", "Data Analyst", "9"))
+        self.url = f"/api/v1/reports/{report.content_hash}/readiness/"
+        self.skills = [skill["name"] for skill in report.data["role1Skills"]]
+
+    def post(self, ratings):
+        return self.client.post(self.url, json.dumps({"ratings": ratings}), content_type="application/json")
+
+    def test_bools_and_floats_are_rejected_as_in_the_batch(self):
+        for bad in (True, 2.0, 4, "2"):
+            with self.subTest(bad=bad):
+                self.assertEqual(self.post({self.skills[0]: bad}).status_code, 400)
+
+    def test_null_is_unrated(self):
+        body = json.loads(self.post({self.skills[0]: 3, self.skills[1]: None}).content)
+        self.assertEqual(body["readinessScore"], 100)
+        self.assertEqual(body["rated"], 1)
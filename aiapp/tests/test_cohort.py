@@ -0,0 +1,25 @@
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+ROSTER = b"student,class,company,role\nAda,Grade 10,Acme,Data Analyst\n"
+
+
+@override_settings(COHORT_WORKERS=0)
+class CohortUploadTests(TestCase):
+    def upload(self, client):
+        return client.post("/cohort/", {"roster": SimpleUploadedFile("roster.csv", ROSTER)})
+
+    async def test_anonymous_upload_is_sent_to_login(self):
+        response = await self.upload(self.async_client)
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("/admin/login/", response["Location"])
+
+    async def test_staff_upload_streams_results(self):
+        staff = await User.objects.acreate_user("teacher", password="pw", is_staff=True)
+        await self.async_client.aforce_login(staff)
+
+        response = await self.upload(self.async_client)
+        self.assertEqual(response.status_code, 200)
+        body = b"".join([line async for line in response.streaming_content])
+        self.assertIn(b'"student":"Ada"', body)
@@ -0,0 +1,99 @@
+import json
+from unittest import mock
+
+from django.test import TestCase
+
+from aiapp import comparison, llm_cache, resilience
+
+ROLE_ANSWER = json.dumps({
+    "skills": [{"name": "SQL", "description": "Queries", "level": "Beginner"}],
+    "schoolGaps": [{"name": "Statistics", "description": "Rarely taught"}],
+})
+
+TRANSITION_ANSWER = json.dumps({
+    "bridgeModules": [{"name": "Pipelines", "description": "Batch jobs"}],
+    "estimatedTime": "3 months",
+    "transitionAdvice": "Build one pipeline.",
+})
+
+
+async def answer(prompt):
+    return TRANSITION_ANSWER if "Comparison Role" in prompt else ROLE_ANSWER
+
+
+def stream_answer(size):
+    async def stream(prompt):
+        text = await answer(prompt)
+        for i in range(0, len(text), size):
+            yield text[i:i + size]
+    return stream
+
+
+class GenerateComparisonTests(TestCase):
+    def setUp(self):
+        llm_cache.clear_memory()
+
+    async def test_two_role_report(self):
+        with mock.patch.object(resilience, "acall", side_effect=answer) as acall:
+            output = await comparison.agenerate_comparison("Acme", "Data Analyst", "Data Engineer")
+
+        self.assertEqual(acall.call_count, 3)
+        self.assertEqual([s["name"] for s in output["commonSkills"]], ["SQL"])
+        self.assertEqual(output["estimatedTime"], "3 months")
+
+
+class StreamComparisonTests(TestCase):
+    def setUp(self):
+        llm_cache.clear_memory()
+
+    async def test_sections_arrive_while_the_model_writes(self):
+        with mock.patch.object(resilience, "astream", side_effect=stream_answer(5)) as astream, \
+                mock.patch.object(resilience, "acall") as acall:
+            events = [e async for e in comparison.astream_comparison("Acme", "Data Analyst", "Data Engineer")]
+
+        self.assertEqual(astream.call_count, 3)
+        acall.assert_not_called()
+        names = [data["name"] for event, data in events if event == "section"]
+        # Live sections first, then each part again once it is complete
+        self.assertLess(names.index("role1Skills"), names.index("commonSkills"))
+        self.assertIn("transitionAdvice", names)
+        self.assertEqual(events[-1][0], "done")
+        self.assertEqual([s["name"] for s in events[-1][1]["commonSkills"]], ["SQL"])
+        self.assertIsNotNone(await llm_cache.aget(comparison.role_key("Acme", "Data Analyst")))
+
+    async def test_list_sections_grow_item_by_item(self):
+        parser_events = []
+
+        async def emit(name, value):
+            parser_events.append((name, [s["name"] for s in value]))
+
+        two_skills = json.dumps({"skills": [{"name": "SQL"}, {"name": "Python"}], "schoolGaps": []})
+
+        async def stream(prompt):
+            for i in range(0, len(two_skills), 3):
+                yield two_skills[i:i + 3]
+
+        key, prompt, keys, meta, _ = comparison.build_parts("Acme", "Data Analyst", "Data Engineer")[0]
+        with mock.patch.object(resilience, "astream", side_effect=stream):
+            sections = await comparison.astream_part(key, prompt, keys, meta, emit)
+
+        self.assertEqual(parser_events[:2], [("skills", ["SQL"]), ("skills", ["SQL", "Python"])])
+        self.assertEqual([s["name"] for s in sections["skills"]], ["SQL", "Python"])
+
+
+class ParseSectionsTests(TestCase):
+    def setUp(self):
+        llm_cache.clear_memory()
+
+    def test_answer_without_any_expected_key_is_rejected(self):
+        with self.assertRaises(ValueError):
+            comparison.parse_sections('{"name": "Python"}', comparison.ROLE_KEYS)
+
+    async def test_truncated_answer_is_not_cached(self):
+        key, prompt, keys, meta, _ = comparison.build_parts("Acme", "Data Analyst", "Data Engineer")[0]
+        truncated = '{"skills": [{"name": "Python"}, {"name": "SQL"'
+
+        with mock.patch.object(resilience, "acall", return_value=truncated):
+            with self.assertRaises(ValueError):
+                await comparison.afetch_part(key, prompt, keys, meta)
+        self.assertIsNone(await llm_cache.aget(key))
@@ -0,0 +1,58 @@
+import tempfile
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from aiapp import pdf_cache, reports
+from aiapp.models import Report
+from aiapp.roadmap import build_roadmap_report
+
+COMPARISON = {
+    "company": "Acme",
+    "role1": "Data Analyst",
+    "role2": "Data Engineer",
+    "commonSkills": [{"name": "SQL", "description": "Queries", "level": "Intermediate"}],
+    "role1Only": [],
+    "role2Only": [],
+    "schoolGaps": [],
+    "bridgeModules": [],
+    "estimatedTime": "3 months",
+    "transitionAdvice": "Build pipelines.",
+}
+
+
+@override_settings(PDF_RENDER_WORKERS=0)
+class DownloadPdfTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        settings = override_settings(PDF_CACHE_DIR=tmp.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def remember(self, kind, data):
+        session = self.client.session
+        session[reports.SESSION_KEY] = reports.store(kind, data).pk
+        session.save()
+
+    def test_nothing_to_download(self):
+        self.assertEqual(self.client.get("/download/").status_code, 400)
+
+    def test_roadmap_report(self):
+        self.remember(Report.ROADMAP, build_roadmap_report("Acme", "Data Analyst", "9"))
+        response = self.client.get("/download/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('filename="report.pdf"', response["Content-Disposition"])
+
+    def test_comparison_report_uses_the_comparison_layout(self):
+        self.remember(Report.COMPARISON, COMPARISON)
+        response = self.client.get("/download/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('filename="skill_comparison_report.pdf"', response["Content-Disposition"])
+
+    def test_busy_renderer_is_a_503(self):
+        self.remember(Report.COMPARISON, COMPARISON)
+        with mock.patch.object(pdf_cache, "render", side_effect=TimeoutError("PDF renderer is busy")):
+            response = self.client.get("/download/")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], str(pdf_cache.BUSY_RETRY_AFTER))
@@ -0,0 +1,115 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from aiapp import jobs, ratelimit
+from aiapp.models import GenerationJob
+
+
+@override_settings(JOB_MAX_ATTEMPTS=2, JOB_RETRY_DELAY=5, JOB_VISIBILITY_TIMEOUT=60)
+class QueueTests(TestCase):
+    def expire(self, job):
+        GenerationJob.objects.filter(pk=job.pk).update(available_at=timezone.now() - timedelta(seconds=1))
+
+    def test_claim_takes_a_job_once(self):
+        job = jobs.enqueue("Acme", "Data Analyst", "")
+
+        claimed = jobs.claim("w1")
+        self.assertEqual(claimed.pk, job.pk)
+        self.assertEqual(claimed.status, GenerationJob.RUNNING)
+        self.assertEqual(claimed.attempts, 1)
+        self.assertEqual(claimed.locked_by, "w1")
+        self.assertIsNone(jobs.claim("w2"))
+
+    def test_silent_worker_loses_the_job_after_the_timeout(self):
+        job = jobs.enqueue("Acme", "Data Analyst", "")
+        jobs.claim("w1")
+        self.expire(job)
+
+        claimed = jobs.claim("w2")
+        self.assertEqual(claimed.locked_by, "w2")
+        self.assertEqual(claimed.attempts, 2)
+
+    def test_failure_is_retried_after_a_backoff(self):
+        jobs.enqueue("Acme", "Data Analyst", "")
+        job = jobs.claim("w1")
+        jobs.fail(job, ValueError("upstream said no"))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, GenerationJob.QUEUED)
+        self.assertGreater(job.available_at, timezone.now())
+        self.assertIsNone(jobs.claim("w1"))
+
+        self.expire(job)
+        self.assertEqual(jobs.claim("w1").attempts, 2)
+
+    def test_last_failure_goes_to_the_dead_letter(self):
+        job = jobs.enqueue("Acme", "Data Analyst", "")
+        for _ in range(2):
+            self.expire(job)
+            job = jobs.claim("w1")
+            jobs.fail(job, ValueError("upstream said no"))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, GenerationJob.DEAD)
+        self.assertEqual(job.error, "upstream said no")
+        self.expire(job)
+        self.assertIsNone(jobs.claim("w1"))
+
+    def test_timed_out_last_attempt_is_dead_not_retried(self):
+        job = jobs.enqueue("Acme", "Data Analyst", "")
+        for _ in range(2):
+            self.expire(job)
+            jobs.claim("w1")
+        self.expire(job)
+
+        self.assertIsNone(jobs.claim("w2"))
+        job.refresh_from_db()
+        self.assertEqual(job.status, GenerationJob.DEAD)
+        self.assertEqual(job.attempts, 2)
+
+    def test_complete_stores_the_result(self):
+        jobs.enqueue("Acme", "Data Analyst", "")
+        job = jobs.claim("w1")
+        jobs.complete(job, {"company": "Acme"})
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, GenerationJob.DONE)
+        self.assertEqual(job.result, {"company": "Acme"})
+
+    @override_settings(LLM_MAX_INFLIGHT=1)
+    def test_job_waits_for_a_free_slot_without_spending_an_attempt(self):
+        cache.clear()
+        jobs.enqueue("Acme", "Data Analyst", "Data Engineer")
+        job = jobs.claim("w1")
+
+        with ratelimit.Slot(), mock.patch.object(jobs, "generate_comparison") as generate:
+            jobs.run(job)
+        generate.assert_not_called()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, GenerationJob.QUEUED)
+        self.assertEqual(job.attempts, 0)
+        self.assertGreater(job.available_at, timezone.now())
+
+        self.expire(job)
+        with mock.patch.object(jobs, "generate_comparison", return_value={"company": "Acme"}):
+            jobs.run(jobs.claim("w1"))
+        job.refresh_from_db()
+        self.assertEqual(job.status, GenerationJob.DONE)
+
+
+class JobStatusTests(TestCase):
+    def test_only_the_enqueuing_session_sees_the_job(self):
+        self.client.get("/")
+        session = self.client.session
+        session.save()
+        job = jobs.enqueue("Acme", "Data Analyst", "Data Engineer", session.session_key)
+
+        self.assertEqual(self.client.get(f"/jobs/{job.pk}/").json()["status"], "queued")
+
+        self.client.cookies.clear()
+        self.assertEqual(self.client.get(f"/jobs/{job.pk}/").status_code, 404)
@@ -0,0 +1,57 @@
+from django.test import SimpleTestCase
+
+from aiapp.jsonstream import ObjectExtractor, extract_json, load_json_object
+
+
+class LoadJsonObjectTests(SimpleTestCase):
+    def test_object_inside_fenced_prose(self):
+        text = 'Sure {student}! ```json\n{"a": [1, "}"]}\n```\nAdapt {as needed}.'
+        self.assertEqual(load_json_object(text), {"a": [1, "}"]})
+
+    def test_stray_quote_before_the_object(self):
+        text = 'Use {"quotes} carefully.\n{"a": 1}'
+        self.assertEqual(load_json_object(text), {"a": 1})
+
+    def test_unbalanced_brace_before_the_object(self):
+        text = 'Missing close { here\n{"a": 1}'
+        self.assertEqual(extract_json(text), '{"a": 1}')
+
+    def test_truncated_object_gives_nothing(self):
+        self.assertIsNone(load_json_object('{"skills": [{"name": "Python"}, {"name": "SQL"'))
+        self.assertIsNone(load_json_object('```json\n{"skills": [{"name": "Python"}, {"name": "Pyt'))
+        self.assertIsNone(load_json_object('{"skills": [{"name": "Python"}], "done": tru'))
+
+    def test_no_object(self):
+        self.assertIsNone(load_json_object("no json {here"))
+        self.assertIsNone(load_json_object(""))
+
+
+def feed(text, size):
+    extractor = ObjectExtractor()
+    for i in range(0, len(text), size):
+        if extractor.feed(text[i:i + size]) is not None:
+            return extractor.result
+    return extractor.close()
+
+
+class ObjectExtractorTests(SimpleTestCase):
+    texts = [
+        'Sure {student}! ```json\n{"a": [1, "}", "\\"{"]}\n```\nAdapt {as needed}.',
+        'Use {"quotes} carefully.\n{"a": 1}',
+        'Missing close { here\n{"a": 1}',
+        '{"skills": [{"name": "Python"}, {"name": "SQL"',
+        '{"skills": [{"name": "Python"}, {"name": "Pyt',
+        "no json {here",
+    ]
+
+    def test_agrees_with_the_one_shot_scan_at_any_chunk_size(self):
+        for text in self.texts:
+            for size in (1, 2, 3, 7, len(text)):
+                with self.subTest(text=text, size=size):
+                    self.assertEqual(feed(text, size), load_json_object(text))
+
+    def test_object_is_returned_when_its_brace_arrives(self):
+        extractor = ObjectExtractor()
+        self.assertIsNone(extractor.feed('Here: {"a": [1, 2'))
+        self.assertEqual(extractor.feed(']} and more {'), {"a": [1, 2]})
+        self.assertEqual(extractor.raw, '{"a": [1, 2]}')
@@ -0,0 +1,20 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+
+class MetricsAccessTests(TestCase):
+    @override_settings(METRICS_TOKEN="")
+    def test_closed_without_a_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 401)
+
+    @override_settings(METRICS_TOKEN="s3cret")
+    def test_bearer_token(self):
+        self.assertEqual(self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code, 401)
+        response = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer s3cret")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "aiapp_llm_breaker_open")
+
+    @override_settings(METRICS_TOKEN="")
+    def test_staff_login(self):
+        self.client.force_login(User.objects.create_user("ops", is_staff=True))
+        self.assertEqual(self.client.get("/metrics").status_code, 200)
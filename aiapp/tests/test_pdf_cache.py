@@ -0,0 +1,49 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from aiapp import pdf_cache
+
+
+class PdfCacheTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        settings = override_settings(PDF_CACHE_DIR=self.dir, PDF_CACHE_MAX_BYTES=100, PDF_CACHE_EVICT_INTERVAL=300)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        pdf_cache._size = None
+
+    def test_hit_does_not_render(self):
+        with pdf_cache.get_or_render("aa11", lambda: b"first") as f:
+            self.assertEqual(f.read(), b"first")
+        with pdf_cache.get_or_render("aa11", lambda: self.fail("rendered twice")) as f:
+            self.assertEqual(f.read(), b"first")
+
+    def test_file_evicted_after_the_check_is_rendered_again(self):
+        pdf_cache.get_or_render("aa11", lambda: b"first").close()
+        real_open = open
+
+        def evicted_open(path, *args, **kwargs):
+            os.unlink(path)
+            return real_open(path, *args, **kwargs)
+
+        with mock.patch("builtins.open", evicted_open):
+            f = pdf_cache.get_or_render("aa11", lambda: b"again")
+        self.assertEqual(f.read(), b"again")
+
+    def test_directory_is_walked_only_when_over_the_limit(self):
+        pdf_cache.get_or_render("aa11", lambda: b"x" * 40).close()
+        with mock.patch.object(pdf_cache, "evict", wraps=pdf_cache.evict) as evict:
+            pdf_cache.get_or_render("bb22", lambda: b"x" * 40).close()
+            evict.assert_not_called()
+            os.utime(pdf_cache.cache_path("aa11"), (0, 0))
+            pdf_cache.get_or_render("cc33", lambda: b"x" * 40).close()
+            evict.assert_called_once()
+
+        self.assertFalse(pdf_cache.cache_path("aa11").exists())
+        self.assertTrue(pdf_cache.cache_path("cc33").exists())
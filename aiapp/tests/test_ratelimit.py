@@ -0,0 +1,68 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+
+from aiapp import ratelimit
+from capstone001 import views
+
+
+class ClientIpTests(TestCase):
+    def request(self):
+        return RequestFactory().get("/", HTTP_X_FORWARDED_FOR="6.6.6.6, 1.2.3.4", REMOTE_ADDR="10.0.0.1")
+
+    def test_forwarded_for_is_ignored_without_a_trusted_proxy(self):
+        self.assertEqual(ratelimit.client_ip(self.request()), "10.0.0.1")
+
+    @override_settings(RATE_LIMIT_PROXY_COUNT=1)
+    def test_one_proxy_trusts_only_the_address_it_added(self):
+        self.assertEqual(ratelimit.client_ip(self.request()), "1.2.3.4")
+
+
+@override_settings(LLM_MAX_INFLIGHT=1)
+class SlotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_slots_are_capped_and_released(self):
+        with ratelimit.Slot():
+            with self.assertRaises(ratelimit.Throttled):
+                ratelimit.Slot().acquire()
+        ratelimit.Slot().acquire().release()
+
+
+async def stream(*args):
+    yield "done", {"company": "Acme", "fallback": True}
+
+
+@override_settings(LLM_MAX_INFLIGHT=1, RATE_LIMIT_SESSION_PER_MINUTE=0, RATE_LIMIT_IP_PER_MINUTE=0)
+class StreamSlotTests(TestCase):
+    url = "/compare/stream/?company=Acme&jobRole=Data+Analyst&jobRoleCompare=Data+Engineer"
+
+    def setUp(self):
+        cache.clear()
+        patchers = [
+            mock.patch.object(views, "acached_comparison", return_value=None),
+            mock.patch.object(views, "astream_comparison", side_effect=stream),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def body(self, response):
+        return b"".join([chunk async for chunk in response.streaming_content]).decode()
+
+    async def test_unread_stream_holds_no_slot(self):
+        await self.async_client.get(self.url)
+        await ratelimit.Slot().aacquire()
+
+    async def test_slot_is_released_after_the_stream(self):
+        body = await self.body(await self.async_client.get(self.url))
+        self.assertIn("event: done", body)
+        await ratelimit.Slot().aacquire()
+
+    async def test_busy_stream_reports_an_error_event(self):
+        await ratelimit.Slot().aacquire()
+        body = await self.body(await self.async_client.get(self.url))
+        self.assertIn("event: error", body)
+        self.assertIn("busy", body)
@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.test import TestCase
+
+from aiapp import reports
+from aiapp.models import Report
+from aiapp.roadmap import build_roadmap_report
+from aiapp.tests.test_download import COMPARISON
+
+
+class ReportPageTests(TestCase):
+    def test_public_page_carries_no_csrf_token(self):
+        report = reports.store(Report.ROADMAP, build_roadmap_report("Acme", "Data Analyst", "9"))
+
+        response = self.client.get(f"/reports/{report.content_hash}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Cache-Control"], "public, max-age=86400")
+        self.assertNotContains(response, "csrfmiddlewaretoken")
+        self.assertNotIn(settings.CSRF_COOKIE_NAME, response.cookies)
+        self.assertContains(response, "Plan your own roadmap")
+
+    def test_comparison_uses_the_comparison_page(self):
+        report = reports.store(Report.COMPARISON, COMPARISON)
+
+        response = self.client.get(f"/reports/{report.content_hash}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Comparison Overview")
+        self.assertContains(response, "Data Engineer")
+        self.assertContains(response, "Build pipelines.")
+        self.assertNotContains(response, "Your Learning Journey")
+        self.assertNotContains(response, "csrfmiddlewaretoken")
+        self.assertNotContains(response, "Download PDF")
+        self.assertContains(response, "Compare your own roles")
+
+    def test_unknown_report(self):
+        self.assertEqual(self.client.get("/reports/" + "0" * 64 + "/").status_code, 404)
+
+
+class ReadinessFormTests(TestCase):
+    def setUp(self):
+        report = reports.store(Report.ROADMAP, build_roadmap_report("Acme", "Data Analyst", "9"))
+        session = self.client.session
+        session[reports.SESSION_KEY] = report.pk
+        session.save()
+        self.skills = [skill["name"] for skill in report.data["role1Skills"]]
+
+    def calculate(self, **ratings):
+        return self.client.post("/", {"action": "calculate", **ratings})
+
+    def test_score(self):
+        response = self.calculate(**{self.skills[0]: "3", self.skills[1]: "0"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["output"]["readinessScore"], 50)
+
+    def test_tampered_ratings_are_a_400(self):
+        for bad in ("9", "-1", "abc", "2.0", "", "\u0663"):
+            with self.subTest(bad=bad):
+                response = self.calculate(**{self.skills[0]: bad})
+                self.assertEqual(response.status_code, 400)
+                self.assertContains(response, "must be 0-3", status_code=400)
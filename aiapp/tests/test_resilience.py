@@ -0,0 +1,78 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from aiapp import jobs, llm, resilience
+from aiapp.models import GenerationJob
+
+
+class HttpError(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.response = mock.Mock(status_code=status)
+
+
+@override_settings(LLM_RETRIES=2, LLM_RETRY_BACKOFF=0, LLM_BREAKER_FAILURES=3, LLM_HEDGE=False)
+class CallTests(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(resilience, "breaker", resilience.CircuitBreaker())
+        self.breaker = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_client_error_is_raised_as_is_and_not_held_against_the_provider(self):
+        with mock.patch.object(llm, "chat_completion", side_effect=HttpError(401)) as chat:
+            for _ in range(5):
+                with self.assertRaises(HttpError):
+                    resilience.call("prompt")
+        self.assertEqual(chat.call_count, 5)
+        self.assertEqual(self.breaker.state, resilience.CircuitBreaker.CLOSED)
+        self.assertEqual(self.breaker.failures, 0)
+
+    def test_server_errors_are_retried_then_open_the_breaker(self):
+        with mock.patch.object(llm, "chat_completion", side_effect=HttpError(503)) as chat:
+            with self.assertRaises(resilience.LLMUnavailable):
+                resilience.call("prompt")
+            self.assertEqual(chat.call_count, 3)
+            self.assertEqual(self.breaker.state, resilience.CircuitBreaker.OPEN)
+
+            with self.assertRaises(resilience.LLMUnavailable):
+                resilience.call("prompt")
+            self.assertEqual(chat.call_count, 3)
+
+    async def test_async_client_error_is_raised_as_is(self):
+        with mock.patch.object(llm, "achat_completion", side_effect=HttpError(400)):
+            with self.assertRaises(HttpError):
+                await resilience.acall("prompt")
+        self.assertEqual(self.breaker.failures, 0)
+
+    async def test_stream_is_retried_only_before_the_first_delta(self):
+        attempts = []
+
+        async def flaky(prompt, timeout):
+            attempts.append(prompt)
+            if len(attempts) == 1:
+                raise HttpError(503)
+            yield '{"a": '
+            raise HttpError(503)
+
+        deltas = []
+        with mock.patch.object(llm, "astream_completion", side_effect=flaky):
+            with self.assertRaises(resilience.LLMUnavailable):
+                async for delta in resilience.astream("prompt"):
+                    deltas.append(delta)
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(deltas, ['{"a": '])
+        self.assertEqual(self.breaker.failures, 2)
+
+
+class FallbackJobTests(TestCase):
+    def test_job_with_a_fallback_result_is_retried_not_completed(self):
+        jobs.enqueue("Acme", "Data Analyst", "Data Engineer")
+        job = jobs.claim("w1")
+
+        with mock.patch.object(jobs, "generate_comparison", return_value={"fallback": True}):
+            jobs.run(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, GenerationJob.QUEUED)
+        self.assertIsNone(job.result)
@@ -0,0 +1,20 @@
+from django.test import SimpleTestCase
+
+from aiapp.roadmap import classify
+
+
+class ClassifyTests(SimpleTestCase):
+    def test_phrases(self):
+        self.assertEqual(classify("Machine Learning Engineer"), "ai")
+        self.assertEqual(classify("Full Stack Developer"), "web")
+        self.assertEqual(classify("Penetration Tester"), "security")
+        self.assertEqual(classify("Chef"), "general")
+
+    def test_compound_role_names(self):
+        self.assertEqual(classify("MLOps Engineer"), "ai")
+        self.assertEqual(classify("GenAI Developer"), "ai")
+        self.assertEqual(classify("Web3 Developer"), "web")
+        self.assertEqual(classify("Webmaster"), "web")
+
+    def test_earlier_track_wins(self):
+        self.assertEqual(classify("AI web developer"), "ai")
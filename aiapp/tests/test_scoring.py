@@ -0,0 +1,59 @@
+import unittest
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from aiapp import scoring
+
+SKILLS = [{"name": "SQL"}, {"name": "Python"}]
+
+
+class ValidRatingTests(SimpleTestCase):
+    def test_only_ints_in_range_or_none(self):
+        for value in (None, *scoring.VALID_RATINGS):
+            self.assertTrue(scoring.valid_rating(value), value)
+        for value in (-1, scoring.MAX_RATING + 1, True, False, 2.0, "2", [1], {}):
+            self.assertFalse(scoring.valid_rating(value), value)
+
+
+class ScoreClassTests(SimpleTestCase):
+    def modes(self):
+        yield False
+        if scoring.HAVE_NUMPY:
+            yield True
+
+    def test_scores_and_unrated_cells(self):
+        for vectorized in self.modes():
+            with self.subTest(vectorized=vectorized):
+                result = scoring.score_class(SKILLS, [[3, None], [1, 2], [None, None]], vectorized=vectorized)
+                self.assertEqual(result["scores"], [100, 50, 0])
+                self.assertEqual(result["skills"][0], {"name": "SQL", "average": 2.0, "rated": 2})
+
+    def test_non_numbers_are_rejected_whatever_is_installed(self):
+        for vectorized in self.modes():
+            for bad in ("2", float("nan"), 4, -1, True, 2.0, [1]):
+                with self.subTest(vectorized=vectorized, bad=bad):
+                    with self.assertRaisesRegex(ValueError, "Row 1, column 1"):
+                        scoring.score_class(SKILLS, [[0, 1], [2, bad]], vectorized=vectorized)
+
+    def test_ragged_rows_are_rejected(self):
+        for vectorized in self.modes():
+            with self.subTest(vectorized=vectorized):
+                with self.assertRaisesRegex(ValueError, "Every row needs 2 ratings"):
+                    scoring.score_class(SKILLS, [[0, 1], [2]], vectorized=vectorized)
+
+    def test_vectorized_without_numpy_says_so(self):
+        with mock.patch.object(scoring, "HAVE_NUMPY", False):
+            with self.assertRaisesRegex(RuntimeError, "NumPy"):
+                scoring.score_class(SKILLS, [[0, 1]], vectorized=True)
+            self.assertEqual(scoring.score_class(SKILLS, [[0, 1]])["scores"], [16])
+
+
+@unittest.skipUnless(scoring.HAVE_NUMPY, "NumPy is not installed")
+class VectorizedMatchesPythonTests(SimpleTestCase):
+    def test_same_result(self):
+        matrix = [[i % 4, None if i % 5 == 0 else (i * 7) % 4] for i in range(50)]
+        self.assertEqual(
+            scoring.score_class(SKILLS, matrix, vectorized=True),
+            scoring.score_class(SKILLS, matrix, vectorized=False),
+        )
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+
+from django.test import TransactionTestCase
+
+from aiapp import singleflight
+from aiapp.models import GenerationLock
+
+
+async def _nothing():
+    return None
+
+
+class AsyncFlightTests(TransactionTestCase):
+    async def test_followers_share_the_leaders_result(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        results = await asyncio.gather(*(singleflight.ado("k", fetch, _nothing) for _ in range(5)))
+
+        self.assertEqual(results, ["answer"] * 5)
+        self.assertEqual(len(calls), 1)
+
+    async def test_leader_failure_reaches_every_follower(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            raise ValueError("upstream said no")
+
+        results = await asyncio.gather(
+            *(singleflight.ado("k", fetch, _nothing) for _ in range(4)),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertFalse(await GenerationLock.objects.filter(key="k").aexists())
+
+    async def test_cancelled_leader_hands_over_to_one_follower(self):
+        calls = []
+        started = asyncio.Event()
+
+        async def fetch():
+            calls.append(1)
+            started.set()
+            await asyncio.sleep(0.1)
+            return "answer"
+
+        leader = asyncio.create_task(singleflight.ado("k", fetch, _nothing))
+        await started.wait()
+        followers = [asyncio.create_task(singleflight.ado("k", fetch, _nothing)) for _ in range(4)]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        results = await asyncio.wait_for(asyncio.gather(*followers), timeout=5)
+
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(results, ["answer"] * 4)
+        # The cancelled call plus exactly one takeover
+        self.assertEqual(len(calls), 2)
+
+    async def test_cancelled_follower_leaves_the_flight_running(self):
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        leader = asyncio.create_task(singleflight.ado("k", fetch, _nothing))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(singleflight.ado("k", fetch, _nothing))
+        await asyncio.sleep(0)
+
+        follower.cancel()
+        self.assertEqual(await leader, "answer")
+        self.assertTrue(follower.cancelled())
+
+
+class SyncFlightTests(TransactionTestCase):
+    def test_leader_failure_reaches_the_follower(self):
+        entered = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            entered.set()
+            release.wait(5)
+            raise ValueError("upstream said no")
+
+        errors = []
+
+        def run():
+            try:
+                singleflight.do("k", fetch, lambda: None)
+            except ValueError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=run)
+        leader.start()
+        entered.wait(5)
+        follower = threading.Thread(target=run)
+        follower.start()
+        time.sleep(0.1)  # let the follower join the flight
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(errors), 2)
@@ -0,0 +1,38 @@
+from django.test import TestCase
+
+from aiapp import skills
+from aiapp.models import Skill
+
+
+def named(*names):
+    return [{"name": n, "description": "", "level": ""} for n in names]
+
+
+class CanonicalizeTests(TestCase):
+    def setUp(self):
+        skills._index = None
+
+    def names(self, *given):
+        return [s["name"] for s in skills.canonicalize(named(*given))]
+
+    def test_aliases_and_typos(self):
+        self.assertEqual(self.names("python 3", "JS", "Kubernets"), ["Python", "JavaScript", "Kubernetes"])
+
+    def test_near_miss_is_not_renamed(self):
+        self.assertEqual(self.names("Vuex"), ["Vuex"])
+
+    def test_distinct_skills_keep_their_names(self):
+        self.assertEqual(self.names("NoSQL", "Spark", "Hadoop", "Unix", "GitHub"),
+                         ["NoSQL", "Spark", "Hadoop", "Unix", "GitHub"])
+
+    def test_pruned_aliases_are_gone_from_the_table(self):
+        self.assertNotIn("nosql", Skill.objects.get(name="MongoDB").aliases)
+        self.assertEqual(Skill.objects.get(name="Big Data").aliases, [])
+
+
+class CompareTests(TestCase):
+    def test_spelling_variants_count_as_common(self):
+        common, only1, only2 = skills.compare(named("Javascipt", "Docker"), named("JavaScript", "Go"))
+        self.assertEqual([s["name"] for s in common], ["Javascipt"])
+        self.assertEqual([s["name"] for s in only1], ["Docker"])
+        self.assertEqual([s["name"] for s in only2], ["Go"])
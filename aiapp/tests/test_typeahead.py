@@ -0,0 +1,19 @@
+from django.test import SimpleTestCase
+
+from aiapp import typeahead
+
+
+class MergeTests(SimpleTestCase):
+    def test_unseeded_names_need_enough_reports(self):
+        counts = [("Acme Corp", 2), ("acme  corp", 1), ("Buy cheap pills", 2), ("Initech", 1)]
+        merged = dict(typeahead._merge(counts, ["Google"], min_reports=3))
+        self.assertEqual(merged, {"Acme Corp": 3, "Google": 0})
+
+    def test_seed_names_are_always_suggested_with_their_counts(self):
+        merged = dict(typeahead._merge([("google", 1)], ["Google"], min_reports=3))
+        self.assertEqual(merged, {"Google": 1})
+
+    def test_lookup_ranks_by_reports(self):
+        index = typeahead.PrefixIndex([("Data Analyst", 2), ("Data Engineer", 5), ("Designer", 9)], limit=8)
+        self.assertEqual([v for v, _ in index.lookup("data", 8)], ["Data Engineer", "Data Analyst"])
+        self.assertEqual([v for v, _ in index.lookup("eng", 8)], ["Data Engineer"])
@@ -0,0 +1,163 @@
+import json
+import threading
+import time
+from pathlib import Path
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Count, Max
+
+from aiapp.llm_cache import normalize
+from aiapp.models import Report
+
+# Suggestions for the company and role inputs, so visitors pick names that
+# earlier reports (and cached LLM answers) already use. Each field is a
+# prefix trie held in memory; every node keeps its most popular entries, so
+# a lookup is one walk down the typed prefix. Popularity is the number of
+# stored reports using the name; seed names fill in before there are any.
+# The endpoint is public and cached, so a name nobody curated is only
+# suggested once TYPEAHEAD_MIN_REPORTS reports use it.
+
+SEED_PATH = Path(__file__).resolve().parent / "data" / "typeahead_seed.json"
+
+FIELDS = ("company", "role")
+
+# Deeper prefixes than this add little and cost memory
+MAX_DEPTH = 32
+
+
+class PrefixIndex:
+    def __init__(self, entries, limit):
+        # entries: (display value, count); matched from the start of any word
+        self.entries = sorted(entries, key=lambda e: (-e[1], e[0].lower()))
+        self.root = ({}, [])
+
+        for rank, (value, _) in enumerate(self.entries):
+            text = normalize(value)
+            starts = {0} | {i + 1 for i, c in enumerate(text) if c == " "}
+            for start in starts:
+                node = self.root
+                for c in text[start:start + MAX_DEPTH]:
+                    node = node[0].setdefault(c, ({}, []))
+                    # Entries arrive most popular first, so each list is
+                    # already ranked; a word may repeat within one entry
+                    if len(node[1]) < limit and (not node[1] or node[1][-1] != rank):
+                        node[1].append(rank)
+
+        self.top = list(range(min(limit, len(self.entries))))
+
+    def lookup(self, query, limit):
+        node = self.root
+        text = normalize(query)[:MAX_DEPTH]
+        if not text:
+            return [self.entries[i] for i in self.top[:limit]]
+        for c in text:
+            node = node[0].get(c)
+            if node is None:
+                return []
+        return [self.entries[i] for i in node[1][:limit]]
+
+
+# -------------------- DATA --------------------
+def _seed():
+    with open(SEED_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    return {"company": data["companies"], "role": data["roles"]}
+
+
+def _merge(counts, seeds, min_reports=1):
+    # Spellings differing only in case/spacing are one entry, shown as in
+    # the seed list or else the way most reports wrote it
+    merged = {}
+    for value, count in counts:
+        value = " ".join((value or "").split())
+        if not value:
+            continue
+        key = normalize(value)
+        total, best, best_count = merged.get(key, (0, value, -1))
+        if count > best_count:
+            best, best_count = value, count
+        merged[key] = (total + count, best, best_count)
+    seeded = set()
+    for value in seeds:
+        key = normalize(value)
+        total, _, _ = merged.get(key, (0, value, 0))
+        merged[key] = (total, value, 0)
+        seeded.add(key)
+    return [
+        (best, total)
+        for key, (total, best, _) in merged.items()
+        if key in seeded or total >= min_reports
+    ]
+
+
+def _load():
+    counts = {
+        "company": Report.objects.values_list("company").annotate(n=Count("id")),
+        "role": (
+            list(Report.objects.values_list("role1").annotate(n=Count("id")))
+            + list(Report.objects.values_list("role2").annotate(n=Count("id")))
+        ),
+    }
+    seeds = _seed()
+    limit = getattr(settings, "TYPEAHEAD_LIMIT", 8)
+    min_reports = getattr(settings, "TYPEAHEAD_MIN_REPORTS", 3)
+    return {
+        field: PrefixIndex(_merge(counts[field], seeds[field], min_reports), limit)
+        for field in FIELDS
+    }
+
+
+# -------------------- INDEX --------------------
+# Rebuilt per process when reports were added, checked at most every
+# TYPEAHEAD_TTL seconds.
+_indexes = None
+_version = None
+_checked = 0.0
+_lock = threading.Lock()
+
+
+def _stale():
+    return _indexes is None or time.monotonic() - _checked > getattr(settings, "TYPEAHEAD_TTL", 300)
+
+
+def get_indexes():
+    global _indexes, _version, _checked
+    if not _stale():
+        return _indexes
+    # Only the first request waits; while one thread rebuilds, the rest use
+    # the tries they already have
+    if not _lock.acquire(blocking=_indexes is None):
+        return _indexes
+    try:
+        if not _stale():
+            return _indexes
+        version = Report.objects.aggregate(count=Count("id"), created=Max("created"))
+        if version != _version or _indexes is None:
+            _indexes = _load()
+            _version = version
+        _checked = time.monotonic()
+    finally:
+        _lock.release()
+    return _indexes
+
+
+def _refresh():
+    try:
+        return get_indexes()
+    finally:
+        close_old_connections()
+
+
+async def aget_indexes():
+    if not _stale():
+        return _indexes
+    # Building the tries is CPU work; keep it off the event loop
+    return await sync_to_async(_refresh, thread_sensitive=False)()
+
+
+def suggest(indexes, field, query, limit=None):
+    most = getattr(settings, "TYPEAHEAD_LIMIT", 8)
+    limit = min(limit or most, most)
+    return [{"value": value, "reports": count} for value, count in indexes[field].lookup(query, limit)]
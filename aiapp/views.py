@@ -1,109 +1,16 @@
-import json
-import os
-import requests
-import random
-
-from django.http import HttpResponse
-from django.shortcuts import render, redirect
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-
-
-# -------------------- HELPERS --------------------
-def normalize_list(items):
-    normalized = []
-    for it in items:
-        if isinstance(it, dict):
-            normalized.append({"name": it.get("name", "")})
-        elif isinstance(it, str):
-            normalized.append({"name": it})
-        else:
-            normalized.append({"name": str(it)})
-    return normalized
-
-
-def extract_json(text):
-    if not text:
-        return None
-    text = text.replace("```json", "").replace("```", "").strip()
-    start = text.find("{")
-    end = text.rfind("}")
-    return text[start:end + 1] if start != -1 and end != -1 else None
-
-
-# -------------------- ACADEMIC GAPS --------------------
-def generate_academic_gaps(role):
-    role = role.lower()
-
-    if "ai" in role or "ml" in role:
-        return [
-            {"name": "Mathematics Foundation", "description": "Need stronger understanding of statistics and linear algebra"},
-            {"name": "Data Handling", "description": "Limited experience working with datasets"},
-            {"name": "Programming Depth", "description": "Need deeper Python and ML libraries knowledge"}
-        ]
-
-    elif "web" in role:
-        return [
-            {"name": "Frontend Basics", "description": "Weak understanding of HTML, CSS"},
-            {"name": "JavaScript Logic", "description": "Needs improvement in JS concepts"},
-            {"name": "Project Experience", "description": "Lack of real-world web projects"}
-        ]
-
-    else:
-        return [
-            {"name": "Problem Solving", "description": "Needs more logical thinking practice"},
-            {"name": "Data Structures", "description": "Weak understanding of DSA"},
-            {"name": "Project Building", "description": "Limited hands-on coding projects"}
-        ]
-
-
-# -------------------- DYNAMIC ROADMAP --------------------
-def generate_dynamic_roadmap(student_class, role):
-    base = int(student_class)
-    role = role.lower()
-
-    roadmap = []
-
-    for i in range(5):
-        current = base + i
-
-        if "ai" in role or "ml" in role:
-            steps = [
-                ["Learn Python basics", "Math fundamentals", "Simple ML concepts"],
-                ["Work with datasets", "Learn regression", "Mini ML project"],
-                ["Neural networks", "Use sklearn", "Kaggle practice"],
-                ["Deep learning intro", "Build AI app", "Deploy model"],
-                ["Specialize in AI", "Portfolio", "Internships"]
-            ]
-
-        elif "web" in role:
-            steps = [
-                ["HTML, CSS basics", "Build static pages"],
-                ["JavaScript basics", "DOM projects"],
-                ["React basics", "API integration"],
-                ["Backend + Database", "Full-stack project"],
-                ["Deploy apps", "Freelancing / internships"]
-            ]
-
-        else:
-            steps = [
-                ["Programming basics", "Logic building"],
-                ["Data structures", "Solve problems"],
-                ["OOP concepts", "Build projects"],
-                ["Advanced DSA", "System basics"],
-                ["Specialization", "Internships"]
-            ]
-
-        tasks = steps[i] if i < len(steps) else random.choice(steps)
-
-        roadmap.append({
-            "class": str(current),
-            "skills": tasks
-        })
-
-    return roadmap
+import io
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404, redirect
+from django.views.decorators.http import require_POST, require_safe
+
+from aiapp import cohort, pdf_cache, reports, typeahead
+from aiapp.models import Report
+from aiapp.roadmap import build_roadmap_report
+from aiapp.timing import render, stage
 
 
 # -------------------- HOME --------------------
@@ -113,30 +20,30 @@ def home(request):
 
     # RESET
     if request.method == "POST" and request.POST.get("action") == "reset":
-        request.session.pop("output", None)
+        reports.forget(request)
         return redirect("/")
 
     # READINESS SCORE
     if request.method == "POST" and request.POST.get("action") == "calculate":
-        output = request.session.get("output")
+        output = reports.load_output(request)
 
         skills = output.get("role1Skills", [])
-        total, count = 0, 0
+        try:
+            ratings = reports.form_ratings(skills, request.POST)
+        except ValueError as e:
+            return render(request, "index.html", {"output": output, "error": str(e)}, status=400)
 
-        for skill in skills:
-            val = request.POST.get(skill["name"])
-            if val is not None:
-                total += int(val)
-                count += 1
-
-        output["readinessScore"] = int((total / (count * 3)) * 100) if count else 0
-        request.session["output"] = output
+        # Only the score is per-student; the stored report stays shared
+        output["readinessScore"] = reports.readiness_score(skills, ratings)
+        reports.set_score(request, output["readinessScore"])
 
         return render(request, "index.html", {"output": output})
 
-    # LOAD SESSION
-    if request.method == "GET" and request.session.get("output"):
-        return render(request, "index.html", {"output": request.session.get("output")})
+    # LOAD SESSION (comparisons are shown on /compare/)
+    if request.method == "GET":
+        report = reports.load(request)
+        if report is not None and report.kind == Report.ROADMAP:
+            return render(request, "index.html", {"output": reports.load_output(request)})
 
     # GENERATE
     if request.method == "POST":
@@ -145,48 +52,10 @@ def home(request):
         role1 = request.POST.get("jobRole")
         student_class = request.POST.get("studentClass")
 
-        roadmap = generate_dynamic_roadmap(student_class, role1)
-        gaps = generate_academic_gaps(role1)
-
-        skills = normalize_list([
-            "Programming",
-            "Problem Solving",
-            "Data Structures",
-            "Projects",
-            "Technology Basics"
-        ])
-
-        youtube = [
-            {"title": "freeCodeCamp", "url": "https://www.youtube.com/@freecodecamp"},
-            {"title": "Traversy Media", "url": "https://www.youtube.com/@TraversyMedia"},
-            {"title": "Programming with Mosh", "url": "https://www.youtube.com/@programmingwithmosh"}
-        ]
-
-        github = [
-            {"title": "To-Do App", "description": "CRUD project", "url": "https://github.com/topics/todo-app"},
-            {"title": "Portfolio Website", "description": "Showcase your work", "url": "https://github.com/topics/portfolio"},
-            {"title": "Chatbot", "description": "AI chatbot", "url": "https://github.com/topics/chatbot"}
-        ]
-
-        internships = [
-            {"company": "Internshala", "role": "Python Intern", "url": "https://internshala.com"}
-        ]
-
-        output = {
-            "company": company,
-            "role1": role1,
-            "studentClass": student_class,
-            "roadmap": roadmap,
-            "role1Skills": skills,
-            "academicGaps": gaps,
-            "youtubePlaylists": youtube,
-            "githubProjects": github,
-            "internships": internships,
-            "estimatedTime": "4-6 years",
-            "readinessScore": 0
-        }
-
-        request.session["output"] = output
+        with stage("roadmap"):
+            output = build_roadmap_report(company, role1, student_class)
+
+        reports.remember(request, reports.store(Report.ROADMAP, output))
 
         return render(request, "index.html", {"output": output})
 
@@ -194,16 +63,98 @@ def home(request):
 
 
 # -------------------- PDF --------------------
+PDF_FILENAMES = {
+    Report.ROADMAP: "report.pdf",
+    Report.COMPARISON: "skill_comparison_report.pdf",
+}
+
+
 def download_pdf(request):
-    output = request.session.get("output")
+    report = reports.load(request)
+    output = reports.load_output(request)
+
+    if not output:
+        return HttpResponse("No data available", status=400)
+
+    # One URL for both pages: the layout follows the report in the session
+    return pdf_cache.serve(
+        request,
+        output,
+        kind=report.kind,
+        filename=PDF_FILENAMES[report.kind],
+    )
+
+
+# -------------------- PUBLIC REPORT PAGE --------------------
+@require_safe
+def report_page(request, digest):
+    report = get_object_or_404(Report.objects.only("content_hash", "kind", "data"), content_hash=digest)
+    request._report = report  # cached sections are keyed by its hash
+
+    # Stored reports never change, so shared caches may keep the page
+    template = "compare.html" if report.kind == Report.COMPARISON else "index.html"
+    response = render(request, template, {"output": report.data, "public": True})
+    response["Cache-Control"] = "public, max-age=86400"
+    return response
 
-    response = HttpResponse(content_type="application/pdf")
-    response["Content-Disposition"] = "attachment; filename=report.pdf"
 
-    pdf = canvas.Canvas(response, pagesize=letter)
+# -------------------- TYPEAHEAD --------------------
+@require_safe
+async def suggest(request):
+    field = request.GET.get("field")
+    if field not in typeahead.FIELDS:
+        return JsonResponse({"error": f"field must be one of: {', '.join(typeahead.FIELDS)}"}, status=400)
+
+    try:
+        limit = int(request.GET.get("limit") or 0)
+    except ValueError:
+        limit = 0
+
+    query = request.GET.get("q", "")
+    indexes = await typeahead.aget_indexes()
+    response = JsonResponse({
+        "field": field,
+        "q": query,
+        "results": typeahead.suggest(indexes, field, query, limit),
+    })
+    # Same URL, same answer until the tries are rebuilt: let the browser and
+    # any shared cache absorb repeated keystrokes
+    response["Cache-Control"] = f"public, max-age={settings.TYPEAHEAD_MAX_AGE}"
+    return response
 
-    pdf.drawString(100, 750, f"Company: {output['company']}")
-    pdf.drawString(100, 730, f"Role: {output['role1']}")
 
-    pdf.save()
+# -------------------- COHORT UPLOAD --------------------
+# Each upload can queue thousands of generations: staff only
+@staff_member_required
+@require_POST
+async def cohort_upload(request):
+    roster = request.FILES.get("roster")
+    if roster is None:
+        return HttpResponse("Upload a CSV file as 'roster'", status=400)
+
+    limit = settings.COHORT_MAX_ROWS
+    try:
+        text = io.TextIOWrapper(roster, encoding="utf-8-sig", newline="")
+        rows = list(islice(cohort.read_rows(text), limit + 1))
+    except (ValueError, UnicodeDecodeError) as e:
+        return HttpResponse(str(e), status=400)
+
+    if len(rows) > limit:
+        return HttpResponse(f"At most {limit} students per upload", status=413)
+
+    as_csv = request.GET.get("format") == "csv"
+
+    # Lines go out as worker processes finish each chunk
+    async def lines():
+        if as_csv:
+            yield cohort.csv_header()
+        async for result, _ in cohort.arun(rows, workers=settings.COHORT_WORKERS):
+            yield cohort.to_csv(result) if as_csv else cohort.to_ndjson(result)
+
+    response = StreamingHttpResponse(
+        lines(),
+        content_type="text/csv" if as_csv else "application/x-ndjson",
+    )
+    if as_csv:
+        response["Content-Disposition"] = "attachment; filename=cohort.csv"
     return response
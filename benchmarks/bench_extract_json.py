@@ -0,0 +1,79 @@
+"""Compare the old extract_json + json.loads against aiapp.jsonstream.
+
+Run from the repository root:
+
+    python benchmarks/bench_extract_json.py
+"""
+import json
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiapp.jsonstream import ObjectExtractor, load_json_object  # noqa: E402
+
+
+# The implementation this replaced (capstone001/views.py)
+def legacy_extract(text):
+    text = text.replace("```json", "").replace("```", "").strip()
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end == -1 or end < start:
+        return None
+    try:
+        return json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+
+
+def make_report(n_skills):
+    rng = random.Random(n_skills)
+    skill = lambda i: {  # noqa: E731
+        "name": f"Skill {i} {{core}}",
+        "description": "Uses \"quotes\", commas, and braces } { " * rng.randint(1, 4),
+        "level": rng.choice(["Beginner", "Intermediate", "Advanced"]),
+    }
+    return {
+        "role1Skills": [skill(i) for i in range(n_skills)],
+        "role2Skills": [skill(i) for i in range(n_skills)],
+        "schoolGaps": [skill(i) for i in range(n_skills // 2)],
+        "estimatedTime": "5-6 months",
+        "transitionAdvice": "Start small. Build projects.",
+    }
+
+
+def make_outputs(n_skills):
+    body = json.dumps(make_report(n_skills))
+    return {
+        "clean": body,
+        "fenced": "Here you go:\n```json\n" + body + "\n```",
+        "noisy": "Sure {student}! ```json\n" + body + "\n```\nNote: adapt {as needed}.",
+    }
+
+
+def chunked(text, size):
+    # As llm.astream_completion delivers it
+    extractor = ObjectExtractor()
+    for i in range(0, len(text), size):
+        result = extractor.feed(text[i:i + size])
+        if result is not None:
+            return result
+    return extractor.close()
+
+
+def main():
+    print(f"{'size':>8} {'case':>7} {'legacy ms':>10} {'new ms':>8} {'stream ms':>10}  parsed(legacy/new/stream)")
+    for n_skills in (10, 200, 2000):
+        for case, text in make_outputs(n_skills).items():
+            runs = max(3, 20000 // (n_skills * 5))
+            legacy = min(timeit.repeat(lambda: legacy_extract(text), number=runs, repeat=3)) / runs
+            new = min(timeit.repeat(lambda: load_json_object(text), number=runs, repeat=3)) / runs
+            stream = min(timeit.repeat(lambda: chunked(text, 64), number=runs, repeat=3)) / runs
+            ok = "/".join(str(r is not None) for r in (legacy_extract(text), load_json_object(text), chunked(text, 64)))
+            print(f"{len(text):>8} {case:>7} {legacy * 1e3:>10.3f} {new * 1e3:>8.3f} {stream * 1e3:>10.3f}  {ok}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Check worker start-up import time against a budget.
+
+Run from the repository root:
+
+    python benchmarks/bench_import.py [--budget-ms 350] [--runs 5] [--top 15]
+
+Imports the ASGI application and the URLconf (what a worker loads before
+its first response) in fresh interpreters under `python -X importtime`,
+and reports the best total and the slowest top-level imports. Exits with
+status 1 when the total exceeds the budget, or when a module that should
+load lazily (ReportLab, requests, httpx, NumPy) is imported at start-up.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STARTUP = "import capstone001.asgi; from django.urls import get_resolver; get_resolver().url_patterns"
+
+# Loaded by the first PDF, LLM call or vectorized scoring pass, never by
+# start-up
+LAZY = ("reportlab", "requests", "httpx", "numpy")
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure():
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE="capstone001.settings", PYTHONPATH=str(ROOT))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if result.returncode:
+        sys.exit(result.stderr)
+
+    # Modules print as they finish, so everything before "site" is the
+    # interpreter's own start-up; the rest is ours
+    modules, total, ours = {}, 0, False
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        depth = len(indent) // 2
+        if ours:
+            modules[name] = (int(cumulative), depth)
+            if depth == 0:
+                total += int(cumulative)
+        elif name == "site" and depth == 0:
+            ours = True
+    return total / 1000, modules
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=350)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    # Best of several runs: the first also pays for a cold disk cache
+    total, modules = min((measure() for _ in range(args.runs)), key=lambda r: r[0])
+
+    print(f"start-up imports: {total:.1f} ms (budget {args.budget_ms:.0f} ms, best of {args.runs})")
+    print(f"{'cumulative ms':>14}  module")
+    top = sorted((m for m in modules.items() if m[1][1] <= 1), key=lambda m: -m[1][0])
+    for name, (cumulative, _) in top[:args.top]:
+        print(f"{cumulative / 1000:>14.1f}  {name}")
+
+    failed = False
+    eager = [name for name in LAZY if name in modules]
+    if eager:
+        print(f"FAIL: imported at start-up: {', '.join(eager)}")
+        failed = True
+    if total > args.budget_ms:
+        print(f"FAIL: {total:.1f} ms is over the {args.budget_ms:.0f} ms budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
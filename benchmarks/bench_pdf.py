@@ -0,0 +1,82 @@
+"""Render 1, 10 and 100-page comparison reports with aiapp.pdf.
+
+Run from the repository root:
+
+    python benchmarks/bench_pdf.py [--workers 4]
+
+Reports time per document rendered inline, and the throughput of the
+process pool when several documents are rendered at once.
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiapp import pdf  # noqa: E402
+
+# Roughly 21 wrapped skill lines fit on a page
+SKILLS_PER_PAGE = 21
+
+
+def make_output(pages):
+    skill = lambda i: {  # noqa: E731
+        "name": f"Skill {i}",
+        "description": "A long explanation that wraps onto a second line of the page " * 2,
+        "level": "Intermediate",
+    }
+    per_section = max(1, (pages * SKILLS_PER_PAGE - 12) // 5)
+    return {
+        "company": "Example Corp",
+        "role1": "Data Analyst",
+        "role2": "ML Engineer",
+        "estimatedTime": "5-6 months",
+        "commonSkills": [skill(i) for i in range(per_section)],
+        "role1Only": [skill(i) for i in range(per_section)],
+        "role2Only": [skill(i) for i in range(per_section)],
+        "schoolGaps": [skill(i) for i in range(per_section)],
+        "bridgeModules": [skill(i) for i in range(per_section)],
+        "transitionAdvice": "Start with fundamentals. Build projects. " * 20,
+    }
+
+
+def count_pages(data):
+    return data.count(b"/Type /Page\n") or data.count(b"/Type /Page")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--jobs", type=int, default=8)
+    args = parser.parse_args()
+
+    pdf.styles()  # built once per process; exclude from timings
+
+    print(f"{'target':>6} {'pages':>6} {'inline ms':>10} {'pool docs/s':>12}")
+    for target in (1, 10, 100):
+        output = make_output(target)
+
+        start = time.perf_counter()
+        data = pdf.render("comparison", output)
+        inline = time.perf_counter() - start
+
+        # Warm the pool before timing it
+        pdf.render_in_pool("comparison", output, workers=args.workers, timeout=300)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.jobs) as threads:
+            list(threads.map(
+                lambda _: pdf.render_in_pool("comparison", output, workers=args.workers,
+                                             queue_size=args.jobs, timeout=300),
+                range(args.jobs),
+            ))
+        pooled = args.jobs / (time.perf_counter() - start)
+
+        print(f"{target:>6} {count_pages(data):>6} {inline * 1e3:>10.1f} {pooled:>12.1f}")
+
+    pdf.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Time rendering index.html for a stored roadmap report.
+
+Run from the repository root:
+
+    python benchmarks/bench_render.py [--requests 500]
+
+Renders the page the way a reload or a readiness recalculation does, with:
+
+  before     no stored report, so no {% cache %} block keeps anything: the
+             whole page renders, as it did before fragment caching
+  fragments  the report sections cached by content hash, so only the CSRF
+             tokens and the readiness score render
+
+Both use the project's template engine, which has Django's default cached
+loader (parsing happens once either way). Uses capstone001.settings with
+its in-memory cache (unset REDIS_URL).
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def make_output():
+    return {
+        "company": "Example Corp",
+        "role1": "Data Analyst",
+        "estimatedTime": "3 years",
+        "roadmap": [
+            {"class": c, "skills": [f"Skill {c}.{i} with a short explanation" for i in range(8)]}
+            for c in (8, 9, 10)
+        ],
+        "academicGaps": [
+            {"name": f"Gap {i}", "description": "Practice problems every week. " * 3} for i in range(5)
+        ],
+        "role1Skills": [{"name": f"Skill {i}"} for i in range(12)],
+        "youtubePlaylists": [
+            {"title": f"Channel {i}", "url": f"https://www.youtube.com/@channel{i}"} for i in range(10)
+        ],
+        "githubProjects": [
+            {"title": f"Project {i}", "description": "Build it end to end. " * 3,
+             "url": f"https://github.com/example/project{i}"}
+            for i in range(8)
+        ],
+        "internships": [
+            {"company": f"Company {i}", "role": "Intern", "url": f"https://example.com/jobs/{i}"}
+            for i in range(8)
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "capstone001.settings")
+    import django
+    django.setup()
+
+    from django.core.cache import cache
+    from django.template.loader import get_template
+    from django.test import RequestFactory
+
+    output = make_output()
+    factory = RequestFactory()
+    cache.clear()
+
+    def request(stored):
+        r = factory.get("/")
+        # What reports.load() leaves on the request for a stored report
+        r._report = SimpleNamespace(content_hash="0" * 64) if stored else None
+        return r
+
+    def run(render):
+        start = time.perf_counter()
+        for i in range(args.requests):
+            # Readiness recalculations change only the score
+            html = render({"output": {**output, "readinessScore": i % 100 + 1}})
+        return (time.perf_counter() - start) / args.requests * 1000, len(html)
+
+    scenarios = {
+        "before": lambda ctx: get_template("index.html").render(ctx, request(False)),
+        "fragments": lambda ctx: get_template("index.html").render(ctx, request(True)),
+    }
+
+    print(f"{args.requests} renders each")
+    print(f"{'':<10}{'ms/render':>10}{'bytes':>8}")
+    for name, render in scenarios.items():
+        render({"output": output})  # warm the loader and fragment cache
+        ms, size = run(render)
+        print(f"{name:<10}{ms:>10.3f}{size:>8}")
+
+
+if __name__ == "__main__":
+    main()
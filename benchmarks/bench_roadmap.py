@@ -0,0 +1,110 @@
+"""Per-call cost of aiapp.roadmap against the original inline generators.
+
+Run from the repository root:
+
+    python benchmarks/bench_roadmap.py
+
+Also times classification against a synthetic catalog with many extra
+tracks, to show that adding tracks does not make requests slower.
+"""
+import json
+import random
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiapp import roadmap  # noqa: E402
+
+ROLES = [
+    "AI engineer", "Machine Learning Researcher", "web developer", "Frontend Engineer",
+    "Data Analyst", "Software Engineer", "Android developer", "Product Manager",
+]
+
+
+# The implementation this replaced (aiapp/views.py)
+def legacy_roadmap(student_class, role):
+    base = int(student_class)
+    role = role.lower()
+    roadmap = []
+    for i in range(5):
+        current = base + i
+        if "ai" in role or "ml" in role:
+            steps = [
+                ["Learn Python basics", "Math fundamentals", "Simple ML concepts"],
+                ["Work with datasets", "Learn regression", "Mini ML project"],
+                ["Neural networks", "Use sklearn", "Kaggle practice"],
+                ["Deep learning intro", "Build AI app", "Deploy model"],
+                ["Specialize in AI", "Portfolio", "Internships"]
+            ]
+        elif "web" in role:
+            steps = [
+                ["HTML, CSS basics", "Build static pages"],
+                ["JavaScript basics", "DOM projects"],
+                ["React basics", "API integration"],
+                ["Backend + Database", "Full-stack project"],
+                ["Deploy apps", "Freelancing / internships"]
+            ]
+        else:
+            steps = [
+                ["Programming basics", "Logic building"],
+                ["Data structures", "Solve problems"],
+                ["OOP concepts", "Build projects"],
+                ["Advanced DSA", "System basics"],
+                ["Specialization", "Internships"]
+            ]
+        tasks = steps[i] if i < len(steps) else random.choice(steps)
+        roadmap.append({"class": str(current), "skills": tasks})
+    return roadmap
+
+
+def per_call(fn, number=20000):
+    calls = [(str(8 + i % 5), ROLES[i % len(ROLES)]) for i in range(number)]
+    start = timeit.default_timer()
+    for student_class, role in calls:
+        fn(student_class, role)
+    return (timeit.default_timer() - start) / number * 1e6
+
+
+def with_catalog(extra_tracks):
+    data = json.loads(roadmap.CATALOG_PATH.read_text(encoding="utf-8"))
+    filler = data["tracks"][-1]
+    for i in range(extra_tracks):
+        data["tracks"].insert(-1, {
+            "name": f"track{i}",
+            "keywords": [f"keyword{i}", f"other phrase {i}", f"role{i}"],
+            "steps": filler["steps"],
+            "gaps": filler["gaps"],
+        })
+
+    tmp = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+    json.dump(data, tmp)
+    tmp.close()
+
+    roadmap.CATALOG_PATH = Path(tmp.name)
+    roadmap.catalog.cache_clear()
+    roadmap.classify.cache_clear()
+    roadmap._roadmap.cache_clear()
+    return len(data["tracks"])
+
+
+def main():
+    print(f"{'implementation':<34}{'us/call':>10}")
+    print(f"{'legacy (rebuilds steps per year)':<34}{per_call(legacy_roadmap):>10.2f}")
+    print(f"{'catalog, memoized':<34}{per_call(roadmap.generate_dynamic_roadmap):>10.2f}")
+
+    # Uncached classification: one dict lookup per word n-gram
+    print()
+    print(f"{'tracks':<10}{'classify us/call (uncached)':>30}")
+    for extra in (0, 50, 500):
+        count = with_catalog(extra)
+        number = 20000
+        classify = roadmap.classify.__wrapped__
+        elapsed = timeit.timeit(lambda: [classify(r) for r in ROLES], number=number // len(ROLES))
+        print(f"{count:<10}{elapsed / number * 1e6:>30.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Time class-wide readiness scoring (aiapp.scoring) with and without NumPy.
+
+Run from the repository root:
+
+    python benchmarks/bench_scoring.py [--students 5000] [--skills 12] [--runs 5]
+
+Scores a random class (about 10% of cells unrated) with the pure-Python
+pass and, when NumPy is installed, the vectorized pass. Checks that both
+give identical results and compares them with calling
+reports.readiness_score once per student, as the HTML form does.
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiapp import scoring  # noqa: E402
+
+
+# reports.readiness_score, minus the Django import
+def readiness_score(skills, ratings):
+    total, count = 0, 0
+    for skill in skills:
+        val = ratings.get(skill["name"])
+        if val is not None:
+            total += int(val)
+            count += 1
+    return int((total / (count * 3)) * 100) if count else 0
+
+
+def best_of(runs, fn):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--skills", type=int, default=12)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    skills = [{"name": f"Skill {i}"} for i in range(args.skills)]
+    matrix = [
+        [None if rng.random() < 0.1 else rng.randint(0, 3) for _ in skills]
+        for _ in range(args.students)
+    ]
+    print(f"{args.students} students x {args.skills} skills, best of {args.runs}")
+
+    def one_by_one():
+        return [
+            readiness_score(skills, {s["name"]: v for s, v in zip(skills, row) if v is not None})
+            for row in matrix
+        ]
+
+    ms, expected = best_of(args.runs, one_by_one)
+    print(f"{'per student':<14}{ms:>10.1f} ms")
+
+    ms, python = best_of(args.runs, lambda: scoring.score_class(skills, matrix, vectorized=False))
+    print(f"{'pure python':<14}{ms:>10.1f} ms")
+    assert python["scores"] == expected
+
+    if scoring.np is None:
+        print("numpy not installed; skipping the vectorized pass")
+        return
+
+    ms, vectorized = best_of(args.runs, lambda: scoring.score_class(skills, matrix, vectorized=True))
+    print(f"{'numpy':<14}{ms:>10.1f} ms")
+    assert vectorized == python, "vectorized and pure-Python results differ"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Lookup cost of the in-memory skill taxonomy index (aiapp.skills).
+
+Run from the repository root:
+
+    python benchmarks/bench_skill_index.py [--skills 5000] [--lookups 20000]
+
+Builds the index from the taxonomy the migrations seed plus --skills
+synthetic entries, then times single lookups of canonical names, aliases,
+misspellings and unknown names (p50/p99/max per lookup). Also reports how
+many misspellings resolve to the intended skill, the cost of canonicalizing
+one LLM answer, and a linear difflib scan over every name for comparison.
+"""
+import argparse
+import importlib
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def setup():
+    import django
+    from django.conf import settings
+
+    settings.configure(
+        INSTALLED_APPS=["django.contrib.contenttypes", "aiapp"],
+        DATABASES={},
+        USE_TZ=True,
+    )
+    django.setup()
+
+
+def seeded():
+    # The Skill rows as migrated: 0009's list with 0011's pruning applied
+    seed = importlib.import_module("aiapp.migrations.0009_skill").SKILLS
+    pruned = importlib.import_module("aiapp.migrations.0011_prune_skill_aliases").PRUNED
+    return [(name, [a for a in aliases if a not in pruned.get(name, ())]) for name, _, aliases in seed]
+
+
+def synthetic(count, rng):
+    prefixes = ["Applied", "Advanced", "Cloud", "Distributed", "Embedded", "Quantum", "Mobile", "Secure"]
+    rows = []
+    for i in range(count):
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10)))
+        name = f"{rng.choice(prefixes)} {word.title()} {i}"
+        rows.append((name, [f"{word} {i}", f"{word}{i} basics"]))
+    return rows
+
+
+def typo(name, rng):
+    chars = list(name)
+    if len(chars) > 3:
+        i = rng.randrange(1, len(chars) - 1)
+        chars[i], chars[i + 1] = chars[i + 1], chars[i]
+    return "".join(chars)
+
+
+def timed(fn, inputs):
+    samples = []
+    for value in inputs:
+        start = time.perf_counter()
+        fn(value)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    us = lambda s: s * 1e6  # noqa: E731
+    return us(samples[len(samples) // 2]), us(samples[int(len(samples) * 0.99)]), us(samples[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--skills", type=int, default=5000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    args = parser.parse_args()
+
+    setup()
+    from aiapp import skills
+
+    rng = random.Random(7)
+    rows = seeded() + synthetic(args.skills, rng)
+
+    start = time.perf_counter()
+    index = skills.SkillIndex(rows)
+    print(f"index: {len(rows)} skills, {len(index)} terms, built in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    names = [name for name, _ in rows]
+    aliases = [alias for _, a in rows for alias in a]
+    targets = [rng.choice(names) for _ in range(args.lookups)]
+    cases = {
+        "canonical": [rng.choice(names) for _ in range(args.lookups)],
+        "alias": [rng.choice(aliases) for _ in range(args.lookups)],
+        "misspelled": [typo(name, rng) for name in targets],
+        "unknown": [f"Zz{rng.randrange(10**6)} weaving" for _ in range(args.lookups)],
+    }
+
+    print(f"{'lookup':<12}{'p50 us':>10}{'p99 us':>10}{'max us':>10}")
+    for case, inputs in cases.items():
+        p50, p99, worst = timed(index.lookup, inputs)
+        print(f"{case:<12}{p50:>10.1f}{p99:>10.1f}{worst:>10.1f}")
+
+    found = sum(index.lookup(m) == t for m, t in zip(cases["misspelled"], targets))
+    print(f"misspellings resolved to the intended skill: {found / len(targets):.1%}")
+
+    answer = [{"name": n} for n in ["Python 3", "JS", "ReactJS", "pyhton", "SQL queries", "Git and GitHub",
+                                    "DSA", "Communication skills", "Kubernetis", "Underwater basket weaving"]]
+    p50, p99, _ = timed(index.canonicalize, [answer] * 2000)
+    print(f"{'bulk x10':<12}{p50:>10.1f}{p99:>10.1f}")
+
+    # What matching every misspelling against every name would cost
+    keys = [skills.skill_key(n) for n in names]
+    sample = cases["misspelled"][:50]
+    p50, p99, _ = timed(lambda n: skills._close(skills.skill_key(n), keys), sample)
+    print(f"{'linear scan':<12}{p50:>10.1f}{p99:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
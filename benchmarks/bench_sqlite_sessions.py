@@ -0,0 +1,139 @@
+"""Hammer database-backed session writes from several processes.
+
+Run from the repository root:
+
+    python benchmarks/bench_sqlite_sessions.py [--processes 8] [--writes 300]
+
+Each process behaves like a web worker: every "request" loads a session,
+changes it and saves it, with Django's request-start/finish connection
+handling around it. The run is repeated against a fresh database with
+Django's default SQLite settings and with the tuned settings from
+capstone001/settings.py, and reports throughput, save latency and how
+many saves failed with "database is locked".
+"""
+import argparse
+import multiprocessing
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def database(mode, path):
+    from capstone001 import settings as project
+
+    db = {"ENGINE": "django.db.backends.sqlite3", "NAME": path}
+    if mode == "tuned":
+        tuned = project.DATABASES["default"]
+        for key in ("CONN_MAX_AGE", "CONN_HEALTH_CHECKS", "OPTIONS"):
+            db[key] = tuned[key]
+    return db
+
+
+def setup(mode, path):
+    import django
+    from django.conf import settings
+
+    settings.configure(
+        DATABASES={"default": database(mode, path)},
+        INSTALLED_APPS=["django.contrib.contenttypes", "django.contrib.sessions"],
+        SECRET_KEY="bench",
+        USE_TZ=True,
+    )
+    django.setup()
+
+
+def worker(mode, path, writes, start, results):
+    setup(mode, path)
+    from django.contrib.sessions.backends.db import SessionStore
+    from django.db import close_old_connections
+    from django.db.utils import OperationalError
+
+    session = SessionStore()
+    session["report_id"] = 0
+    session.save()
+    key = session.session_key
+
+    latencies = []
+    locked = 0
+    start.wait()
+    for i in range(writes):
+        close_old_connections()  # request_started
+        t = time.perf_counter()
+        try:
+            session = SessionStore(session_key=key)
+            session["report_id"] = i
+            session["readiness_score"] = i % 100
+            session.save()
+        except OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            locked += 1
+        latencies.append(time.perf_counter() - t)
+        close_old_connections()  # request_finished
+    results.put((latencies, locked))
+
+
+def run(mode, processes, writes):
+    tmp = tempfile.mkdtemp()
+    path = str(Path(tmp) / f"{mode}.sqlite3")
+
+    ctx = multiprocessing.get_context("spawn")
+    migrate = ctx.Process(target=migrate_db, args=(mode, path))
+    migrate.start()
+    migrate.join()
+
+    start = ctx.Event()
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(mode, path, writes, start, results)) for _ in range(processes)]
+    for p in procs:
+        p.start()
+    time.sleep(1)  # let every process finish django.setup()
+
+    t = time.perf_counter()
+    start.set()
+    collected = [results.get(timeout=600) for _ in procs]
+    elapsed = time.perf_counter() - t
+    for p in procs:
+        p.join()
+
+    latencies = sorted(x for lat, _ in collected for x in lat)
+    locked = sum(n for _, n in collected)
+    return {
+        "saves/s": (len(latencies) - locked) / elapsed,
+        "p50 ms": statistics.median(latencies) * 1000,
+        "p99 ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "max ms": latencies[-1] * 1000,
+        "locked": locked,
+    }
+
+
+def migrate_db(mode, path):
+    setup(mode, path)
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--writes", type=int, default=300)
+    args = parser.parse_args()
+
+    print(f"{args.processes} processes x {args.writes} session saves")
+    columns = ("saves/s", "p50 ms", "p99 ms", "max ms", "locked")
+    print(f"{'settings':<10}" + "".join(f"{c:>12}" for c in columns))
+    for mode in ("default", "tuned"):
+        row = run(mode, args.processes, args.writes)
+        print(f"{mode:<10}" + "".join(
+            f"{row[c]:>12}" if c == "locked" else f"{row[c]:>12.1f}" for c in columns
+        ))
+
+
+if __name__ == "__main__":
+    main()
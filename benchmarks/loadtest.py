@@ -0,0 +1,226 @@
+"""Drive a running server at fixed concurrency and record latency to JSON.
+
+Start the LLM stub and the app pointed at it, then run from the
+repository root:
+
+    python manage.py runllmstub --latency 800 --jitter 200 &
+    GROQ_API_URL=http://127.0.0.1:8765/openai/v1/chat/completions \\
+    RATE_LIMIT_SESSION_PER_MINUTE=0 RATE_LIMIT_IP_PER_MINUTE=0 \\
+        gunicorn capstone001.asgi:application -k uvicorn_worker.UvicornWorker -w 4 &
+    python benchmarks/loadtest.py --base-url http://127.0.0.1:8000 \\
+        --concurrency 1,8,32 --duration 10 --output load-v2.json --baseline load-v1.json
+
+Every scenario runs for --duration seconds at each concurrency level. Each
+virtual user has its own cookie jar and CSRF token, and generates one
+report up front so /download/ has something to serve. The JSON has
+throughput and p50/p90/p95/p99/max latency per (scenario, concurrency);
+--baseline prints the change against an earlier run. Leave the rate
+limits on to see how many requests are shed (counted as errors) instead.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CSRF_INPUT = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+COMPANIES = ["Google", "Infosys", "TCS", "Zoho", "Flipkart", "Razorpay", "Swiggy", "Wipro"]
+ROLES = ["AI engineer", "web developer", "data analyst", "software engineer", "android developer"]
+
+
+# -------------------- VIRTUAL USER --------------------
+class User:
+    def __init__(self, client, index):
+        self.client = client
+        self.index = index
+        self.calls = 0
+        self.token = ""
+
+    async def login(self):
+        # Picks up the CSRF cookie/token and stores one report in the session
+        page = await self.client.get("/")
+        match = CSRF_INPUT.search(page.text)
+        self.token = match.group(1) if match else ""
+        await self.generate()
+
+    def form(self, **fields):
+        return {"csrfmiddlewaretoken": self.token, **fields}
+
+    async def generate(self):
+        self.calls += 1
+        return await self.client.post("/", data=self.form(
+            company=COMPANIES[(self.index + self.calls) % len(COMPANIES)],
+            jobRole=ROLES[(self.index + self.calls) % len(ROLES)],
+            studentClass=str(8 + self.calls % 3),
+        ))
+
+    async def compare(self):
+        self.calls += 1
+        return await self.client.post("/compare/", data=self.form(
+            company=COMPANIES[(self.index + self.calls) % len(COMPANIES)],
+            jobRole=ROLES[self.calls % len(ROLES)],
+            jobRoleCompare=ROLES[(self.calls + 1) % len(ROLES)],
+        ))
+
+
+PREFIXES = ["g", "go", "inf", "t", "da", "data a", "web", "so", "and", "ai eng"]
+
+
+def suggest(user):
+    user.calls += 1
+    field = "company" if user.calls % 2 else "role"
+    return user.client.get("/suggest/", params={"field": field, "q": PREFIXES[user.calls % len(PREFIXES)]})
+
+
+SCENARIOS = {
+    "home": lambda user: user.client.get("/"),
+    "generate": lambda user: user.generate(),
+    "download": lambda user: user.client.get("/download/"),
+    "compare": lambda user: user.compare(),
+    "robots": lambda user: user.client.get("/robots.txt"),
+    "sitemap": lambda user: user.client.get("/sitemap.xml", headers={"Accept-Encoding": "gzip"}),
+    "suggest": suggest,
+}
+
+
+# -------------------- RUNNER --------------------
+def percentile(values, q):
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def run_level(base_url, scenario, concurrency, duration, timeout):
+    action = SCENARIOS[scenario]
+    latencies = []
+    errors = 0
+
+    clients = [httpx.AsyncClient(base_url=base_url, timeout=timeout) for _ in range(concurrency)]
+    users = [User(client, i) for i, client in enumerate(clients)]
+    try:
+        await asyncio.gather(*(user.login() for user in users))
+
+        deadline = time.perf_counter() + duration
+
+        async def loop(user):
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    response = await action(user)
+                    ok = response.status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                latencies.append(time.perf_counter() - start)
+                errors += not ok
+
+        started = time.perf_counter()
+        await asyncio.gather(*(loop(user) for user in users))
+        elapsed = time.perf_counter() - started
+    finally:
+        await asyncio.gather(*(client.aclose() for client in clients))
+
+    latencies.sort()
+    ms = lambda seconds: round(seconds * 1000, 2)  # noqa: E731
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "mean": ms(sum(latencies) / len(latencies)) if latencies else 0.0,
+            "p50": ms(percentile(latencies, 0.50)),
+            "p90": ms(percentile(latencies, 0.90)),
+            "p95": ms(percentile(latencies, 0.95)),
+            "p99": ms(percentile(latencies, 0.99)),
+            "max": ms(latencies[-1]) if latencies else 0.0,
+        },
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# -------------------- REPORTING --------------------
+def print_row(row, baseline=None):
+    lat = row["latency_ms"]
+    line = (
+        f"{row['scenario']:<10}{row['concurrency']:>6}{row['requests']:>9}{row['errors']:>8}"
+        f"{row['rps']:>10.1f}{lat['p50']:>10.1f}{lat['p95']:>10.1f}{lat['p99']:>10.1f}"
+    )
+    if baseline:
+        change = lambda new, old: f"{(new - old) / old * 100:+.0f}%" if old else "n/a"  # noqa: E731
+        line += (
+            f"   rps {change(row['rps'], baseline['rps'])}"
+            f"  p99 {change(lat['p99'], baseline['latency_ms']['p99'])}"
+        )
+    print(line, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenarios", default="home,generate,download,robots,sitemap",
+                        help=f"Comma-separated, from: {', '.join(SCENARIOS)}")
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per level")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Earlier --output file to compare against")
+    args = parser.parse_args()
+
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+    levels = [int(c) for c in args.concurrency.split(",")]
+
+    baseline = {}
+    if args.baseline:
+        for row in json.loads(Path(args.baseline).read_text())["results"]:
+            baseline[(row["scenario"], row["concurrency"])] = row
+
+    started = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    print(f"{'scenario':<10}{'conc':>6}{'reqs':>9}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    results = []
+    for scenario in scenarios:
+        for concurrency in levels:
+            row = asyncio.run(run_level(args.base_url, scenario, concurrency, args.duration, args.timeout))
+            results.append(row)
+            print_row(row, baseline.get((scenario, concurrency)))
+
+    if args.output:
+        report = {
+            "meta": {
+                "revision": git_revision(),
+                "base_url": args.base_url,
+                "duration": args.duration,
+                "started": started,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": results,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
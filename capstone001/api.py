@@ -0,0 +1,284 @@
+import gzip
+import hmac
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.http import parse_etags
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST, require_safe
+
+from aiapp import ratelimit, reports, scoring
+from aiapp.comparison import acached_comparison, agenerate_comparison
+from aiapp.models import Report
+from aiapp.roadmap import build_roadmap_report
+from aiapp.timing import stage
+from capstone001.seo import choose_encoding
+
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson
+    orjson = None
+
+# JSON endpoints for integrations (LMS, mobile app). Same report builders
+# and storage as the HTML views, but no templates, sessions or CSRF: a
+# report is addressed by its content hash.
+
+CONTENT_TYPE = "application/json"
+
+
+# ---------------------------------------------------
+# Serialization
+# ---------------------------------------------------
+def dumps(data):
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads(body):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def project(data, fields):
+    # ?fields=company,roadmap.class keeps those keys; dotted names reach
+    # into nested objects and into every object of a list
+    nested = {}
+    for field in fields:
+        head, _, rest = field.partition(".")
+        nested.setdefault(head, set()).add(rest)
+
+    out = {}
+    for key, rest in nested.items():
+        if key not in data:
+            continue
+        value = data[key]
+        if "" not in rest:
+            if isinstance(value, dict):
+                value = project(value, rest)
+            elif isinstance(value, list):
+                value = [project(v, rest) if isinstance(v, dict) else v for v in value]
+        out[key] = value
+    return out
+
+
+def api_response(request, data, status=200, etag=None):
+    fields = [f.strip() for f in request.GET.get("fields", "").split(",") if f.strip()]
+    if fields and isinstance(data.get("report"), dict):
+        data = {**data, "report": project(data["report"], fields)}
+
+    with stage("serialize"):
+        body = dumps(data)
+
+    coding = "identity"
+    if len(body) >= getattr(settings, "API_GZIP_MIN_BYTES", 512):
+        coding = choose_encoding(request, ("gzip",))
+
+    if etag is not None:
+        # One representation per field set and encoding
+        parts = [etag, ",".join(sorted(fields)), "" if coding == "identity" else coding]
+        etag = '"{}"'.format("-".join(filter(None, parts)))
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+            response["ETag"] = etag
+            response["Vary"] = "Accept-Encoding"
+            return response
+
+    if coding == "gzip":
+        body = gzip.compress(body, compresslevel=6)
+
+    response = HttpResponse(body, content_type=CONTENT_TYPE, status=status)
+    if coding != "identity":
+        response["Content-Encoding"] = coding
+    if etag is not None:
+        response["ETag"] = etag
+    response["Vary"] = "Accept-Encoding"
+    return response
+
+
+def api_error(request, message, status=400):
+    return api_response(request, {"error": message}, status=status)
+
+
+# ---------------------------------------------------
+# Request helpers
+# ---------------------------------------------------
+def authorized(request):
+    token = getattr(settings, "API_TOKEN", "")
+    if not token:
+        return True
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    return hmac.compare_digest(supplied, token)
+
+
+def read_body(request):
+    # JSON bodies from apps, form posts from anything else
+    if request.content_type == "application/json":
+        data = loads(request.body or b"{}")
+        if not isinstance(data, dict):
+            raise ValueError("Body must be a JSON object")
+        return data
+    return request.POST.dict()
+
+
+def report_payload(report):
+    return {"id": report.content_hash, "kind": report.kind, "report": report.data}
+
+
+# ---------------------------------------------------
+# Endpoints
+# ---------------------------------------------------
+@csrf_exempt
+@require_POST
+async def create_report(request):
+    if not authorized(request):
+        return api_error(request, "Unauthorized", status=401)
+    try:
+        body = read_body(request)
+    except ValueError as e:
+        return api_error(request, str(e))
+
+    kind = body.get("kind") or Report.ROADMAP
+    company = str(body.get("company") or "").strip()
+    role = str(body.get("role") or "").strip()
+
+    if kind == Report.ROADMAP:
+        try:
+            student_class = int(body.get("studentClass"))
+        except (TypeError, ValueError):
+            return api_error(request, "studentClass must be a number")
+        if not company or not role:
+            return api_error(request, "company and role are required")
+        with stage("roadmap"):
+            data = build_roadmap_report(company, role, str(student_class))
+
+    elif kind == Report.COMPARISON:
+        compare_role = str(body.get("compareRole") or "").strip()
+        if not company or not role or not compare_role:
+            return api_error(request, "company, role and compareRole are required")
+        data = await acached_comparison(company, role, compare_role)
+        if data is None:
+            try:
+                await ratelimit.atake(request)
+                async with ratelimit.Slot():
+                    data = await agenerate_comparison(company, role, compare_role)
+            except ratelimit.Throttled as e:
+                return ratelimit.too_many_requests(e, api_error(request, str(e), status=429))
+            except Exception as e:
+                # Unusable or failed upstream answer: the fault is not the client's
+                return api_error(request, f"Report generation failed: {e}", status=502)
+            # Stored reports are public and permanent: no standard-track stand-ins
+            if data.get("fallback"):
+                return api_error(request, "AI guidance is unavailable, try again later", status=503)
+
+    else:
+        return api_error(request, f"kind must be {Report.ROADMAP} or {Report.COMPARISON}")
+
+    report = await reports.astore(kind, data)
+    response = api_response(request, report_payload(report), status=201)
+    response["Location"] = reverse("api_report", args=[report.content_hash])
+    return response
+
+
+@require_safe
+async def get_report(request, digest):
+    if not authorized(request):
+        return api_error(request, "Unauthorized", status=401)
+
+    report = await Report.objects.only("content_hash", "kind", "data").filter(content_hash=digest).afirst()
+    if report is None:
+        return api_error(request, "Report not found", status=404)
+
+    # Stored reports never change
+    response = api_response(request, report_payload(report), etag=digest)
+    response["Cache-Control"] = f"public, max-age={getattr(settings, 'SEO_CACHE_MAX_AGE', 86400)}"
+    return response
+
+
+@csrf_exempt
+@require_POST
+async def readiness(request, digest):
+    if not authorized(request):
+        return api_error(request, "Unauthorized", status=401)
+    try:
+        ratings = read_body(request).get("ratings") or {}
+    except ValueError as e:
+        return api_error(request, str(e))
+
+    if not isinstance(ratings, dict):
+        return api_error(request, "ratings must map skill names to 0-3")
+    for name, value in ratings.items():
+        if not scoring.valid_rating(value):
+            return api_error(request, f"Rating for {name!r} must be an integer from 0 to {scoring.MAX_RATING} or null")
+
+    report = await Report.objects.only("data").filter(content_hash=digest).afirst()
+    if report is None:
+        return api_error(request, "Report not found", status=404)
+
+    skills = report.data.get("role1Skills", [])
+    return api_response(request, {
+        "id": digest,
+        "readinessScore": reports.readiness_score(skills, ratings),
+        "rated": sum(1 for skill in skills if ratings.get(skill["name"]) is not None),
+    })
+
+
+@csrf_exempt
+@require_POST
+async def readiness_batch(request, digest):
+    # Body: {"students": [ids...], "ratings": [[0-3 or null per skill], ...]}
+    # with columns in the order of the report's role1Skills (listed in the
+    # first line of the answer). Answers NDJSON: a class summary, then one
+    # line per student in input order.
+    if not authorized(request):
+        return api_error(request, "Unauthorized", status=401)
+    try:
+        body = read_body(request)
+    except ValueError as e:
+        return api_error(request, str(e))
+
+    matrix = body.get("ratings")
+    if not isinstance(matrix, list):
+        return api_error(request, "ratings must be a list of rows")
+    limit = getattr(settings, "READINESS_BATCH_MAX", 50000)
+    if len(matrix) > limit:
+        return api_error(request, f"At most {limit} students per request", status=413)
+
+    ids = body.get("students")
+    if ids is None:
+        ids = list(range(len(matrix)))
+    if not isinstance(ids, list) or len(ids) != len(matrix):
+        return api_error(request, "students must list one id per row of ratings")
+
+    report = await Report.objects.only("data").filter(content_hash=digest).afirst()
+    if report is None:
+        return api_error(request, "Report not found", status=404)
+
+    skills = report.data.get("role1Skills", [])
+    try:
+        with stage("score"):
+            # Large classes take a while without NumPy; keep the loop free
+            result = await sync_to_async(scoring.score_class, thread_sensitive=False)(skills, matrix)
+    except ValueError as e:
+        return api_error(request, str(e))
+
+    async def lines():
+        summary = {k: v for k, v in result.items() if k not in ("scores", "percentiles")}
+        yield dumps({"type": "summary", "id": digest, **summary}) + b"\n"
+
+        rows = zip(ids, result["scores"], result["percentiles"])
+        while True:
+            chunk = [
+                dumps({"type": "student", "id": sid, "score": score, "percentile": pct})
+                for sid, score, pct in islice(rows, 1000)
+            ]
+            if not chunk:
+                break
+            yield b"\n".join(chunk) + b"\n"
+
+    return StreamingHttpResponse(lines(), content_type="application/x-ndjson")
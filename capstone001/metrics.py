@@ -0,0 +1,85 @@
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse
+
+from aiapp import llm_cache, ratelimit, resilience, singleflight, timing
+
+# Prometheus text exposition (format 0.0.4) for this worker process.
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+HISTOGRAMS = {
+    "stage": ("aiapp_stage_duration_seconds", "stage", "Time spent in one stage of a request."),
+    "request": ("aiapp_request_duration_seconds", "view", "Time from first to last middleware."),
+}
+
+
+# ---------------------------------------------------
+# Formatting
+# ---------------------------------------------------
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(metric, name, label, help_text, rows):
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    quantiles = [
+        f"# HELP {name}_quantile Estimated from the histogram buckets.",
+        f"# TYPE {name}_quantile gauge",
+    ]
+
+    for (kind, value), (counts, total, count, estimates) in rows:
+        if kind != metric:
+            continue
+        tag = f'{label}="{_label(value)}"'
+        cumulative = 0
+        for bound, n in zip(timing.BUCKETS, counts):
+            cumulative += n
+            lines.append(f'{name}_bucket{{{tag},le="{bound:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{tag},le="+Inf"}} {count}')
+        lines.append(f"{name}_sum{{{tag}}} {total:.6f}")
+        lines.append(f"{name}_count{{{tag}}} {count}")
+        for q, estimate in zip(("0.5", "0.95", "0.99"), estimates):
+            quantiles.append(f'{name}_quantile{{{tag},quantile="{q}"}} {estimate:.6f}')
+
+    return lines + quantiles
+
+
+def _counter_lines(name, help_text, values):
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    for event, value in values.items():
+        lines.append(f'{name}{{event="{_label(event)}"}} {value}')
+    return lines
+
+
+def render_metrics():
+    rows = sorted(timing.snapshot().items())
+    lines = []
+    for metric, (name, label, help_text) in HISTOGRAMS.items():
+        lines += _histogram_lines(metric, name, label, help_text, rows)
+    lines += _counter_lines("aiapp_llm_cache_total", "LLM result cache events.", llm_cache.stats)
+    lines += _counter_lines("aiapp_singleflight_total", "Coalesced upstream calls.", singleflight.stats)
+    lines += _counter_lines("aiapp_llm_calls_total", "LLM call attempts, hedges and breaker rejections.", resilience.stats)
+    lines += _counter_lines("aiapp_ratelimit_total", "Generations admitted and shed with a 429.", ratelimit.stats)
+    lines += [
+        "# HELP aiapp_llm_breaker_open 1 while the LLM circuit breaker is not closed.",
+        "# TYPE aiapp_llm_breaker_open gauge",
+        f"aiapp_llm_breaker_open {int(resilience.breaker.state != resilience.CircuitBreaker.CLOSED)}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------
+# Endpoint
+# ---------------------------------------------------
+def metrics(request):
+    # Scrapers send METRICS_TOKEN; staff can also look from a browser.
+    # Without a token configured, only staff get in.
+    token = getattr(settings, "METRICS_TOKEN", "")
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    scraper = bool(token) and hmac.compare_digest(supplied, token)
+    if not scraper and not request.user.is_staff:
+        return HttpResponse("Unauthorized", status=401)
+
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)
@@ -0,0 +1,131 @@
+import gzip
+import hashlib
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+
+try:
+    import brotli
+except ImportError:  # optional: pip install Brotli
+    brotli = None
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+# ---------------------------------------------------
+# In-memory file cache
+# ---------------------------------------------------
+# Crawler files are read and compressed once per process. With DEBUG on,
+# every hit also stats the file so edits show up without a restart.
+_files = {}
+_lock = threading.Lock()
+
+
+def _variants(body):
+    variants = {"identity": body}
+
+    compressed = gzip.compress(body, compresslevel=9, mtime=0)
+    if len(compressed) < len(body):
+        variants["gzip"] = compressed
+
+    if brotli is not None:
+        compressed = brotli.compress(body, quality=11)
+        if len(compressed) < len(body):
+            variants["br"] = compressed
+
+    return variants
+
+
+def _load(path, mtime):
+    body = path.read_bytes()
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    return {
+        "mtime": mtime,
+        "etag": digest,
+        "last_modified": http_date(mtime),
+        "variants": _variants(body),
+    }
+
+
+def get_file(name):
+    path = BASE_DIR / name
+    entry = _files.get(name)
+
+    if entry is None or settings.DEBUG:
+        mtime = int(path.stat().st_mtime)
+        if entry is None or entry["mtime"] != mtime:
+            with _lock:
+                entry = _load(path, mtime)
+                _files[name] = entry
+    return entry
+
+
+# ---------------------------------------------------
+# Content negotiation
+# ---------------------------------------------------
+def _accepted(header):
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q=") and params[2:] in ("0", "0.0", "0.00", "0.000"):
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def choose_encoding(request, variants):
+    accepted = _accepted(request.headers.get("Accept-Encoding", ""))
+    for coding in ("br", "gzip"):
+        if coding in variants and (coding in accepted or "*" in accepted):
+            return coding
+    return "identity"
+
+
+# ---------------------------------------------------
+# Response
+# ---------------------------------------------------
+def serve(request, name, content_type):
+    entry = get_file(name)
+    coding = choose_encoding(request, entry["variants"])
+
+    # Each encoding is its own representation, so it gets its own ETag
+    etag = f'"{entry["etag"]}"' if coding == "identity" else f'"{entry["etag"]}-{coding}"'
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        not_modified = etag in parse_etags(if_none_match) or if_none_match.strip() == "*"
+    else:
+        since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+        not_modified = since is not None and since >= entry["mtime"]
+
+    if not_modified:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(entry["variants"][coding], content_type=content_type)
+        if coding != "identity":
+            response["Content-Encoding"] = coding
+
+    response["ETag"] = etag
+    response["Last-Modified"] = entry["last_modified"]
+    response["Cache-Control"] = f"public, max-age={getattr(settings, 'SEO_CACHE_MAX_AGE', 86400)}"
+    response["Vary"] = "Accept-Encoding"
+    return response
+
+
+# ---------------------------------------------------
+# Handlers
+# ---------------------------------------------------
+def robots_txt(request):
+    return serve(request, "robots.txt", "text/plain")
+
+
+def sitemap_xml(request):
+    return serve(request, "sitemap.xml", "application/xml")
+
+
+def google_verify(request):
+    return serve(request, "googleb5949ab1058f2676.html", "text/html")
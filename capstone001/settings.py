@@ -40,8 +40,12 @@ INSTALLED_APPS = [
 # Middleware
 # --------------------------------------------------
 MIDDLEWARE = [
+    # Server-Timing header and /metrics histograms; keep first
+    "aiapp.timing.TimingMiddleware",
+
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    # SessionMiddleware that also times the session write
+    "aiapp.timing.TimedSessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
 
@@ -53,10 +57,11 @@ MIDDLEWARE = [
 
 
 # --------------------------------------------------
-# URLs / WSGI
+# URLs / WSGI / ASGI
 # --------------------------------------------------
 ROOT_URLCONF = "capstone001.urls"
 WSGI_APPLICATION = "capstone001.wsgi.application"
+ASGI_APPLICATION = "capstone001.asgi.application"
 
 
 # --------------------------------------------------
@@ -66,6 +71,8 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "aiapp" / "templates"],
+        # No "loaders": Django then wraps these in its cached loader, so each
+        # process parses a template once
         "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
@@ -76,23 +83,152 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
 
                 "django.contrib.messages.context_processors.messages",
+
+                # report_key / fragment_ttl for {% cache %} in index.html
+                "aiapp.context_processors.report_cache",
             ],
         },
     }
 ]
 
+# Rendered report sections, keyed by report content hash
+FRAGMENT_CACHE_TTL = int(os.getenv("FRAGMENT_CACHE_TTL", 24 * 3600))
+
 
 # --------------------------------------------------
 # Database
 # --------------------------------------------------
+# WAL lets readers run while one process writes. IMMEDIATE transactions
+# take the write lock when they begin, so a busy database waits out the
+# timeout instead of failing on a read-to-write lock upgrade.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA cache_size=-20000;"
+    "PRAGMA mmap_size=134217728;"
+    "PRAGMA temp_store=MEMORY;"
+)
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # 0 under ASGI: sync_to_async may run each query on a different
+        # thread, and only the request's own thread closes its connection at
+        # the end, so persistent connections pile up (Django ticket #33497).
+        # The job workers own their threads and use DB_WORKER_CONN_MAX_AGE.
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", 0)),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "init_command": SQLITE_PRAGMAS,
+            "transaction_mode": "IMMEDIATE",
+            "timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT", 20)),
+        },
     }
 }
 
 
+# --------------------------------------------------
+# Cache (Redis when REDIS_URL is set, else per-process memory)
+# --------------------------------------------------
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
+# --------------------------------------------------
+# LLM result cache (memory LRU -> database)
+# --------------------------------------------------
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", 7 * 24 * 3600))
+LLM_CACHE_MEMORY_TTL = int(os.getenv("LLM_CACHE_MEMORY_TTL", 300))
+LLM_CACHE_MEMORY_ENTRIES = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", 512))
+LLM_CACHE_DB_ENTRIES = int(os.getenv("LLM_CACHE_DB_ENTRIES", 10000))
+# Seconds between sweeps of expired / surplus rows (per process)
+LLM_CACHE_PRUNE_INTERVAL = int(os.getenv("LLM_CACHE_PRUNE_INTERVAL", 300))
+
+# Identical in-flight generations wait on one upstream call
+SINGLEFLIGHT_LOCK_TTL = int(os.getenv("SINGLEFLIGHT_LOCK_TTL", 30))
+SINGLEFLIGHT_POLL_INTERVAL = float(os.getenv("SINGLEFLIGHT_POLL_INTERVAL", 0.1))
+
+
+# --------------------------------------------------
+# LLM call resilience (aiapp/resilience.py)
+# --------------------------------------------------
+# Whole call, retries and hedges included, never takes longer than this
+LLM_DEADLINE = float(os.getenv("LLM_DEADLINE", 8))
+LLM_TIMEOUT_MIN = float(os.getenv("LLM_TIMEOUT_MIN", 3))
+LLM_RETRIES = int(os.getenv("LLM_RETRIES", 2))
+LLM_RETRY_BACKOFF = float(os.getenv("LLM_RETRY_BACKOFF", 0.25))
+LLM_HEDGE = os.getenv("LLM_HEDGE", "1") == "1"
+LLM_HEDGE_MIN = float(os.getenv("LLM_HEDGE_MIN", 0.5))
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", 5))
+LLM_BREAKER_COOLDOWN = int(os.getenv("LLM_BREAKER_COOLDOWN", 30))
+
+# Admission control for new generations (aiapp/ratelimit.py). Token
+# buckets per session and per IP (sustained rate per minute, burst); a
+# rate of 0 turns a bucket off. Schools share one address, hence the
+# larger IP allowance. Limits are shared between processes only through
+# the cache, so production needs REDIS_URL.
+RATE_LIMIT_SESSION_PER_MINUTE = float(os.getenv("RATE_LIMIT_SESSION_PER_MINUTE", 6))
+RATE_LIMIT_SESSION_BURST = int(os.getenv("RATE_LIMIT_SESSION_BURST", 3))
+RATE_LIMIT_IP_PER_MINUTE = float(os.getenv("RATE_LIMIT_IP_PER_MINUTE", 30))
+RATE_LIMIT_IP_BURST = int(os.getenv("RATE_LIMIT_IP_BURST", 15))
+# Proxies in front of the app that append to X-Forwarded-For. 0 ignores the
+# header, which a client can set to anything; gunicorn.conf.py sets 1 for
+# Render's proxy.
+RATE_LIMIT_PROXY_COUNT = int(os.getenv("RATE_LIMIT_PROXY_COUNT", 0))
+# Report generations in flight across all web and job workers; a slot is
+# freed after LLM_SLOT_TTL seconds even if its worker died
+LLM_MAX_INFLIGHT = int(os.getenv("LLM_MAX_INFLIGHT", 16))
+LLM_SLOT_TTL = int(os.getenv("LLM_SLOT_TTL", 60))
+
+# Seconds between checks of the Skill table for taxonomy changes
+SKILL_INDEX_TTL = int(os.getenv("SKILL_INDEX_TTL", 60))
+
+
+# --------------------------------------------------
+# Background report generation (manage.py runworkers)
+# --------------------------------------------------
+LLM_JOB_QUEUE = os.getenv("LLM_JOB_QUEUE", "0") == "1"
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", 2))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", 3))
+JOB_RETRY_DELAY = int(os.getenv("JOB_RETRY_DELAY", 5))
+JOB_VISIBILITY_TIMEOUT = int(os.getenv("JOB_VISIBILITY_TIMEOUT", 60))
+DB_WORKER_CONN_MAX_AGE = int(os.getenv("DB_WORKER_CONN_MAX_AGE", 600))
+
+
+# --------------------------------------------------
+# PDF rendering and cache (content-addressed, LRU by mtime)
+# --------------------------------------------------
+PDF_CACHE_DIR = Path(os.getenv("PDF_CACHE_DIR", BASE_DIR / "pdf_cache"))
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", 200 * 1024 * 1024))
+PDF_CACHE_EVICT_INTERVAL = int(os.getenv("PDF_CACHE_EVICT_INTERVAL", 300))
+
+# ReportLab runs in a spawned process pool (0 = render in the web worker)
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", 2))
+PDF_RENDER_QUEUE = int(os.getenv("PDF_RENDER_QUEUE", 8))
+PDF_RENDER_TIMEOUT = int(os.getenv("PDF_RENDER_TIMEOUT", 30))
+
+
+# --------------------------------------------------
+# Cohort (CSV roster) import
+# --------------------------------------------------
+COHORT_WORKERS = int(os.getenv("COHORT_WORKERS", 2))
+COHORT_MAX_ROWS = int(os.getenv("COHORT_MAX_ROWS", 10000))
+
+
 # --------------------------------------------------
 # Internationalization
 # --------------------------------------------------
@@ -108,6 +244,29 @@ USE_TZ = True
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# robots.txt, sitemap.xml and the Google verification file (capstone001/seo.py)
+SEO_CACHE_MAX_AGE = int(os.getenv("SEO_CACHE_MAX_AGE", 86400))
+
+# Prometheus scrape endpoint: "Authorization: Bearer <token>" or a staff login
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Sitemap index over stored reports (capstone001/sitemaps.py)
+SITE_URL = os.getenv("SITE_URL", "https://capstone001.onrender.com")
+SITEMAP_CHUNK_SIZE = 50000
+SITEMAP_CACHE_TTL = int(os.getenv("SITEMAP_CACHE_TTL", 3600))
+
+# Company / role suggestions (aiapp/typeahead.py)
+TYPEAHEAD_LIMIT = 8
+TYPEAHEAD_TTL = int(os.getenv("TYPEAHEAD_TTL", 300))
+# Names not in the seed list need this many reports before anyone sees them
+TYPEAHEAD_MIN_REPORTS = int(os.getenv("TYPEAHEAD_MIN_REPORTS", 3))
+TYPEAHEAD_MAX_AGE = int(os.getenv("TYPEAHEAD_MAX_AGE", 300))
+
+# JSON API (/api/v1/); set a token to require "Authorization: Bearer ..."
+API_TOKEN = os.getenv("API_TOKEN", "")
+API_GZIP_MIN_BYTES = 512
+READINESS_BATCH_MAX = int(os.getenv("READINESS_BATCH_MAX", 50000))
+
 
 # --------------------------------------------------
 # Default primary key
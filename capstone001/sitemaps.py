@@ -0,0 +1,119 @@
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Max
+from django.http import Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.http import http_date, parse_http_date_safe
+
+from aiapp.models import Report
+
+# Reports are split into child sitemaps by fixed id ranges (ids 1-50000 are
+# chunk 0, and so on), so a chunk's URL and contents never shift as new
+# reports arrive. Only the per-chunk lastmod list is cached; chunk bodies
+# are streamed from the database, so memory stays flat at any table size.
+
+CHUNKS_KEY = "sitemap:chunks"
+BATCH = 2000
+
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+# ---------------------------------------------------
+# Helpers
+# ---------------------------------------------------
+def _site():
+    return escape(settings.SITE_URL.rstrip("/"))
+
+
+def _w3c(timestamp):
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+
+async def chunks():
+    # [(chunk number, newest report timestamp)], one GROUP BY per TTL
+    cached = await cache.aget(CHUNKS_KEY)
+    if cached is None:
+        size = settings.SITEMAP_CHUNK_SIZE
+        rows = (
+            Report.objects.annotate(chunk=(F("id") - 1) / size)
+            .values("chunk")
+            .annotate(lastmod=Max("created"))
+            .order_by("chunk")
+        )
+        cached = [(row["chunk"], int(row["lastmod"].timestamp())) async for row in rows]
+        await cache.aset(CHUNKS_KEY, cached, settings.SITEMAP_CACHE_TTL)
+    return cached
+
+
+# ---------------------------------------------------
+# Sitemap index
+# ---------------------------------------------------
+async def sitemap_index(request):
+    site = _site()
+    entries = [f"<sitemap><loc>{site}{reverse('sitemap_pages')}</loc></sitemap>"]
+
+    for number, lastmod in await chunks():
+        loc = reverse("sitemap_reports", args=[number])
+        entries.append(f"<sitemap><loc>{site}{loc}</loc><lastmod>{_w3c(lastmod)}</lastmod></sitemap>")
+
+    body = (
+        XML_HEADER
+        + f'<sitemapindex xmlns="{SITEMAP_NS}">\n'
+        + "\n".join(entries)
+        + "\n</sitemapindex>\n"
+    )
+    response = HttpResponse(body, content_type="application/xml")
+    response["Cache-Control"] = f"public, max-age={settings.SITEMAP_CACHE_TTL}"
+    return response
+
+
+# ---------------------------------------------------
+# Report sitemaps (streamed)
+# ---------------------------------------------------
+async def sitemap_reports(request, number):
+    lastmod = dict(await chunks()).get(number)
+    if lastmod is None:
+        raise Http404("No such sitemap")
+
+    since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+    if since is not None and since >= lastmod:
+        response = HttpResponseNotModified()
+    else:
+        response = StreamingHttpResponse(_urls(number), content_type="application/xml")
+
+    response["Last-Modified"] = http_date(lastmod)
+    response["Cache-Control"] = f"public, max-age={settings.SITEMAP_CACHE_TTL}"
+    return response
+
+
+async def _urls(number):
+    size = settings.SITEMAP_CHUNK_SIZE
+    last, stop = number * size, (number + 1) * size
+
+    # Build the per-report URL from one reverse() instead of one per row
+    placeholder = "0" * 64
+    prefix, suffix = reverse("report_page", args=[placeholder]).split(placeholder)
+    prefix = _site() + prefix
+
+    yield XML_HEADER + f'<urlset xmlns="{SITEMAP_NS}">\n'
+
+    # Keyset pages: each query is short, so no read cursor stays open
+    # across the whole response
+    while True:
+        rows = (
+            Report.objects.filter(id__gt=last, id__lte=stop)
+            .order_by("id")
+            .values_list("id", "content_hash", "created")[:BATCH]
+        )
+        batch = []
+        async for last, digest, created in rows:
+            batch.append(f"<url><loc>{prefix}{digest}{suffix}</loc><lastmod>{created:%Y-%m-%d}</lastmod></url>\n")
+        if not batch:
+            break
+        yield "".join(batch)
+
+    yield "</urlset>\n"
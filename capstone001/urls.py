@@ -1,34 +1,12 @@
 from django.contrib import admin
 from django.urls import path
-from django.http import HttpResponse
-from pathlib import Path
 
-from aiapp.views import home, download_pdf
-
-BASE_DIR = Path(__file__).resolve().parent.parent
-
-
-# ------------------ STATIC FILE HANDLERS ------------------
-
-def robots_txt(request):
-    return HttpResponse(
-        (BASE_DIR / "robots.txt").read_text(),
-        content_type="text/plain"
-    )
-
-
-def sitemap_xml(request):
-    return HttpResponse(
-        (BASE_DIR / "sitemap.xml").read_text(),
-        content_type="application/xml"
-    )
-
-
-def google_verify(request):
-    return HttpResponse(
-        (BASE_DIR / "googleb5949ab1058f2676.html").read_text(),
-        content_type="text/html"
-    )
+from aiapp.views import home, download_pdf, cohort_upload, report_page, suggest
+from capstone001.api import create_report, get_report, readiness, readiness_batch
+from capstone001.metrics import metrics
+from capstone001.seo import robots_txt, sitemap_xml, google_verify
+from capstone001.sitemaps import sitemap_index, sitemap_reports
+from capstone001.views import home_async as compare_home, job_status, stream_report
 
 
 # ------------------ URL PATTERNS ------------------
@@ -40,10 +18,29 @@ urlpatterns = [
 
     # SEO / Verification
     path("robots.txt", robots_txt),
-    path("sitemap.xml", sitemap_xml),
+    path("sitemap.xml", sitemap_index, name="sitemap"),
+    path("sitemap-pages.xml", sitemap_xml, name="sitemap_pages"),
+    path("sitemaps/reports-<int:number>.xml", sitemap_reports, name="sitemap_reports"),
     path("googleb5949ab1058f2676.html", google_verify),
 
+    # Monitoring
+    path("metrics", metrics, name="metrics"),
+
     # Main App
     path("", home, name="home"),
     path("download/", download_pdf, name="download_pdf"),
+    path("cohort/", cohort_upload, name="cohort_upload"),
+    path("reports/<str:digest>/", report_page, name="report_page"),
+    path("suggest/", suggest, name="suggest"),
+
+    # AI Role Comparison (async, served under ASGI)
+    path("compare/", compare_home, name="compare"),
+    path("compare/stream/", stream_report, name="compare_stream"),
+    path("jobs/<uuid:job_id>/", job_status, name="job_status"),
+
+    # JSON API for integrations
+    path("api/v1/reports/", create_report, name="api_create_report"),
+    path("api/v1/reports/<str:digest>/", get_report, name="api_report"),
+    path("api/v1/reports/<str:digest>/readiness/", readiness, name="api_readiness"),
+    path("api/v1/reports/<str:digest>/readiness/batch/", readiness_batch, name="api_readiness_batch"),
 ]
\ No newline at end of file
@@ -1,230 +1,159 @@
 import json
-import os
-import requests
 
-from django.contrib.auth import logout
-from django.http import HttpResponse
-from django.shortcuts import render
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import redirect
 
-# ---------------------------------------------------
-# GROQ API KEY (ENV VARIABLE)
-# ---------------------------------------------------
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+from aiapp import ratelimit, reports
+from aiapp.comparison import acached_comparison, agenerate_comparison, astream_comparison
+from aiapp.jobs import aenqueue
+from aiapp.models import GenerationJob, Report
+from aiapp.timing import render
 
 
 # ---------------------------------------------------
 # Helpers
 # ---------------------------------------------------
-def normalize_list(items):
-    normalized = []
-    for it in items:
-        if isinstance(it, dict):
-            normalized.append({
-                "name": it.get("name", ""),
-                "description": it.get("description", ""),
-                "level": it.get("level", "")
-            })
-        else:
-            normalized.append({
-                "name": str(it),
-                "description": "",
-                "level": ""
-            })
-    return normalized
-
-
-def extract_json(text):
-    start = text.find("{")
-    end = text.rfind("}")
-    if start == -1 or end == -1 or end < start:
-        return None
-    return text[start:end + 1]
+def read_form(request):
+    return (
+        (request.POST.get("company") or "").strip(),
+        (request.POST.get("jobRole") or "").strip(),
+        (request.POST.get("jobRoleCompare") or "").strip(),
+    )
 
 
 # ---------------------------------------------------
-# Main Page + AI Processing
+# Main Page + AI Processing (async / ASGI)
 # ---------------------------------------------------
-def home(request):
+@ratelimit.throttled
+async def home_async(request):
     output = None
     error = None
 
-    # Reuse last generated report (session cache)
-    if request.method == "GET" and request.session.get("output"):
-        return render(request, "index.html", {
-            "output": request.session.get("output"),
-            "error": None
-        })
+    # RESET
+    if request.method == "POST" and request.POST.get("action") == "reset":
+        await reports.aforget(request)
+        return redirect("compare")
+
+    # Reuse last comparison (session holds its id); roadmaps belong to "/"
+    if request.method == "GET":
+        report = await reports.aload(request)
+        if report is not None and report.kind == Report.COMPARISON:
+            return render(request, "compare.html", {
+                "output": await reports.aload_output(request),
+                "error": None
+            })
 
     if request.method == "POST":
-        company = request.POST.get("company")
-        role1 = request.POST.get("jobRole")
-        role2 = request.POST.get("jobRoleCompare")  # optional comparison role
-
-        # ---------------------------------------------------
-        # AI PROMPT
-        # ---------------------------------------------------
-        prompt = f"""
-Return ONLY valid JSON. No markdown. No extra text.
-
-Context:
-This system bridges secondary school education and industry expectations.
-Focus on practical, curriculum-aware skills (Indian education context).
-
-JSON FORMAT:
-{{
-  "role1Skills": [
-    {{"name": "skill", "description": "short explanation", "level": "Beginner|Intermediate|Advanced"}}
-  ],
-  "role2Skills": [
-    {{"name": "skill", "description": "short explanation", "level": "Beginner|Intermediate|Advanced"}}
-  ],
-  "commonSkills": [
-    {{"name": "skill", "description": "why common to both"}}
-  ],
-  "role1Only": [
-    {{"name": "skill", "description": "specific to role 1"}}
-  ],
-  "role2Only": [
-    {{"name": "skill", "description": "additional skill needed for role 2"}}
-  ],
-  "schoolGaps": [
-    {{"name": "gap", "description": "why school education misses this"}}
-  ],
-  "bridgeModules": [
-    {{"name": "module", "description": "how this bridges school to industry"}}
-  ],
-  "estimatedTime": "example: 5–6 months",
-  "transitionAdvice": "short guidance paragraph"
-}}
-
-Company: {company}
-Primary Role: {role1}
-Comparison Role: {role2}
-"""
+        company, role1, role2 = read_form(request)
 
-        try:
-            response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {GROQ_API_KEY}",
-                },
-                json={
-                    "model": "llama-3.1-8b-instant",
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0,
-                },
-                timeout=15
-            )
-
-            data = response.json()
-            ai_raw = data["choices"][0]["message"]["content"]
-            ai_raw = ai_raw.replace("```json", "").replace("```", "").strip()
-
-            json_text = extract_json(ai_raw)
-            if not json_text:
-                raise ValueError("Invalid AI response format")
-
-            parsed = json.loads(json_text)
-
-            output = {
-                "company": company,
-                "role1": role1,
-                "role2": role2,
-
-                "role1Skills": normalize_list(parsed.get("role1Skills", [])),
-                "role2Skills": normalize_list(parsed.get("role2Skills", [])),
-                "commonSkills": normalize_list(parsed.get("commonSkills", [])),
-                "role1Only": normalize_list(parsed.get("role1Only", [])),
-                "role2Only": normalize_list(parsed.get("role2Only", [])),
-
-                "schoolGaps": normalize_list(parsed.get("schoolGaps", [])),
-                "bridgeModules": normalize_list(parsed.get("bridgeModules", [])),
-
-                "estimatedTime": parsed.get("estimatedTime", "Not specified"),
-                "transitionAdvice": parsed.get("transitionAdvice", ""),
-            }
-
-            # Save to session for PDF & refresh
-            request.session["output"] = output
+        # Checked before any cache lookup or upstream call
+        if not company or not role1 or not role2:
+            return render(request, "compare.html", {
+                "error": "Enter a company and both roles to compare.",
+                "form": request.POST,
+            }, status=400)
 
+        try:
+            output = await acached_comparison(company, role1, role2)
+            if output is None:
+                await ratelimit.atake(request)
+                if settings.LLM_JOB_QUEUE:
+                    # The job belongs to this session; only it may poll
+                    if request.session.session_key is None:
+                        await request.session.acreate()
+                    job = await aenqueue(company, role1, role2, request.session.session_key)
+                    return render(request, "compare.html", {"job": job, "form": request.POST})
+                async with ratelimit.Slot():
+                    # Awaiting here frees the worker's event loop for other requests
+                    output = await agenerate_comparison(company, role1, role2)
+
+            # A fallback comparison is shown once but never stored: stored
+            # reports are shared, downloadable and listed in the sitemap
+            if not output.get("fallback"):
+                await reports.aremember(request, await reports.astore(Report.COMPARISON, output))
+
+        except ratelimit.Throttled:
+            raise
         except Exception as e:
             error = str(e)
 
-    return render(request, "index.html", {
+    return render(request, "compare.html", {
         "output": output,
-        "error": error
+        "error": error,
+        "form": request.POST,
     })
 
 
 # ---------------------------------------------------
-# Structured PDF Generator (Comparison Report)
+# Background Job Status (polled by the page)
 # ---------------------------------------------------
-def download_pdf(request):
-    output = request.session.get("output")
-
-    if not output:
-        return HttpResponse("No data available", status=400)
-
-    response = HttpResponse(content_type="application/pdf")
-    response["Content-Disposition"] = "attachment; filename=skill_comparison_report.pdf"
-
-    pdf = canvas.Canvas(response, pagesize=letter)
-    width, height = letter
-    y = height - 50
-
-    def title(text):
-        nonlocal y
-        pdf.setFont("Helvetica-Bold", 14)
-        pdf.drawString(50, y, text)
-        y -= 25
-        pdf.setFont("Helvetica", 11)
-
-    def line(text):
-        nonlocal y
-        if y < 60:
-            pdf.showPage()
-            pdf.setFont("Helvetica", 11)
-            y = height - 50
-        pdf.drawString(60, y, text)
-        y -= 16
-
-    pdf.setFont("Helvetica-Bold", 16)
-    pdf.drawString(50, y, "AI Skill Mapper – Role Comparison Report")
-    y -= 30
-
-    title(f"Company: {output['company']}")
-    title(f"Primary Role: {output['role1']}")
-    title(f"Comparison Role: {output['role2']}")
-    title(f"Estimated Preparation Time: {output['estimatedTime']}")
-
-    title("Common Skills (Both Roles)")
-    for s in output["commonSkills"]:
-        line(f"- {s['name']}: {s['description']}")
-
-    title(f"{output['role1']} – Core Skills")
-    for s in output["role1Only"]:
-        line(f"- {s['name']} ({s['level']}): {s['description']}")
-
-    title(f"{output['role2']} – Additional Skills Needed")
-    for s in output["role2Only"]:
-        line(f"- {s['name']} ({s['level']}): {s['description']}")
-
-    title("School Gaps")
-    for g in output["schoolGaps"]:
-        line(f"- {g['name']}: {g['description']}")
-
-    title("Bridge Training Modules")
-    for m in output["bridgeModules"]:
-        line(f"- {m['name']}: {m['description']}")
-
-    title("Transition Advice")
-    for part in output["transitionAdvice"].split(". "):
-        line(part.strip())
-
-    pdf.save()
-    return response
+def job_status(request, job_id):
+    job = (
+        GenerationJob.objects.filter(pk=job_id, session_key=request.session.session_key or "-")
+        .only("status", "result", "error")
+        .first()
+    )
+
+    # Someone else's job looks the same as a missing one
+    if job is None:
+        return JsonResponse({"status": "missing"}, status=404)
+
+    if job.status == GenerationJob.DONE:
+        reports.remember(request, reports.store(Report.COMPARISON, job.result))
+
+    return JsonResponse({
+        "status": job.status,
+        "error": job.error if job.status == GenerationJob.DEAD else "",
+    })
 
 
+# ---------------------------------------------------
+# Streaming Report (server-sent events)
+# ---------------------------------------------------
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@ratelimit.throttled
+async def stream_report(request):
+    company = (request.GET.get("company") or "").strip()
+    role1 = (request.GET.get("jobRole") or "").strip()
+    role2 = (request.GET.get("jobRoleCompare") or "").strip()
+    if not company or not role1 or not role2:
+        return HttpResponse("company, jobRole and jobRoleCompare are required", status=400)
+
+    # The report is remembered after the headers are gone, so the session
+    # (and its cookie, set by SessionMiddleware) must exist before then
+    if request.session.session_key is None:
+        await request.session.acreate()
+
+    # Rate limited before the stream starts, so a client over its limit gets
+    # a 429. The slot is taken inside the stream: a body that is never
+    # iterated must not hold one.
+    generate = await acached_comparison(company, role1, role2) is None
+    if generate:
+        await ratelimit.atake(request)
+
+    async def events():
+        slot = ratelimit.Slot()
+        try:
+            if generate:
+                await slot.aacquire()
+            async for event, data in astream_comparison(company, role1, role2):
+                if event == "done" and not data.get("fallback"):
+                    # Headers are already sent, so save the session explicitly;
+                    # the cookie went out with them
+                    report = await reports.astore(Report.COMPARISON, data)
+                    await reports.aremember(request, report)
+                    await request.session.asave()
+                yield sse_event(event, data)
+        except Exception as e:
+            yield sse_event("error", {"message": str(e)})
+        finally:
+            await slot.arelease()
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,38 @@
+import os
+
+# Read by gunicorn from the working directory (see Procfile). The app is
+# imported once in the master and workers are forked from it, so a restart
+# pays for Django's start-up once instead of once per worker, and workers
+# share those pages copy-on-write. ReportLab and the HTTP clients are left
+# to the first request that needs them (aiapp.pdf_cache, aiapp.llm).
+#
+# Forked workers share nothing that must be per-process: no database
+# connection, PDF pool or HTTP client exists until a worker makes one.
+# With preload, code changes need a full restart (HUP reloads config only).
+
+# Render puts exactly one proxy in front of the app, which appends the
+# client's address to X-Forwarded-For (aiapp.ratelimit.client_ip). Read
+# before the app is loaded, so settings see it.
+os.environ.setdefault("RATE_LIMIT_PROXY_COUNT", "1")
+
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", 2))
+preload_app = True
+
+# Uvicorn workers are async: this only restarts a worker whose event loop
+# stops answering gunicorn's heartbeat
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+graceful_timeout = 20
+keepalive = 5
+
+
+def when_ready(server):
+    # Resolve the URLconf in the master too: Django imports it (and with it
+    # every view module) on the first request otherwise, in every worker
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
+    server.log.info("URLconf loaded before forking workers")
+
+    if workers > 1 and not os.getenv("REDIS_URL"):
+        server.log.warning("REDIS_URL is not set: rate limits and generation slots are per worker")